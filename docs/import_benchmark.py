@@ -0,0 +1,100 @@
+"""Import-time benchmark for langchain_nuggets entry points.
+
+Runs each import statement in a fresh interpreter under
+``python -X importtime`` and reports the cumulative import cost, net of
+interpreter startup. Optionally fails if any entry point exceeds a budget,
+so it can run in CI.
+
+Usage:
+    cd packages/python
+    python ../../docs/import_benchmark.py
+    python ../../docs/import_benchmark.py --runs 10 --budget-ms 250
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINTS = {
+    "package": "import langchain_nuggets",
+    "client": "from langchain_nuggets import NuggetsApiClient",
+    "toolkit": "from langchain_nuggets import NuggetsToolkit",
+    "tools.kyc": "from langchain_nuggets.tools.kyc import CheckKycStatus",
+    "middleware": "from langchain_nuggets import NuggetsAuthorityMiddleware",
+    "langgraph": "from langchain_nuggets.langgraph import NuggetsAuth",
+}
+
+
+def import_time_us(statement: str) -> int:
+    """Sum the cumulative time of top-level imports triggered by ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{result.stderr}")
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name[1:].startswith(" "):  # top-level import (no indentation)
+            total += int(cumulative)
+    return total
+
+
+def benchmark(statement: str, runs: int, baseline_us: float) -> dict:
+    samples = [max(0.0, import_time_us(statement) - baseline_us) for _ in range(runs)]
+    return {
+        "median_ms": round(statistics.median(samples) / 1000, 2),
+        "min_ms": round(min(samples) / 1000, 2),
+        "max_ms": round(max(samples) / 1000, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    baseline_us = statistics.median(import_time_us("pass") for _ in range(args.runs))
+    results = {}
+    for name, statement in ENTRY_POINTS.items():
+        try:
+            results[name] = benchmark(statement, args.runs, baseline_us)
+        except RuntimeError as exc:
+            results[name] = {"error": str(exc).splitlines()[-1]}
+
+    print("=" * 60)
+    print("langchain_nuggets — Import Time (python -X importtime)")
+    print("=" * 60)
+    print(f"{'Entry point':<14}{'Median':>12}{'Min':>12}{'Max':>12}")
+    for name, stats in results.items():
+        if "error" in stats:
+            print(f"{name:<14}  unavailable: {stats['error']}")
+            continue
+        print(
+            f"{name:<14}{stats['median_ms']:>10.2f}ms{stats['min_ms']:>10.2f}ms"
+            f"{stats['max_ms']:>10.2f}ms"
+        )
+    print()
+    print(json.dumps(results, indent=2))
+
+    if args.budget_ms is not None:
+        over = [
+            name for name, stats in results.items()
+            if "median_ms" in stats and stats["median_ms"] > args.budget_ms
+        ]
+        if over:
+            print(f"Over budget ({args.budget_ms} ms): {', '.join(over)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Per-call overhead benchmark for Nuggets tool invocation.
+
+Compares ``invoke``/``ainvoke`` on the fast path (no callback handlers)
+with the full LangChain callback path (forced by passing a no-op handler)
+and with calling ``_run``/``_arun`` directly. HTTP calls are mocked, so
+the numbers are pure framework overhead.
+
+Usage:
+    cd packages/python
+    python ../../docs/tool_benchmark.py
+    python ../../docs/tool_benchmark.py --iterations 20000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.tools.kyc import CheckKycStatus
+
+RESULT = {"sessionId": "s-bench", "status": "pending"}
+ARGS = {"sessionId": "s-bench"}
+
+
+class NoopHandler(BaseCallbackHandler):
+    """A handler that does nothing, so only the callback machinery is timed."""
+
+
+def create_tool() -> CheckKycStatus:
+    client = NuggetsApiClient({
+        "api_url": "https://api.nuggets.test",
+        "partner_id": "bench-partner",
+        "partner_secret": "bench-secret",
+    })
+    client.get = lambda path: RESULT
+
+    async def aget(path: str) -> Any:
+        return RESULT
+
+    client.aget = aget
+    return CheckKycStatus(client=client)
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean_us": round(statistics.mean(ordered), 1),
+        "median_us": round(statistics.median(ordered), 1),
+        "p95_us": round(ordered[int(len(ordered) * 0.95)], 1),
+    }
+
+
+def time_sync(fn: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    for _ in range(200):
+        fn()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        fn()
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+    return summarize(latencies)
+
+
+async def time_async(fn: Callable[[], Awaitable[Any]], iterations: int) -> Dict[str, float]:
+    for _ in range(200):
+        await fn()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        await fn()
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+    return summarize(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    tool = create_tool()
+    callbacks = {"callbacks": [NoopHandler()]}
+    results = {
+        "sync": {
+            "_run": time_sync(lambda: tool._run(**ARGS), n),
+            "invoke (fast path)": time_sync(lambda: tool.invoke(ARGS), n),
+            "invoke (callbacks)": time_sync(lambda: tool.invoke(ARGS, config=callbacks), n),
+        },
+        "async": {
+            "_arun": asyncio.run(time_async(lambda: tool._arun(**ARGS), n)),
+            "ainvoke (fast path)": asyncio.run(time_async(lambda: tool.ainvoke(ARGS), n)),
+            "ainvoke (callbacks)": asyncio.run(
+                time_async(lambda: tool.ainvoke(ARGS, config=callbacks), n)
+            ),
+        },
+    }
+
+    print("=" * 60)
+    print("NuggetsBaseTool — Invocation Overhead (HTTP mocked)")
+    print("=" * 60)
+    print(f"{'Call':<24}{'Mean':>12}{'Median':>12}{'P95':>12}")
+    for group in results.values():
+        for name, stats in group.items():
+            print(
+                f"{name:<24}{stats['mean_us']:>10.1f}µs{stats['median_us']:>10.1f}µs"
+                f"{stats['p95_us']:>10.1f}µs"
+            )
+    print()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
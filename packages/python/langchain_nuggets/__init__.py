@@ -1,72 +1,171 @@
-"""Nuggets identity verification toolkit for LangChain."""
-from langchain_nuggets.client.nuggets_api_client import (
-    NuggetsApiClient,
-    NuggetsApiClientError,
-)
-from langchain_nuggets.toolkit import NuggetsToolkit
+"""Nuggets identity verification toolkit for LangChain.
 
-# Auth tools
-from langchain_nuggets.tools.auth import (
-    CheckAuthStatus,
-    InitiateOAuthFlow,
-    RequestCredentialPresentation,
-    VerifyPresentation,
-)
-from langchain_nuggets.tools.base import NuggetsBaseTool
+Public names are imported on first access (PEP 562), so importing the
+package, or only the API client, does not load the tools, the
+middleware or the optional LangGraph integration.
+"""
+from __future__ import annotations
 
-# KYA tools
-from langchain_nuggets.tools.kya import (
-    GetAgentTrustScore,
-    RegisterAgentIdentity,
-    VerifyAgentIdentity,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-# KYC tools
-from langchain_nuggets.tools.kyc import (
-    CheckKycStatus,
-    InitiateKycVerification,
-    VerifyAge,
-    VerifyCredential,
-)
-
-# LangGraph auth (optional — requires langgraph-sdk)
-try:
+if TYPE_CHECKING:
+    from langchain_nuggets.client.limiter import RequestLimiter
+    from langchain_nuggets.client.nuggets_api_client import (
+        NuggetsApiClient,
+        NuggetsApiClientError,
+    )
+    from langchain_nuggets.credentials import CredentialCache
+    from langchain_nuggets.did import AgentResolver
     from langchain_nuggets.langgraph import NuggetsAuth, NuggetsAuthError
-except ImportError:
-    pass
-
-# Authority Middleware (optional — requires langchain-core)
-try:
     from langchain_nuggets.middleware import (
         MiddlewareConfig,
         NuggetsAuthorityMiddleware,
         ProofArtifact,
+        TrustGate,
+    )
+    from langchain_nuggets.projection import OutputProjection
+    from langchain_nuggets.proofs import ProofVerifier, VerificationReport
+    from langchain_nuggets.schemas import ToolBundle
+    from langchain_nuggets.sessions import SessionStore
+    from langchain_nuggets.tenancy import MultiTenantNuggetsToolkit, TenantClientPool
+    from langchain_nuggets.toolkit import NuggetsToolkit
+    from langchain_nuggets.tools.auth import (
+        CheckAuthStatus,
+        InitiateOAuthFlow,
+        RequestCredentialPresentation,
+        VerifyPresentation,
+        WaitForPresentation,
+    )
+    from langchain_nuggets.tools.base import NuggetsBaseTool
+    from langchain_nuggets.tools.kya import (
+        BatchGetAgentTrustScores,
+        BatchVerifyAgentIdentities,
+        GetAgentTrustScore,
+        QueryAgentTrust,
+        RegisterAgentIdentity,
+        VerifyAgentIdentity,
+    )
+    from langchain_nuggets.tools.kyc import (
+        CheckKycStatus,
+        InitiateKycVerification,
+        VerifyAge,
+        VerifyCredential,
+        WaitForKycCompletion,
     )
-except ImportError:
-    pass
+    from langchain_nuggets.tracker import SessionTracker, SessionUpdate
+    from langchain_nuggets.trust import TrustGraph, TrustScoreCache
+    from langchain_nuggets.webhooks import NuggetsWebhookReceiver, WebhookVerificationError
+
+# Public name -> module that defines it.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "NuggetsToolkit": "langchain_nuggets.toolkit",
+    "ToolBundle": "langchain_nuggets.schemas",
+    "MultiTenantNuggetsToolkit": "langchain_nuggets.tenancy",
+    "TenantClientPool": "langchain_nuggets.tenancy",
+    "NuggetsApiClient": "langchain_nuggets.client.nuggets_api_client",
+    "NuggetsApiClientError": "langchain_nuggets.client.nuggets_api_client",
+    "RequestLimiter": "langchain_nuggets.client.limiter",
+    "NuggetsBaseTool": "langchain_nuggets.tools.base",
+    "OutputProjection": "langchain_nuggets.projection",
+    "InitiateKycVerification": "langchain_nuggets.tools.kyc",
+    "CheckKycStatus": "langchain_nuggets.tools.kyc",
+    "VerifyAge": "langchain_nuggets.tools.kyc",
+    "VerifyCredential": "langchain_nuggets.tools.kyc",
+    "WaitForKycCompletion": "langchain_nuggets.tools.kyc",
+    "RegisterAgentIdentity": "langchain_nuggets.tools.kya",
+    "VerifyAgentIdentity": "langchain_nuggets.tools.kya",
+    "GetAgentTrustScore": "langchain_nuggets.tools.kya",
+    "BatchVerifyAgentIdentities": "langchain_nuggets.tools.kya",
+    "BatchGetAgentTrustScores": "langchain_nuggets.tools.kya",
+    "QueryAgentTrust": "langchain_nuggets.tools.kya",
+    "RequestCredentialPresentation": "langchain_nuggets.tools.auth",
+    "VerifyPresentation": "langchain_nuggets.tools.auth",
+    "InitiateOAuthFlow": "langchain_nuggets.tools.auth",
+    "CheckAuthStatus": "langchain_nuggets.tools.auth",
+    "WaitForPresentation": "langchain_nuggets.tools.auth",
+    "SessionStore": "langchain_nuggets.sessions",
+    "CredentialCache": "langchain_nuggets.credentials",
+    "AgentResolver": "langchain_nuggets.did",
+    # Local proof verification (optional — requires the ``crypto`` extra)
+    "ProofVerifier": "langchain_nuggets.proofs",
+    "VerificationReport": "langchain_nuggets.proofs",
+    "SessionTracker": "langchain_nuggets.tracker",
+    "SessionUpdate": "langchain_nuggets.tracker",
+    "TrustScoreCache": "langchain_nuggets.trust",
+    "TrustGraph": "langchain_nuggets.trust",
+    "NuggetsWebhookReceiver": "langchain_nuggets.webhooks",
+    "WebhookVerificationError": "langchain_nuggets.webhooks",
+    # LangGraph auth (optional — requires the ``langgraph`` extra)
+    "NuggetsAuth": "langchain_nuggets.langgraph",
+    "NuggetsAuthError": "langchain_nuggets.langgraph",
+    # Authority Middleware
+    "NuggetsAuthorityMiddleware": "langchain_nuggets.middleware",
+    "MiddlewareConfig": "langchain_nuggets.middleware",
+    "ProofArtifact": "langchain_nuggets.middleware",
+    "TrustGate": "langchain_nuggets.middleware",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Toolkit
     "NuggetsToolkit",
+    "ToolBundle",
+    "MultiTenantNuggetsToolkit",
+    "TenantClientPool",
     # Client
     "NuggetsApiClient",
     "NuggetsApiClientError",
+    "RequestLimiter",
     # Base
     "NuggetsBaseTool",
+    "OutputProjection",
     # KYC
     "InitiateKycVerification",
     "CheckKycStatus",
     "VerifyAge",
     "VerifyCredential",
+    "WaitForKycCompletion",
     # KYA
     "RegisterAgentIdentity",
     "VerifyAgentIdentity",
     "GetAgentTrustScore",
+    "BatchVerifyAgentIdentities",
+    "BatchGetAgentTrustScores",
+    "QueryAgentTrust",
     # Auth
     "RequestCredentialPresentation",
     "VerifyPresentation",
     "InitiateOAuthFlow",
     "CheckAuthStatus",
+    "WaitForPresentation",
+    # Caches
+    "SessionStore",
+    "CredentialCache",
+    "AgentResolver",
+    "SessionTracker",
+    "SessionUpdate",
+    "TrustScoreCache",
+    "TrustGraph",
+    # Webhooks
+    "NuggetsWebhookReceiver",
+    "WebhookVerificationError",
+    # Proof verification (optional)
+    "ProofVerifier",
+    "VerificationReport",
     # LangGraph (optional)
     "NuggetsAuth",
     "NuggetsAuthError",
@@ -74,4 +173,5 @@ __all__ = [
     "NuggetsAuthorityMiddleware",
     "MiddlewareConfig",
     "ProofArtifact",
+    "TrustGate",
 ]
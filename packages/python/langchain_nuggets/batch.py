@@ -0,0 +1,152 @@
+"""Bounded, de-duplicated and coalesced fan-out for batch tools."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+def unique(keys: Iterable[K]) -> List[K]:
+    """Drop duplicate keys, keeping first-seen order."""
+    return list(dict.fromkeys(keys))
+
+
+def error_payload(exc: NuggetsApiClientError) -> Dict[str, Any]:
+    return {"error": True, "code": exc.code, "message": str(exc), "status_code": exc.status_code}
+
+
+def _capture(fn: Callable[[K], T], key: K) -> Any:
+    try:
+        return fn(key)
+    except NuggetsApiClientError as exc:
+        return error_payload(exc)
+
+
+def run_batch(keys: Iterable[K], fn: Callable[[K], T], max_concurrency: int) -> Dict[K, Any]:
+    """Call ``fn`` once per unique key on a bounded thread pool.
+
+    API errors are returned in place of the result for that key; any other
+    exception propagates. Workers run in copies of the caller's context, so
+    the active ``RunnableConfig`` (and with it the run's request-limiter
+    lane) carries over.
+    """
+    keys = unique(keys)
+    if len(keys) <= 1 or max_concurrency <= 1:
+        return {key: _capture(fn, key) for key in keys}
+    contexts = [contextvars.copy_context() for _ in keys]
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(keys))) as pool:
+        results = pool.map(lambda ctx, key: ctx.run(_capture, fn, key), contexts, keys)
+        return dict(zip(keys, results))
+
+
+async def arun_batch(
+    keys: Iterable[K],
+    fn: Callable[[K], Awaitable[T]],
+    max_concurrency: int,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[K, Any]:
+    """Async variant of ``run_batch``: at most ``max_concurrency`` awaits at once.
+
+    Pass a shared ``semaphore`` to bound several concurrent batches together.
+    """
+    keys = unique(keys)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def call(key: K) -> Any:
+        async with semaphore:
+            try:
+                return await fn(key)
+            except NuggetsApiClientError as exc:
+                return error_payload(exc)
+
+    results = await asyncio.gather(*(call(key) for key in keys))
+    return dict(zip(keys, results))
+
+
+class InFlight:
+    """Share one in-flight call per key between concurrent callers.
+
+    The first caller for a key runs the call; callers that arrive while it
+    is running wait for the same result (or exception) instead of issuing
+    their own. Nothing is kept once the call finishes. Sync and async
+    callers are coalesced separately, and async calls per event loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, "Future[Any]"] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Task[Any]"] = {}
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if future is None:
+                future = self._futures[key] = Future()
+        if not owner:
+            result: T = future.result()
+            return result
+        try:
+            value = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._futures.pop(key, None)
+
+    async def arun(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        task = self._tasks.get(task_key)
+        if task is None:
+
+            async def call() -> T:
+                return await fn()
+
+            task = loop.create_task(call())
+            self._tasks[task_key] = task
+            task.add_done_callback(lambda t: self._done(task_key, t))
+        # Shielded so one caller's cancellation does not cancel the others.
+        result: T = await asyncio.shield(task)
+        return result
+
+    def _done(self, task_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: "asyncio.Task[Any]") -> None:
+        self._tasks.pop(task_key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved when every waiter was cancelled
+
+    def __len__(self) -> int:
+        return len(self._futures) + len(self._tasks)
+
+
+# Agent lookups in flight, shared by the batch tools so that concurrent
+# calls asking for the same agent send one request.
+IN_FLIGHT = InFlight()
+
+
+def lookup_key(kind: str, client: NuggetsApiClient, agent_id: str) -> Hashable:
+    # Keyed by the client that sends the request, so tenants never share results.
+    return (kind, id(client.current_client()), agent_id)
@@ -0,0 +1,89 @@
+"""Bounded in-memory caches shared by the Nuggets tools."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class CacheEntry(Generic[V]):
+    """A cached value and the time it was stored."""
+
+    __slots__ = ("value", "stored_at")
+
+    def __init__(self, value: V, stored_at: float) -> None:
+        self.value = value
+        self.stored_at = stored_at
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache with a freshness TTL and an optional stale window.
+
+    An entry is *fresh* for ``ttl`` seconds after it is stored and *stale*
+    for a further ``stale_ttl`` seconds, after which it is dropped. Callers
+    decide what to do with stale entries (e.g. serve while revalidating).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 300.0,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry[V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[V], bool]:
+        """Return ``(value, fresh)``; ``(None, False)`` on a miss or expiry."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            age = now - entry.stored_at
+            if age >= self.ttl + self.stale_ttl:
+                del self._entries[key]
+                return None, False
+            self._entries.move_to_end(key)
+            return entry.value, age < self.ttl
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the value only if it is fresh."""
+        value, fresh = self.lookup(key)
+        return value if fresh else None
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(value, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def keys(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.lookup(key)[0] is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,3 +1,10 @@
+from langchain_nuggets.client.instrumentation import ClientHooks, ClientMetrics, RequestSample
 from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
 
-__all__ = ["NuggetsApiClient", "NuggetsApiClientError"]
+__all__ = [
+    "NuggetsApiClient",
+    "NuggetsApiClientError",
+    "ClientHooks",
+    "ClientMetrics",
+    "RequestSample",
+]
@@ -0,0 +1,307 @@
+"""Lightweight instrumentation hooks for NuggetsApiClient.
+
+Hooks receive one ``RequestSample`` per API request, broken down into the
+phases httpcore reports through its ``trace`` extension (pool wait,
+connect, TLS, server time) plus JSON decode time measured by the client.
+``ClientMetrics`` aggregates samples per route template into fixed-size
+histograms so it can stay enabled in production.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+# Known Nuggets API routes. ``{id}`` matches any single path segment.
+KNOWN_ROUTES: Tuple[str, ...] = (
+    "/partner/auth",
+    "/kyc/sessions",
+    "/kyc/sessions/{id}",
+    "/kyc/verify-age",
+    "/kyc/verify-credential",
+    "/kya/agents",
+    "/kya/agents/{id}",
+    "/kya/agents/{id}/trust-score",
+    "/credentials/presentations",
+    "/credentials/presentations/{id}",
+    "/oauth/authorize",
+    "/auth/status/{id}",
+    "/authority/evaluate",
+)
+
+# Default latency buckets in seconds (upper bounds, +Inf is implicit).
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+OTHER_ROUTE = "{other}"
+
+_TEMPLATES = [tuple(route.strip("/").split("/")) for route in KNOWN_ROUTES]
+
+
+def route_template(path: str) -> str:
+    """Map a concrete request path to its route template.
+
+    ``/kya/agents/agent-1/trust-score`` becomes ``/kya/agents/{id}/trust-score``.
+    Paths that match no known route are returned without their query string.
+    """
+    path = path.split("?", 1)[0]
+    segments = tuple(path.strip("/").split("/"))
+    for template in _TEMPLATES:
+        if len(template) != len(segments):
+            continue
+        if all(t == "{id}" or t == s for t, s in zip(template, segments)):
+            return "/" + "/".join(template)
+    return path
+
+
+@dataclass
+class RequestSample:
+    """Timing breakdown for a single API request. Durations are in seconds."""
+
+    method: str
+    route: str
+    status_code: int
+    total: float
+    pool_wait: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    server: Optional[float] = None
+    decode: Optional[float] = None
+
+
+class ClientHooks:
+    """Base class for client instrumentation hooks.
+
+    All methods are no-ops; subclass and override the ones you need.
+    Hooks are called inline on the request path and must not block.
+    """
+
+    def on_request(self, sample: RequestSample) -> None:
+        """Called once per completed API request (including error statuses)."""
+
+    def on_retry(self, method: str, route: str, reason: str) -> None:
+        """Called before the client retries a request."""
+
+    def on_token_refresh(self, duration: float, success: bool) -> None:
+        """Called after every ``/partner/auth`` round trip."""
+
+
+class RequestTimer:
+    """Collects httpcore trace events for one request.
+
+    Pass ``trace`` (sync clients) or ``atrace`` (async clients) as the
+    ``trace`` request extension.
+    """
+
+    __slots__ = (
+        "method", "route", "start", "first_event", "connect_start", "connect",
+        "tls_start", "tls", "body_sent", "headers_received",
+    )
+
+    def __init__(self, method: str, route: str) -> None:
+        self.method = method
+        self.route = route
+        self.start = time.perf_counter()
+        self.first_event: Optional[float] = None
+        self.connect_start: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.tls_start: Optional[float] = None
+        self.tls: Optional[float] = None
+        self.body_sent: Optional[float] = None
+        self.headers_received: Optional[float] = None
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if self.first_event is None:
+            self.first_event = now
+        if name.endswith("connect_tcp.started"):
+            self.connect_start = now
+        elif name.endswith("connect_tcp.complete") and self.connect_start is not None:
+            self.connect = now - self.connect_start
+        elif name.endswith("start_tls.started"):
+            self.tls_start = now
+        elif name.endswith("start_tls.complete") and self.tls_start is not None:
+            self.tls = now - self.tls_start
+        elif name.endswith("send_request_body.complete"):
+            self.body_sent = now
+        elif name.endswith("receive_response_headers.complete"):
+            self.headers_received = now
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        self.trace(name, info)
+
+    def finish(self, status_code: int, decode: Optional[float] = None) -> RequestSample:
+        server = None
+        if self.body_sent is not None and self.headers_received is not None:
+            server = self.headers_received - self.body_sent
+        return RequestSample(
+            method=self.method,
+            route=self.route,
+            status_code=status_code,
+            total=time.perf_counter() - self.start,
+            pool_wait=None if self.first_event is None else self.first_event - self.start,
+            connect=self.connect,
+            tls=self.tls,
+            server=server,
+            decode=decode,
+        )
+
+
+class Histogram:
+    """Fixed-bucket cumulative histogram (Prometheus semantics)."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Return ``(le, cumulative_count)`` pairs including ``+Inf``."""
+        result = []
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            result.append((repr(bound), running))
+        result.append(("+Inf", self.count))
+        return result
+
+
+_PHASES = ("total", "pool_wait", "connect", "tls", "server", "decode")
+
+
+class ClientMetrics(ClientHooks):
+    """Aggregating hooks: per-route latency histograms and counters.
+
+    Memory is bounded: at most ``max_routes`` route templates are tracked
+    and any further routes are folded into ``{other}``.
+
+    Usage::
+
+        metrics = ClientMetrics()
+        client = NuggetsApiClient({..., "hooks": metrics})
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, max_routes: int = 64) -> None:
+        self._buckets = tuple(buckets)
+        self._max_routes = max_routes
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str, str], Histogram] = {}
+        self._requests: Dict[Tuple[str, str, int], int] = {}
+        self._retries: Dict[Tuple[str, str, str], int] = {}
+        self._routes: Set[str] = set()
+        self._token_refreshes = 0
+        self._token_refresh_failures = 0
+        self._token_refresh_histogram = Histogram(self._buckets)
+
+    def _route_key(self, route: str) -> str:
+        if route in self._routes:
+            return route
+        if len(self._routes) >= self._max_routes:
+            return OTHER_ROUTE
+        self._routes.add(route)
+        return route
+
+    def on_request(self, sample: RequestSample) -> None:
+        with self._lock:
+            route = self._route_key(sample.route)
+            key = (sample.method, route, sample.status_code)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            for phase in _PHASES:
+                value = getattr(sample, phase)
+                if value is None:
+                    continue
+                hkey = (sample.method, route, phase)
+                histogram = self._histograms.get(hkey)
+                if histogram is None:
+                    histogram = self._histograms[hkey] = Histogram(self._buckets)
+                histogram.observe(value)
+
+    def on_retry(self, method: str, route: str, reason: str) -> None:
+        with self._lock:
+            key = (method, self._route_key(route), reason)
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def on_token_refresh(self, duration: float, success: bool) -> None:
+        with self._lock:
+            self._token_refreshes += 1
+            if not success:
+                self._token_refresh_failures += 1
+            self._token_refresh_histogram.observe(duration)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a plain-dict copy of all metrics, for custom exporters."""
+        with self._lock:
+            return {
+                "requests": [
+                    {"method": m, "route": r, "status_code": s, "count": c}
+                    for (m, r, s), c in self._requests.items()
+                ],
+                "retries": [
+                    {"method": m, "route": r, "reason": reason, "count": c}
+                    for (m, r, reason), c in self._retries.items()
+                ],
+                "token_refreshes": self._token_refreshes,
+                "token_refresh_failures": self._token_refresh_failures,
+                "token_refresh_seconds": {
+                    "buckets": self._token_refresh_histogram.cumulative(),
+                    "sum": self._token_refresh_histogram.sum,
+                    "count": self._token_refresh_histogram.count,
+                },
+                "histograms": [
+                    {
+                        "method": m,
+                        "route": r,
+                        "phase": phase,
+                        "buckets": h.cumulative(),
+                        "sum": h.sum,
+                        "count": h.count,
+                    }
+                    for (m, r, phase), h in self._histograms.items()
+                ],
+            }
+
+    def to_prometheus(self, prefix: str = "nuggets_client") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines = [f"# TYPE {prefix}_requests_total counter"]
+        for row in snap["requests"]:
+            lines.append(
+                f'{prefix}_requests_total{{method="{row["method"]}",route="{row["route"]}",'
+                f'status="{row["status_code"]}"}} {row["count"]}'
+            )
+        lines.append(f"# TYPE {prefix}_retries_total counter")
+        for row in snap["retries"]:
+            lines.append(
+                f'{prefix}_retries_total{{method="{row["method"]}",route="{row["route"]}",'
+                f'reason="{row["reason"]}"}} {row["count"]}'
+            )
+        lines.append(f"# TYPE {prefix}_token_refreshes_total counter")
+        lines.append(f"{prefix}_token_refreshes_total {snap['token_refreshes']}")
+        lines.append(f"# TYPE {prefix}_token_refresh_failures_total counter")
+        lines.append(f"{prefix}_token_refresh_failures_total {snap['token_refresh_failures']}")
+        lines.append(f"# TYPE {prefix}_token_refresh_seconds histogram")
+        refresh = snap["token_refresh_seconds"]
+        for le, count in refresh["buckets"]:
+            lines.append(f'{prefix}_token_refresh_seconds_bucket{{le="{le}"}} {count}')
+        lines.append(f"{prefix}_token_refresh_seconds_sum {refresh['sum']}")
+        lines.append(f"{prefix}_token_refresh_seconds_count {refresh['count']}")
+        lines.append(f"# TYPE {prefix}_phase_seconds histogram")
+        for row in snap["histograms"]:
+            labels = f'method="{row["method"]}",route="{row["route"]}",phase="{row["phase"]}"'
+            for le, count in row["buckets"]:
+                lines.append(f'{prefix}_phase_seconds_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{prefix}_phase_seconds_sum{{{labels}}} {row['sum']}")
+            lines.append(f"{prefix}_phase_seconds_count{{{labels}}} {row['count']}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,227 @@
+"""Fair concurrency limiting for Nuggets API requests.
+
+A ``RequestLimiter`` bounds the number of in-flight requests for every
+client that shares it, and optionally the number per run. Waiting
+requests are granted slots round-robin across runs, so one agent that
+fans out many tool calls cannot starve the others. Requests whose path
+starts with a priority prefix (authority evaluation and auth by default)
+skip the queue and the per-run cap.
+
+The limiter works from threads and event loops at the same time::
+
+    limiter = RequestLimiter(max_concurrency=16, per_run=4)
+    client = NuggetsApiClient({..., "limiter": limiter})
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+from collections import OrderedDict, deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Sequence,
+)
+
+from langchain_core.runnables.config import var_child_runnable_config
+
+DEFAULT_PRIORITY_PREFIXES: Sequence[str] = ("/authority/", "/partner/auth", "/auth/", "/oauth/")
+
+
+def default_run_key() -> Hashable:
+    """Identify the current run for fair queuing.
+
+    Uses the LangGraph ``thread_id`` from the active ``RunnableConfig``;
+    outside a graph it falls back to the current asyncio task or thread.
+    """
+    config = var_child_runnable_config.get() or {}
+    thread_id = (config.get("configurable") or {}).get("thread_id")
+    if thread_id is not None:
+        return ("thread_id", thread_id)
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return ("task", id(task))
+    return ("thread", threading.get_ident())
+
+
+def build_limiter(
+    max_concurrency: Optional[int], per_run: Optional[int] = None
+) -> Optional[RequestLimiter]:
+    """A ``RequestLimiter`` for toolkit-style arguments, or None if both are unset."""
+    if max_concurrency is None and per_run is None:
+        return None
+    return RequestLimiter(max_concurrency or 16, per_run=per_run)
+
+
+class _Waiter:
+    __slots__ = ("run_key", "priority", "wake", "granted")
+
+    def __init__(self, run_key: Hashable, priority: bool, wake: Callable[[], None]) -> None:
+        self.run_key = run_key
+        self.priority = priority
+        self.wake = wake
+        self.granted = False
+
+
+class RequestLimiter:
+    """Bound concurrent Nuggets requests with fair, prioritised queuing.
+
+    Args:
+        max_concurrency: Requests in flight across all runs.
+        per_run: Requests in flight for a single run (``None`` for no cap).
+            Priority requests are not counted against it.
+        priority_prefixes: Path prefixes served from the priority lane.
+        run_key: Returns the current run's key; defaults to
+            :func:`default_run_key`.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        per_run: Optional[int] = None,
+        priority_prefixes: Sequence[str] = DEFAULT_PRIORITY_PREFIXES,
+        run_key: Optional[Callable[[], Hashable]] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if per_run is not None and per_run < 1:
+            raise ValueError("per_run must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.per_run = per_run
+        self.priority_prefixes = tuple(priority_prefixes)
+        self._run_key = run_key or default_run_key
+        self._lock = threading.Lock()
+        self._active = 0
+        self._active_by_run: Dict[Hashable, int] = {}
+        self._priority: Deque[_Waiter] = deque()
+        # run key -> queued waiters; iteration order is the round-robin order.
+        self._queues: "OrderedDict[Hashable, Deque[_Waiter]]" = OrderedDict()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        with self._lock:
+            return len(self._priority) + sum(len(q) for q in self._queues.values())
+
+    def is_priority(self, path: str) -> bool:
+        return path.startswith(self.priority_prefixes)
+
+    # --- Scheduling (call with the lock held) ---
+
+    def _grant_locked(self, waiter: _Waiter) -> None:
+        self._active += 1
+        if not waiter.priority:
+            key = waiter.run_key
+            self._active_by_run[key] = self._active_by_run.get(key, 0) + 1
+        waiter.granted = True
+        waiter.wake()
+
+    def _next_locked(self) -> Optional[_Waiter]:
+        if self._priority:
+            return self._priority.popleft()
+        for key, queue in self._queues.items():
+            if self.per_run is None or self._active_by_run.get(key, 0) < self.per_run:
+                waiter = queue.popleft()
+                if queue:
+                    self._queues.move_to_end(key)
+                else:
+                    del self._queues[key]
+                return waiter
+        return None
+
+    def _dispatch_locked(self) -> None:
+        while self._active < self.max_concurrency:
+            waiter = self._next_locked()
+            if waiter is None:
+                return
+            self._grant_locked(waiter)
+
+    def _enqueue(self, path: str, wake: Callable[[], None]) -> _Waiter:
+        waiter = _Waiter(self._run_key(), self.is_priority(path), wake)
+        with self._lock:
+            if waiter.priority:
+                self._priority.append(waiter)
+            else:
+                self._queues.setdefault(waiter.run_key, deque()).append(waiter)
+            self._dispatch_locked()
+        return waiter
+
+    def _cancel(self, waiter: _Waiter) -> None:
+        """Withdraw a waiter that gave up, or release its slot if already granted."""
+        with self._lock:
+            if not waiter.granted:
+                queue = self._priority if waiter.priority else self._queues.get(waiter.run_key)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue and not waiter.priority:
+                        del self._queues[waiter.run_key]
+                return
+        self._release(waiter)
+
+    def _release(self, waiter: _Waiter) -> None:
+        with self._lock:
+            self._active -= 1
+            if not waiter.priority:
+                key = waiter.run_key
+                remaining = self._active_by_run[key] - 1
+                if remaining:
+                    self._active_by_run[key] = remaining
+                else:
+                    del self._active_by_run[key]
+            self._dispatch_locked()
+
+    # --- Public API ---
+
+    @contextlib.contextmanager
+    def slot(self, path: str) -> Iterator[None]:
+        """Hold a request slot for ``path`` (blocking)."""
+        event = threading.Event()
+        waiter = self._enqueue(path, event.set)
+        try:
+            event.wait()
+        except BaseException:
+            self._cancel(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release(waiter)
+
+    @contextlib.asynccontextmanager
+    async def aslot(self, path: str) -> AsyncIterator[None]:
+        """Async variant of :meth:`slot`; waiting does not block the event loop."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[None]" = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(_set_done, future)
+
+        waiter = self._enqueue(path, wake)
+        try:
+            if not waiter.granted:
+                await future
+        except BaseException:
+            self._cancel(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release(waiter)
+
+
+def _set_done(future: "asyncio.Future[Any]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -1,12 +1,43 @@
 """Nuggets API client with automatic authentication and token caching."""
 from __future__ import annotations
 
+import contextlib
+import gzip
 import json
 import time
-from typing import Any, Dict, Optional, Union
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    ContextManager,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httpx
 
+from langchain_nuggets import tracing
+from langchain_nuggets.client.instrumentation import ClientHooks, RequestTimer, route_template
+
+if TYPE_CHECKING:
+    from langchain_nuggets.client.limiter import RequestLimiter
+
+zstandard: Optional[ModuleType]
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+DEFAULT_MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+# Encoded request body plus its Content-Encoding (None when sent as-is).
+_Payload = Tuple[bytes, Optional[str]]
+
 
 class NuggetsApiClientError(Exception):
     """Error from the Nuggets API."""
@@ -18,15 +49,56 @@ class NuggetsApiClientError(Exception):
 
 
 class NuggetsApiClient:
-    """HTTP client for the Nuggets API with automatic auth token management."""
+    """HTTP client for the Nuggets API with automatic auth token management.
+
+    Pass ``"hooks": ClientHooks`` in the config to receive per-request timing
+    samples, retry and token refresh events (see ``client.instrumentation``).
+
+    Response bodies are capped at ``"max_response_bytes"`` (default 10 MiB,
+    ``None`` to disable) of decoded content: a larger body fails with
+    ``RESPONSE_TOO_LARGE`` and is not read past the cap. Bodies within the
+    cap are buffered in full and parsed in one go.
+
+    Set ``"compress_requests"`` to ``"gzip"``, ``"zstd"`` or ``"auto"`` (zstd
+    when ``zstandard`` is installed, else gzip) to compress JSON request
+    bodies of at least ``"compression_threshold"`` bytes (default 1024).
+    Compressed responses are negotiated and decoded by httpx.
+
+    Pass ``"http_client"`` / ``"async_http_client"`` to share existing
+    httpx clients (and their connection pools) between several API clients;
+    shared clients are not closed by ``close``/``aclose``.
+
+    Pass ``"limiter": RequestLimiter`` to bound in-flight requests with fair
+    queuing across runs (see ``client.limiter``).
+    """
 
     def __init__(self, config: Dict[str, Any]) -> None:
         self._api_url: str = config["api_url"]
         self._partner_id: str = config["partner_id"]
         self._partner_secret: str = config["partner_secret"]
         self._token: Optional[Dict[str, Any]] = None
-        self._sync_client: Optional[httpx.Client] = None
-        self._async_client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = config.get("http_client")
+        self._async_client: Optional[httpx.AsyncClient] = config.get("async_http_client")
+        self._owns_sync_client = self._sync_client is None
+        self._owns_async_client = self._async_client is None
+        self._hooks: Optional[ClientHooks] = config.get("hooks")
+        self._limiter: Optional[RequestLimiter] = config.get("limiter")
+        self._max_response_bytes: Optional[int] = config.get(
+            "max_response_bytes", DEFAULT_MAX_RESPONSE_BYTES
+        )
+        self._compression: Optional[str] = config.get("compress_requests")
+        if self._compression == "auto":
+            self._compression = "gzip" if zstandard is None else "zstd"
+        if self._compression == "zstd" and zstandard is None:
+            raise ImportError(
+                "zstandard is required for zstd request compression. "
+                "Install it with: pip install langchain-nuggets[zstd]"
+            )
+        if self._compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unsupported compress_requests value: {self._compression!r}")
+        self._compression_threshold: int = config.get(
+            "compression_threshold", DEFAULT_COMPRESSION_THRESHOLD
+        )
 
         # TLS configuration for self-hosted deployments
         verify_ssl: bool = config.get("verify_ssl", True)
@@ -45,13 +117,13 @@ class NuggetsApiClient:
 
     def close(self) -> None:
         """Close the sync HTTP client and release resources."""
-        if self._sync_client is not None:
+        if self._sync_client is not None and self._owns_sync_client:
             self._sync_client.close()
             self._sync_client = None
 
     async def aclose(self) -> None:
         """Close the async HTTP client and release resources."""
-        if self._async_client is not None:
+        if self._async_client is not None and self._owns_async_client:
             await self._async_client.aclose()
             self._async_client = None
 
@@ -67,28 +139,74 @@ class NuggetsApiClient:
     async def __aexit__(self, *args: Any) -> None:
         await self.aclose()
 
-    def _authenticate_sync(self) -> str:
+    def current_client(self) -> "NuggetsApiClient":
+        """The client that sends this run's requests: this one.
+
+        ``TenantRoutingClient`` returns the active tenant's client instead.
+        """
+        return self
+
+    def warmup(self) -> None:
+        """Fetch a partner token and open a pooled connection before the first request."""
+        with self._slot("/partner/auth"):
+            self._authenticate_sync(force=True)
+
+    async def awarmup(self) -> None:
+        """Async variant of :meth:`warmup`, warming the async connection pool."""
+        async with self._aslot("/partner/auth"):
+            await self._authenticate_async(force=True)
+
+    # --- Shared helpers ---
+    def _slot(self, path: str) -> ContextManager[Any]:
+        if self._limiter is None:
+            return contextlib.nullcontext()
+        return self._limiter.slot(path)
+
+    def _aslot(self, path: str) -> AsyncContextManager[Any]:
+        if self._limiter is None:
+            return contextlib.nullcontext()
+        return self._limiter.aslot(path)
+
+    def _cached_token(self) -> Optional[str]:
         if self._token and self._token["expires_at"] > time.time():
-            return self._token["access_token"]
-        client = self._get_sync_client()
-        response = client.post(
-            f"{self._api_url}/partner/auth",
-            json={"partnerId": self._partner_id, "partnerSecret": self._partner_secret},
-        )
+            token: str = self._token["access_token"]
+            return token
+        return None
+
+    def _store_token(self, response: httpx.Response, started: float) -> str:
+        if self._hooks is not None:
+            self._hooks.on_token_refresh(time.perf_counter() - started, response.status_code < 400)
         if response.status_code >= 400:
             raise NuggetsApiClientError(
                 "Authentication failed", "AUTH_FAILED", response.status_code
             )
         data = response.json()
+        token: str = data["token"]
         self._token = {
-            "access_token": data["token"],
+            "access_token": token,
             "expires_at": time.time() + data["expiresIn"],
         }
-        return self._token["access_token"]
+        return token
 
-    def _request_sync(self, method: str, path: str, body: Any = None) -> Any:
-        token = self._authenticate_sync()
-        client = self._get_sync_client()
+    def _encode_body(self, body: Any) -> Optional[_Payload]:
+        if body is None:
+            return None
+        content = json.dumps(body).encode("utf-8")
+        if self._compression is None or len(content) < self._compression_threshold:
+            return content, None
+        if self._compression == "zstd" and zstandard is not None:
+            return zstandard.ZstdCompressor().compress(content), "zstd"
+        return gzip.compress(content, compresslevel=6), "gzip"
+
+    def _build_request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[_Payload],
+        token: str,
+        timer: Optional[RequestTimer],
+        is_async: bool,
+    ) -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {
             "method": method,
             "url": f"{self._api_url}{path}",
@@ -97,12 +215,66 @@ class NuggetsApiClient:
                 "Authorization": f"Bearer {token}",
             },
         }
-        if body is not None:
-            kwargs["content"] = json.dumps(body)
-        response = client.request(**kwargs)
+        if payload is not None:
+            kwargs["content"], encoding = payload
+            if encoding is not None:
+                kwargs["headers"]["Content-Encoding"] = encoding
+        tracing.inject_headers(kwargs["headers"])
+        if timer is not None:
+            kwargs["extensions"] = {"trace": timer.atrace if is_async else timer.trace}
+        return kwargs
+
+    def _record(
+        self, timer: Optional[RequestTimer], status_code: int, decode: Optional[float] = None
+    ) -> None:
+        if timer is not None and self._hooks is not None:
+            self._hooks.on_request(timer.finish(status_code, decode))
+
+    def _should_retry(
+        self, response: httpx.Response, timer: Optional[RequestTimer], method: str, path: str
+    ) -> bool:
+        """A 401 means the cached token was revoked or expired early: refresh and retry once."""
+        if response.status_code != 401:
+            return False
+        self._record(timer, response.status_code)
+        self._token = None
+        if self._hooks is not None:
+            self._hooks.on_retry(method, route_template(path), "token_rejected")
+        return True
+
+    def _check_declared_length(self, response: httpx.Response) -> None:
+        declared = response.headers.get("content-length")
+        if (
+            self._max_response_bytes is not None
+            and declared is not None
+            and declared.isdigit()
+            and int(declared) > self._max_response_bytes
+        ):
+            raise self._too_large(response)
+
+    def _append_chunk(self, buffer: bytearray, chunk: bytes, response: httpx.Response) -> None:
+        buffer += chunk
+        if self._max_response_bytes is not None and len(buffer) > self._max_response_bytes:
+            raise self._too_large(response)
+
+    def _too_large(self, response: httpx.Response) -> NuggetsApiClientError:
+        return NuggetsApiClientError(
+            f"Response body exceeds {self._max_response_bytes} bytes",
+            "RESPONSE_TOO_LARGE",
+            response.status_code,
+        )
+
+    def _parse_response(
+        self,
+        response: httpx.Response,
+        content: bytearray,
+        timer: Optional[RequestTimer],
+    ) -> Any:
+        decode_started = time.perf_counter()
         try:
-            data = response.json()
-        except Exception:
+            data = json.loads(content)
+        except ValueError:
+            self._record(timer, response.status_code)
             if response.status_code >= 400:
                 raise NuggetsApiClientError(
                     f"Request failed with status {response.status_code}",
@@ -112,6 +284,7 @@ class NuggetsApiClient:
             raise NuggetsApiClientError(
                 "Invalid JSON response", "PARSE_ERROR", response.status_code
             )
+        self._record(timer, response.status_code, time.perf_counter() - decode_started)
         if response.status_code >= 400:
             raise NuggetsApiClientError(
                 data.get("message", "Request failed"),
@@ -120,6 +293,44 @@ class NuggetsApiClient:
             )
         return data
 
+    # --- Sync methods ---
+    def _authenticate_sync(self, force: bool = False) -> str:
+        token = None if force else self._cached_token()
+        if token is not None:
+            return token
+        client = self._get_sync_client()
+        started = time.perf_counter()
+        response = client.post(
+            f"{self._api_url}/partner/auth",
+            json={"partnerId": self._partner_id, "partnerSecret": self._partner_secret},
+        )
+        return self._store_token(response, started)
+
+    def _send_sync(self, method: str, path: str, payload: Optional[_Payload]) -> Any:
+        token = self._authenticate_sync()
+        client = self._get_sync_client()
+        timer = None if self._hooks is None else RequestTimer(method, route_template(path))
+        request = client.build_request(**self._build_request(method, path, payload, token, timer, False))
+        response = client.send(request, stream=True)
+        try:
+            self._check_declared_length(response)
+            content = bytearray()
+            for chunk in response.iter_bytes():
+                self._append_chunk(content, chunk, response)
+        finally:
+            response.close()
+        return response, content, timer
+
+    def _request_sync(self, method: str, path: str, body: Any = None) -> Any:
+        payload = self._encode_body(body)
+        with self._slot(path), tracing.http_span(method, path, self._api_url) as span:
+            response, content, timer = self._send_sync(method, path, payload)
+            if self._should_retry(response, timer, method, path):
+                tracing.set_attribute(span, "http.request.resend_count", 1)
+                response, content, timer = self._send_sync(method, path, payload)
+            tracing.record_status_code(span, response.status_code)
+            return self._parse_response(response, content, timer)
+
     def get(self, path: str) -> Any:
         return self._request_sync("GET", path)
 
@@ -132,58 +343,43 @@ class NuggetsApiClient:
             self._async_client = httpx.AsyncClient(verify=self._verify)
         return self._async_client
 
-    async def _authenticate_async(self) -> str:
-        if self._token and self._token["expires_at"] > time.time():
-            return self._token["access_token"]
+    async def _authenticate_async(self, force: bool = False) -> str:
+        token = None if force else self._cached_token()
+        if token is not None:
+            return token
         client = await self._get_async_client()
+        started = time.perf_counter()
         response = await client.post(
             f"{self._api_url}/partner/auth",
             json={"partnerId": self._partner_id, "partnerSecret": self._partner_secret},
         )
-        if response.status_code >= 400:
-            raise NuggetsApiClientError(
-                "Authentication failed", "AUTH_FAILED", response.status_code
-            )
-        data = response.json()
-        self._token = {
-            "access_token": data["token"],
-            "expires_at": time.time() + data["expiresIn"],
-        }
-        return self._token["access_token"]
+        return self._store_token(response, started)
 
-    async def _request_async(self, method: str, path: str, body: Any = None) -> Any:
+    async def _send_async(self, method: str, path: str, payload: Optional[_Payload]) -> Any:
         token = await self._authenticate_async()
         client = await self._get_async_client()
-        kwargs: Dict[str, Any] = {
-            "method": method,
-            "url": f"{self._api_url}{path}",
-            "headers": {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {token}",
-            },
-        }
-        if body is not None:
-            kwargs["content"] = json.dumps(body)
-        response = await client.request(**kwargs)
+        timer = None if self._hooks is None else RequestTimer(method, route_template(path))
+        request = client.build_request(**self._build_request(method, path, payload, token, timer, True))
+        response = await client.send(request, stream=True)
         try:
-            data = response.json()
-        except Exception:
-            if response.status_code >= 400:
-                raise NuggetsApiClientError(
-                    f"Request failed with status {response.status_code}",
-                    "UNKNOWN",
-                    response.status_code,
-                )
-            raise NuggetsApiClientError(
-                "Invalid JSON response", "PARSE_ERROR", response.status_code
-            )
-        if response.status_code >= 400:
-            raise NuggetsApiClientError(
-                data.get("message", "Request failed"),
-                data.get("code", "UNKNOWN"),
-                response.status_code,
-            )
-        return data
+            self._check_declared_length(response)
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                self._append_chunk(content, chunk, response)
+        finally:
+            await response.aclose()
+        return response, content, timer
+
+    async def _request_async(self, method: str, path: str, body: Any = None) -> Any:
+        payload = self._encode_body(body)
+        async with self._aslot(path):
+            with tracing.http_span(method, path, self._api_url) as span:
+                response, content, timer = await self._send_async(method, path, payload)
+                if self._should_retry(response, timer, method, path):
+                    tracing.set_attribute(span, "http.request.resend_count", 1)
+                    response, content, timer = await self._send_async(method, path, payload)
+                tracing.record_status_code(span, response.status_code)
+                return self._parse_response(response, content, timer)
 
     async def aget(self, path: str) -> Any:
         return await self._request_async("GET", path)
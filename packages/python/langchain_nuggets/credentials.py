@@ -0,0 +1,213 @@
+"""Reuse of verified credentials across conversations."""
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_nuggets.cache import TTLCache
+from langchain_nuggets.sessions import KYC, PRESENTATION
+
+# (user_id, credential_type, credential) -> whether the cached credential may be reused.
+CredentialPolicy = Callable[[str, str, Dict[str, Any]], bool]
+
+
+def credential_expiry(credential: Dict[str, Any]) -> Optional[float]:
+    """Expiry of a VC (``expirationDate`` or ``validUntil``) as a Unix timestamp."""
+    value = credential.get("expirationDate") or credential.get("validUntil")
+    if not isinstance(value, str):
+        return None
+    try:
+        expires = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return 0.0  # unparseable: treat as expired rather than reuse forever
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=timezone.utc)
+    return expires.timestamp()
+
+
+def matches_type(credential: Dict[str, Any], credential_type: str) -> bool:
+    """Whether a VC satisfies a requested type such as ``"email"``.
+
+    Matches ``type`` entries case-insensitively, with or without a
+    ``Credential`` suffix, or a claim of that name in ``credentialSubject``.
+    """
+    wanted = credential_type.lower()
+    types = credential.get("type") or []
+    if isinstance(types, str):
+        types = [types]
+    for name in types:
+        name = str(name).lower()
+        if name == wanted or name == f"{wanted}credential":
+            return True
+    subject = credential.get("credentialSubject")
+    return isinstance(subject, dict) and credential_type in subject
+
+
+class CredentialCache:
+    """Verified credentials keyed by ``(user_id, credential_type)``.
+
+    Credentials are learned from finished sessions: ``verify_credential``
+    and ``request_credential_presentation`` record which user and types a
+    session was for, and ``check_kyc_status``, ``verify_presentation`` and
+    the wait tools store the credentials once the session completes. A
+    presentation must also have ``verified: true``, and its
+    ``proofVerification`` report, if any, must have verified too.
+
+    A cached credential is reused only while it has not expired
+    (``expirationDate``/``validUntil``), it was verified less than
+    ``revocation_check_interval`` seconds ago, and ``policy`` allows it.
+    Without a ``policy`` nothing is reused. The user ID comes from the
+    tool call, so a policy should also check that it is the user the
+    conversation is authenticated as. After the interval the tools go
+    back to the API, which re-checks revocation. Everything is held in
+    memory.
+
+    Usage::
+
+        cache = CredentialCache(
+            revocation_check_interval=3600,
+            policy=lambda user, ctype, cred: ctype in {"email", "phone"},
+        )
+        toolkit = NuggetsToolkit(..., credential_cache=cache)
+    """
+
+    def __init__(
+        self,
+        revocation_check_interval: float = 3600.0,
+        policy: Optional[CredentialPolicy] = None,
+        max_size: int = 4096,
+        session_ttl: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.revocation_check_interval = revocation_check_interval
+        self._policy = policy
+        self._clock = clock
+        self._credentials: TTLCache[Dict[str, Any]] = TTLCache(
+            max_size=max_size, ttl=revocation_check_interval, clock=clock
+        )
+        # (user_id, credential_type) -> ID of the session the credential came from
+        self._origins: TTLCache[str] = TTLCache(
+            max_size=max_size, ttl=revocation_check_interval, clock=clock
+        )
+        # session_id -> (user_id, requested credential types)
+        self._sessions: TTLCache[Tuple[str, Tuple[str, ...]]] = TTLCache(
+            max_size=max_size, ttl=session_ttl, clock=clock
+        )
+
+    def get(self, user_id: str, credential_type: str) -> Optional[Dict[str, Any]]:
+        """Return a reusable credential, or None if the API must be asked."""
+        key = (user_id, credential_type)
+        credential = self._credentials.get(key)
+        if credential is None:
+            return None
+        expires = credential_expiry(credential)
+        if expires is not None and expires <= self._clock():
+            self._credentials.invalidate(key)
+            return None
+        if self._policy is None or not self._policy(user_id, credential_type, credential):
+            return None  # reuse needs an explicit policy
+        return credential
+
+    def get_all(self, user_id: str, credential_types: Iterable[str]) -> Optional[List[Dict[str, Any]]]:
+        """Return reusable credentials for every type, or None if any is missing."""
+        found = []
+        for credential_type in dict.fromkeys(credential_types):
+            credential = self.get(user_id, credential_type)
+            if credential is None:
+                return None
+            if credential not in found:
+                found.append(credential)
+        return found
+
+    def session_ids(self, user_id: str, credential_types: Iterable[str]) -> List[str]:
+        """IDs of the sessions the user's cached credentials of these types came from."""
+        found = (self._origins.get((user_id, t)) for t in dict.fromkeys(credential_types))
+        return list(dict.fromkeys(s for s in found if s is not None))
+
+    def put(
+        self,
+        user_id: str,
+        credential_type: str,
+        credential: Dict[str, Any],
+        session_id: Optional[str] = None,
+    ) -> None:
+        key = (user_id, credential_type)
+        self._credentials.set(key, credential)
+        if session_id is not None:
+            self._origins.set(key, session_id)
+        else:
+            self._origins.invalidate(key)
+
+    def invalidate(self, user_id: str, credential_type: Optional[str] = None) -> None:
+        """Forget one credential type for a user, or all of the user's credentials."""
+        for key in list(self._credentials.keys()):
+            if isinstance(key, tuple) and key[0] == user_id and credential_type in (None, key[1]):
+                self._credentials.invalidate(key)
+                self._origins.invalidate(key)
+
+    def clear(self) -> None:
+        self._credentials.clear()
+        self._origins.clear()
+        self._sessions.clear()
+
+    def track(self, session: Any, user_id: str, credential_types: Iterable[str]) -> None:
+        """Remember who a newly created session is for and which types it requests."""
+        if isinstance(session, dict) and session.get("sessionId"):
+            self._sessions.set(session["sessionId"], (user_id, tuple(credential_types)))
+
+    def observe(self, kind: str, session_id: str, result: Any) -> None:
+        """Store the credentials of a tracked session that finished successfully."""
+        tracked = self._sessions.get(session_id)
+        if tracked is None or not isinstance(result, dict):
+            return
+        if kind == KYC and result.get("status") != "completed":
+            return
+        if kind == PRESENTATION and (
+            result.get("status") != "presented"
+            or result.get("verified") is not True
+            or (
+                "proofVerification" in result
+                and (result["proofVerification"] or {}).get("verified") is not True
+            )
+        ):
+            return
+        credentials = [c for c in result.get("credentials") or () if isinstance(c, dict)]
+        if not credentials:
+            return
+        user_id, credential_types = tracked
+        for credential_type in credential_types:
+            if len(credentials) == 1 and len(credential_types) == 1:
+                self.put(user_id, credential_type, credentials[0], session_id)
+                continue
+            for credential in credentials:
+                if matches_type(credential, credential_type):
+                    self.put(user_id, credential_type, credential, session_id)
+                    break
+        self._sessions.invalidate(session_id)
+
+    def __len__(self) -> int:
+        return len(self._credentials)
+
+
+def cached_kyc_result(credential_type: str, credential: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool result for a credential served from the cache instead of a new session."""
+    return {
+        "status": "completed",
+        "credentialType": credential_type,
+        "credentials": [credential],
+        "cached": True,
+    }
+
+
+def cached_presentation_result(
+    credentials: List[Dict[str, Any]], session_ids: Sequence[str] = ()
+) -> Dict[str, Any]:
+    """Presentation result for cached credentials, with the session(s) they were presented in."""
+    result: Dict[str, Any] = {}
+    if session_ids:
+        result["sessionId"] = session_ids[0]
+    if len(session_ids) > 1:
+        result["sessionIds"] = list(session_ids)
+    result.update(status="presented", verified=True, credentials=credentials, cached=True)
+    return result
@@ -0,0 +1,243 @@
+"""Cached resolution of agent identity records and DID documents."""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import quote
+
+from langchain_nuggets.cache import TTLCache
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
+
+AGENT = "agent"
+DID_DOCUMENT = "did"
+
+# did -> DID document, or None if the DID cannot be resolved.
+DidLoader = Callable[[str], Optional[Dict[str, Any]]]
+
+# (expires_at, value, (message, code) of a cached "not found" error)
+_Entry = Tuple[float, Optional[Dict[str, Any]], Optional[Tuple[str, str]]]
+
+
+def agent_path(agent_id: str) -> str:
+    return "/kya/agents/" + quote(agent_id, safe="")
+
+
+class AgentResolver:
+    """Agent identity records and DID documents with a TTL and negative caching.
+
+    ``resolve``/``aresolve`` return the ``/kya/agents/{id}`` record for an
+    agent ID or DID. A record is stored under the ID it was requested by
+    and under its ``agentId`` and ``did``, so looking an agent up by either
+    hits the cache. Unknown agents (HTTP 404) are remembered for
+    ``negative_ttl`` seconds and the same error is raised again without a
+    request. Other errors are not cached.
+
+    ``resolve_did`` returns DID documents from ``did_loader``, a callable
+    you supply (e.g. a did:web fetcher), with the same caching.
+    :meth:`verification_key` looks up a ``publicKeyJwk`` in those documents
+    and can be passed to ``ProofVerifier(resolver=...)``.
+
+    Entries are held in an in-memory LRU of ``max_size`` entries. Pass
+    ``path`` to also persist them in a SQLite file, which survives
+    restarts and backs LRU evictions.
+
+    Usage::
+
+        resolver = AgentResolver(ttl=600, negative_ttl=60, path="nuggets-agents.db")
+        toolkit = NuggetsToolkit(..., agent_resolver=resolver)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 600.0,
+        negative_ttl: float = 60.0,
+        max_size: int = 4096,
+        path: Optional[str] = None,
+        did_loader: Optional[DidLoader] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._did_loader = did_loader
+        self._clock = clock
+        # Expiry is checked per entry; the cache TTL only bounds how long
+        # an entry can occupy a slot.
+        self._entries: TTLCache[_Entry] = TTLCache(
+            max_size=max_size, ttl=max(ttl, negative_ttl), clock=clock
+        )
+        self._lock = threading.Lock()
+        # Bumped on invalidation so in-flight lookups don't re-cache old data.
+        self._epoch = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "value TEXT, error TEXT, PRIMARY KEY (kind, key))"
+            )
+            self._db.commit()
+
+    # --- Storage ---
+
+    def _load(self, kind: str, key: str) -> Optional[_Entry]:
+        entry = self._entries.get((kind, key))
+        if entry is None and self._db is not None:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT expires_at, value, error FROM entries WHERE kind = ? AND key = ?",
+                    (kind, key),
+                ).fetchone()
+            if row is not None:
+                entry = (
+                    row[0],
+                    json.loads(row[1]) if row[1] is not None else None,
+                    tuple(json.loads(row[2])) if row[2] is not None else None,
+                )
+                self._entries.set((kind, key), entry)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry
+
+    def _store(self, kind: str, keys: Tuple[Optional[str], ...], entry: _Entry, epoch: int) -> None:
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            for key in dict.fromkeys(k for k in keys if k):
+                self._entries.set((kind, key), entry)
+                if self._db is not None:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO entries (kind, key, expires_at, value, error) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            kind,
+                            key,
+                            entry[0],
+                            json.dumps(entry[1]) if entry[1] is not None else None,
+                            json.dumps(entry[2]) if entry[2] is not None else None,
+                        ),
+                    )
+            if self._db is not None:
+                self._db.commit()
+
+    def _remember(self, agent_id: str, record: Any, epoch: int) -> None:
+        keys: Tuple[Optional[str], ...] = (agent_id,)
+        if isinstance(record, dict):
+            keys += (record.get("agentId"), record.get("did"))
+        self._store(AGENT, keys, (self._clock() + self.ttl, record, None), epoch)
+
+    def _remember_missing(self, agent_id: str, error: NuggetsApiClientError, epoch: int) -> None:
+        if error.status_code == 404:
+            entry = (self._clock() + self.negative_ttl, None, (str(error), error.code))
+            self._store(AGENT, (agent_id,), entry, epoch)
+
+    def peek(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached record without any network call (None if absent or unknown)."""
+        entry = self._load(AGENT, agent_id)
+        return entry[1] if entry is not None else None
+
+    def put(self, record: Dict[str, Any]) -> None:
+        """Store a record under its ``agentId`` and ``did``."""
+        self._remember(record.get("agentId") or record.get("did") or "", record, self._epoch)
+
+    def invalidate(self, *agent_ids: Optional[str]) -> None:
+        """Drop cached records and "not found" entries for these IDs or DIDs."""
+        with self._lock:
+            self._epoch += 1
+            for agent_id in agent_ids:
+                if not agent_id:
+                    continue
+                for kind in (AGENT, DID_DOCUMENT):
+                    self._entries.invalidate((kind, agent_id))
+                if self._db is not None:
+                    self._db.execute("DELETE FROM entries WHERE key = ?", (agent_id,))
+            if self._db is not None:
+                self._db.commit()
+
+    def invalidate_identity(self, identity: Dict[str, Any]) -> None:
+        """Invalidate every key an agent identity record can be looked up by."""
+        self.invalidate(identity.get("agentId"), identity.get("agent_id"), identity.get("did"))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM entries")
+                self._db.commit()
+
+    # --- Agent records ---
+
+    def _cached(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._load(AGENT, agent_id)
+        if entry is None:
+            return None
+        if entry[2] is not None:
+            message, code = entry[2]
+            raise NuggetsApiClientError(message, code, 404)
+        return entry[1]
+
+    def resolve(self, client: NuggetsApiClient, agent_id: str) -> Dict[str, Any]:
+        """Return the agent's identity record, from the cache or the API."""
+        record = self._cached(agent_id)
+        if record is not None:
+            return record
+        epoch = self._epoch
+        try:
+            fetched: Dict[str, Any] = client.get(agent_path(agent_id))
+        except NuggetsApiClientError as exc:
+            self._remember_missing(agent_id, exc, epoch)
+            raise
+        self._remember(agent_id, fetched, epoch)
+        return fetched
+
+    async def aresolve(self, client: NuggetsApiClient, agent_id: str) -> Dict[str, Any]:
+        record = self._cached(agent_id)
+        if record is not None:
+            return record
+        epoch = self._epoch
+        try:
+            fetched: Dict[str, Any] = await client.aget(agent_path(agent_id))
+        except NuggetsApiClientError as exc:
+            self._remember_missing(agent_id, exc, epoch)
+            raise
+        self._remember(agent_id, fetched, epoch)
+        return fetched
+
+    # --- DID documents ---
+
+    def resolve_did(self, did: str) -> Optional[Dict[str, Any]]:
+        """Return the DID document from ``did_loader``, or None if it cannot be resolved."""
+        entry = self._load(DID_DOCUMENT, did)
+        if entry is not None:
+            return entry[1]
+        if self._did_loader is None:
+            return None
+        epoch = self._epoch
+        document = self._did_loader(did)
+        ttl = self.ttl if document is not None else self.negative_ttl
+        self._store(DID_DOCUMENT, (did,), (self._clock() + ttl, document, None), epoch)
+        return document
+
+    def verification_key(self, method_id: str) -> Optional[Dict[str, Any]]:
+        """Return the ``publicKeyJwk`` of a verification method such as ``did:web:x#key-1``."""
+        did, _, fragment = method_id.partition("#")
+        document = self.resolve_did(did)
+        if not document:
+            return None
+        for method in document.get("verificationMethod") or ():
+            if not isinstance(method, dict):
+                continue
+            ref = method.get("id", "")
+            if ref == method_id or (fragment and ref == f"#{fragment}"):
+                return method.get("publicKeyJwk")
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            db, self._db = self._db, None
+        if db is not None:
+            db.close()
@@ -10,10 +10,12 @@ from langchain_nuggets.langgraph.authorization import (
     require_kyc,
     require_scopes,
 )
+from langchain_nuggets.langgraph.prefetch import IdentityPrefetch
 from langchain_nuggets.langgraph.token_verifier import NuggetsAuthError, NuggetsTokenVerifier
 from langchain_nuggets.langgraph.types import NuggetsAuthConfig, NuggetsUserInfo
 
 __all__ = [
+    "IdentityPrefetch",
     "NuggetsAuth",
     "NuggetsAuthConfig",
     "NuggetsAuthError",
@@ -1,6 +1,7 @@
 """Nuggets authentication provider for LangGraph Platform."""
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any, Dict, Optional
 
@@ -96,6 +97,31 @@ class NuggetsAuth:
         """
         return self._auth
 
+    def warmup(self) -> None:
+        """Preload OIDC keys and the partner API token before serving traffic.
+
+        Call from synchronous startup code. Inside a running event loop
+        (ASGI lifespan, LangGraph server startup) use :meth:`awarmup`.
+        """
+        self._verifier.warmup()
+        if self._api_client is not None:
+            self._api_client.warmup()
+
+    async def awarmup(self) -> None:
+        """Concurrently preload OIDC discovery + JWKS and the partner API token.
+
+        Usage from an ASGI lifespan::
+
+            @asynccontextmanager
+            async def lifespan(app):
+                await nuggets_auth.awarmup()
+                yield
+        """
+        tasks = [self._verifier.awarmup()]
+        if self._api_client is not None:
+            tasks.append(self._api_client.awarmup())
+        await asyncio.gather(*tasks)
+
     async def _authenticate(self, authorization: Optional[str] = None) -> Dict[str, Any]:
         """LangGraph authenticate handler.
 
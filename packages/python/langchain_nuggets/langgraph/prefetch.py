@@ -0,0 +1,235 @@
+"""Prefetch a user's Nuggets identity context into LangGraph state."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import quote
+
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from langchain_nuggets.batch import error_payload
+from langchain_nuggets.cache import TTLCache
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
+from langchain_nuggets.sessions import KYC, PRESENTATION, SessionStore, session_path
+from langchain_nuggets.trust import TrustScoreCache, trust_score_path
+
+
+def _auth_status_path(user_id: str) -> str:
+    return "/auth/status/" + quote(user_id, safe="")
+
+
+def _failure(exc: Exception) -> Dict[str, Any]:
+    if isinstance(exc, NuggetsApiClientError):
+        return error_payload(exc)
+    return {
+        "error": True,
+        "code": "REQUEST_FAILED",
+        "message": f"{type(exc).__name__}: {exc}",
+        "status_code": None,
+    }
+
+
+class IdentityPrefetch:
+    """Graph node that loads identity context once, at the start of a thread.
+
+    Fetches concurrently, through ``NuggetsApiClient``:
+
+    - the user's ``AuthStatus`` (authenticated, KYC verified, credentials),
+    - the KYC session named by ``state[kyc_session_key]``, if any,
+    - the presentation named by ``state[presentation_session_key]``, if any,
+    - trust scores for ``state[agent_ids_key]``, if any,
+
+    and writes them to ``state[output_key]``. At most ``max_concurrency``
+    lookups run at once. Lookups still running when ``timeout`` expires
+    are listed under ``"missing"``. Failed lookups, including transport
+    errors, are recorded as error objects, so the graph always proceeds.
+    If the state already has ``output_key``, the node returns no update.
+
+    The user ID is read from ``state[user_id_key]``. If that is absent, it
+    falls back to the LangGraph auth user in
+    ``config["configurable"]["langgraph_auth_user"]``.
+
+    Usage::
+
+        prefetch = IdentityPrefetch(client, session_store=store, trust_cache=cache)
+        builder.add_node("nuggets_identity", prefetch.as_runnable())
+        builder.add_edge(START, "nuggets_identity")
+    """
+
+    def __init__(
+        self,
+        client: NuggetsApiClient,
+        session_store: Optional[SessionStore] = None,
+        trust_cache: Optional[TrustScoreCache] = None,
+        timeout: float = 3.0,
+        max_concurrency: int = 8,
+        auth_status_ttl: float = 30.0,
+        output_key: str = "nuggets_identity",
+        user_id_key: str = "user_id",
+        kyc_session_key: str = "kyc_session_id",
+        presentation_session_key: str = "presentation_session_id",
+        agent_ids_key: str = "agent_ids",
+    ) -> None:
+        self._client = client
+        self._session_store = session_store
+        self._trust_cache = trust_cache
+        self._timeout = timeout
+        self._max_concurrency = max(1, max_concurrency)
+        self._auth_status: TTLCache[Dict[str, Any]] = TTLCache(ttl=auth_status_ttl)
+        self._output_key = output_key
+        self._user_id_key = user_id_key
+        self._kyc_session_key = kyc_session_key
+        self._presentation_session_key = presentation_session_key
+        self._agent_ids_key = agent_ids_key
+
+    def as_runnable(self) -> Runnable[Mapping[str, Any], Dict[str, Any]]:
+        return RunnableLambda(self.invoke, afunc=self.ainvoke, name="nuggets_identity_prefetch")
+
+    # --- Planning ---
+    def _user_id(self, state: Mapping[str, Any], config: Optional[Mapping[str, Any]]) -> Optional[str]:
+        user_id = state.get(self._user_id_key)
+        if not user_id:
+            user = ((config or {}).get("configurable") or {}).get("langgraph_auth_user")
+            user_id = user.get("identity") if isinstance(user, dict) else getattr(user, "identity", None)
+        return str(user_id) if user_id else None
+
+    def _plan(
+        self, state: Mapping[str, Any], config: Optional[Mapping[str, Any]]
+    ) -> Tuple[Optional[str], List[Tuple[str, Optional[str], Callable[[], Any], Callable[[], Awaitable[Any]]]]]:
+        """Return the user ID and the lookups to run as ``(section, key, sync, async)``."""
+        client = self._client
+        store = self._session_store
+        cache = self._trust_cache
+        lookups: List[Tuple[str, Optional[str], Callable[[], Any], Callable[[], Awaitable[Any]]]] = []
+
+        user_id = self._user_id(state, config)
+        if user_id:
+            lookups.append((
+                "authStatus", None,
+                partial(self._get_auth_status, user_id),
+                partial(self._aget_auth_status, user_id),
+            ))
+        for section, key, kind in (
+            ("kycSession", self._kyc_session_key, KYC),
+            ("presentation", self._presentation_session_key, PRESENTATION),
+        ):
+            session_id = state.get(key)
+            if not session_id:
+                continue
+            if store is not None:
+                lookups.append((
+                    section, None,
+                    partial(store.fetch, client, kind, session_id),
+                    partial(store.afetch, client, kind, session_id),
+                ))
+            else:
+                path = session_path(kind, session_id)
+                lookups.append((section, None, partial(client.get, path), partial(client.aget, path)))
+        for agent_id in dict.fromkeys(state.get(self._agent_ids_key) or ()):
+            if cache is not None:
+                lookups.append((
+                    "trustScores", agent_id,
+                    partial(cache.get, client, agent_id),
+                    partial(cache.aget, client, agent_id),
+                ))
+            else:
+                path = trust_score_path(agent_id)
+                lookups.append(("trustScores", agent_id, partial(client.get, path), partial(client.aget, path)))
+        return user_id, lookups
+
+    def _auth_status_key(self, user_id: str) -> Tuple[NuggetsApiClient, str]:
+        # Keyed by the client that sends the request: with a tenant-routing
+        # client the same user ID in two tenants is two different users.
+        return self._client.current_client(), user_id
+
+    def _get_auth_status(self, user_id: str) -> Dict[str, Any]:
+        key = self._auth_status_key(user_id)
+        result = self._auth_status.get(key)
+        if result is None:
+            result = self._client.get(_auth_status_path(user_id))
+            self._auth_status.set(key, result)
+        return result
+
+    async def _aget_auth_status(self, user_id: str) -> Dict[str, Any]:
+        key = self._auth_status_key(user_id)
+        result = self._auth_status.get(key)
+        if result is None:
+            result = await self._client.aget(_auth_status_path(user_id))
+            self._auth_status.set(key, result)
+        return result
+
+    @staticmethod
+    def _assemble(user_id: Optional[str], outcomes: List[Tuple[str, Optional[str], Any]], missing: List[str]) -> Dict[str, Any]:
+        context: Dict[str, Any] = {"userId": user_id, "fetchedAt": time.time(), "missing": missing}
+        for section, key, value in outcomes:
+            if key is None:
+                context[section] = value
+            else:
+                context.setdefault(section, {})[key] = value
+        return context
+
+    @staticmethod
+    def _label(section: str, key: Optional[str]) -> str:
+        return section if key is None else f"{section}:{key}"
+
+    # --- Execution ---
+    def invoke(self, state: Mapping[str, Any], config: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        if state.get(self._output_key) is not None:
+            return {}
+        user_id, lookups = self._plan(state, config)
+        outcomes: List[Tuple[str, Optional[str], Any]] = []
+        missing: List[str] = []
+        if lookups:
+            pool = ThreadPoolExecutor(
+                max_workers=min(self._max_concurrency, len(lookups)),
+                thread_name_prefix="nuggets-prefetch",
+            )
+            # Each lookup runs in a copy of the caller's context, so tenant
+            # routing and limiter run keys carry over to the worker threads.
+            futures = {
+                pool.submit(contextvars.copy_context().run, fn): (section, key)
+                for section, key, fn, _ in lookups
+            }
+            done, _ = wait_futures(futures, timeout=self._timeout)
+            pool.shutdown(wait=False, cancel_futures=True)
+            for future, (section, key) in futures.items():
+                if future not in done:
+                    missing.append(self._label(section, key))
+                    continue
+                try:
+                    outcomes.append((section, key, future.result()))
+                except Exception as exc:
+                    outcomes.append((section, key, _failure(exc)))
+        return {self._output_key: self._assemble(user_id, outcomes, missing)}
+
+    async def ainvoke(self, state: Mapping[str, Any], config: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        if state.get(self._output_key) is not None:
+            return {}
+        user_id, lookups = self._plan(state, config)
+        outcomes: List[Tuple[str, Optional[str], Any]] = []
+        missing: List[str] = []
+        if lookups:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+
+            async def bounded(afn: Callable[[], Awaitable[Any]]) -> Any:
+                async with semaphore:
+                    return await afn()
+
+            tasks = {asyncio.ensure_future(bounded(afn)): (section, key) for section, key, _, afn in lookups}
+            done, pending = await asyncio.wait(tasks, timeout=self._timeout)
+            for task in pending:
+                task.cancel()
+            for task, (section, key) in tasks.items():
+                if task not in done:
+                    missing.append(self._label(section, key))
+                    continue
+                try:
+                    outcomes.append((section, key, task.result()))
+                except Exception as exc:
+                    outcomes.append((section, key, _failure(exc)))
+        return {self._output_key: self._assemble(user_id, outcomes, missing)}
@@ -8,6 +8,8 @@ import httpx
 import jwt
 from jwt import PyJWK
 
+from langchain_nuggets import tracing
+
 
 class NuggetsAuthError(Exception):
     """Authentication error from Nuggets token verification."""
@@ -70,6 +72,25 @@ class NuggetsTokenVerifier:
             await self._http_client.aclose()
             self._http_client = None
 
+    def warmup(self) -> None:
+        """Preload the OIDC discovery document and JWKS synchronously.
+
+        Uses a short-lived sync HTTP client, so it is safe to call before an
+        event loop exists. Only the cached documents carry over; use
+        :meth:`awarmup` to also open the async connection pool.
+        """
+        with httpx.Client(verify=self._verify) as client:
+            now = time.time()
+            self._store_discovery(client.get(self._discovery_url), now)
+            self._store_jwks(client.get(self._jwks_uri()), now)
+
+    async def awarmup(self) -> None:
+        """Preload the OIDC discovery document and JWKS through the async client.
+
+        A no-op while both are still cached.
+        """
+        await self._fetch_jwks()
+
     async def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify an OIDC token and return its claims.
 
@@ -82,13 +103,17 @@ class NuggetsTokenVerifier:
         Raises:
             NuggetsAuthError: If verification fails.
         """
-        try:
-            return await self._verify_jwt(token)
-        except (jwt.exceptions.DecodeError, jwt.exceptions.InvalidTokenError):
-            # Token is not a JWT or has invalid structure — try userinfo
-            pass
-
-        return await self._fetch_userinfo(token)
+        with tracing.start_span("nuggets.verify_token") as span:
+            try:
+                claims = await self._verify_jwt(token)
+                tracing.set_attribute(span, "nuggets.auth.method", "jwks")
+                return claims
+            except (jwt.exceptions.DecodeError, jwt.exceptions.InvalidTokenError):
+                # Token is not a JWT or has invalid structure — try userinfo
+                pass
+
+            tracing.set_attribute(span, "nuggets.auth.method", "userinfo")
+            return await self._fetch_userinfo(token)
 
     async def _verify_jwt(self, token: str) -> Dict[str, Any]:
         """Verify a JWT using the OIDC provider's JWKS."""
@@ -144,14 +169,18 @@ class NuggetsTokenVerifier:
         if self._jwks_keys and (now - self._jwks_fetched_at) < self._jwks_cache_ttl:
             return self._jwks_keys
 
-        discovery = await self._discover_endpoints()
-        jwks_uri = discovery.get("jwks_uri")
-        if not jwks_uri:
-            raise NuggetsAuthError("OIDC provider does not expose a jwks_uri", 500)
-
+        await self._discover_endpoints()
         client = self._get_http_client()
-        response = await client.get(jwks_uri)
+        response = await client.get(self._jwks_uri())
+        return self._store_jwks(response, now)
 
+    def _jwks_uri(self) -> str:
+        jwks_uri = (self._discovery or {}).get("jwks_uri")
+        if not jwks_uri or not isinstance(jwks_uri, str):
+            raise NuggetsAuthError("OIDC provider does not expose a jwks_uri", 500)
+        return jwks_uri
+
+    def _store_jwks(self, response: httpx.Response, now: float) -> List[Dict[str, Any]]:
         if response.status_code >= 400:
             raise NuggetsAuthError(f"JWKS fetch failed: {response.status_code}", 500)
 
@@ -193,10 +222,15 @@ class NuggetsTokenVerifier:
         if self._discovery and (now - self._discovery_fetched_at) < self._jwks_cache_ttl:
             return self._discovery
 
-        url = f"{self._issuer_url}/.well-known/openid-configuration"
         client = self._get_http_client()
-        response = await client.get(url)
+        response = await client.get(self._discovery_url)
+        return self._store_discovery(response, now)
+
+    @property
+    def _discovery_url(self) -> str:
+        return f"{self._issuer_url}/.well-known/openid-configuration"
 
+    def _store_discovery(self, response: httpx.Response, now: float) -> Dict[str, Any]:
         if response.status_code >= 400:
             raise NuggetsAuthError(
                 f"OIDC discovery failed: {response.status_code}", 500
@@ -1,6 +1,7 @@
-"""Nuggets Authority Middleware for LangChain/LangGraph tool call interception."""
+"""Nuggets Authority Middleware and TrustGate for LangChain/LangGraph tool call interception."""
 from langchain_nuggets.middleware.authority_middleware import NuggetsAuthorityMiddleware
 from langchain_nuggets.middleware.proof import build_proof_artifact, hash_parameters, hash_result
+from langchain_nuggets.middleware.trust_gate import TrustDecision, TrustGate
 from langchain_nuggets.middleware.types import (
     ActionContext,
     AuthorityDecision,
@@ -13,6 +14,8 @@ from langchain_nuggets.middleware.types import (
 __all__ = [
     "NuggetsAuthorityMiddleware",
     "MiddlewareConfig",
+    "TrustGate",
+    "TrustDecision",
     "ActionContext",
     "AuthorityDecision",
     "AuthorityEvaluationRequest",
@@ -9,6 +9,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from langchain_core.messages import ToolMessage
 
+from langchain_nuggets import tracing
 from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
 from langchain_nuggets.middleware.proof import (
     build_proof_artifact,
@@ -52,11 +53,20 @@ class NuggetsAuthorityMiddleware:
                 "partner_secret": config.partner_secret,
                 "ca_cert": config.ca_cert,
                 "verify_ssl": config.verify_ssl,
+                "limiter": config.limiter,
             }
         )
         self._proofs: List[ProofArtifact] = []
         self._on_proof: Optional[Callable[[ProofArtifact], Any]] = config.on_proof
 
+    def warmup(self) -> None:
+        """Pre-authenticate against the control plane for the sync wrapper."""
+        self._client.warmup()
+
+    async def awarmup(self) -> None:
+        """Pre-authenticate and open the async pool for ``awrap_tool_call``."""
+        await self._client.awarmup()
+
     @property
     def proofs(self) -> List[ProofArtifact]:
         """All proof artifacts emitted during this middleware's lifetime."""
@@ -129,11 +139,15 @@ class NuggetsAuthorityMiddleware:
         start_time = time.monotonic()
 
         try:
-            raw_response = self._client.post(
-                self._config.authority_endpoint,
-                eval_request.model_dump(),
-            )
-            auth_response = AuthorityEvaluationResponse(**raw_response)
+            with tracing.start_span(
+                "nuggets.authority.evaluate", {"gen_ai.tool.name": tool_name}
+            ) as span:
+                raw_response = self._client.post(
+                    self._config.authority_endpoint,
+                    eval_request.model_dump(),
+                )
+                auth_response = AuthorityEvaluationResponse(**raw_response)
+                tracing.set_attribute(span, "nuggets.authority.decision", auth_response.decision)
         except Exception as exc:
             logger.error("Authority evaluation failed: %s", exc)
             return ToolMessage(
@@ -152,7 +166,8 @@ class NuggetsAuthorityMiddleware:
             return self._make_deny_message(tool_call_id, tool_name, auth_response)
 
         logger.info("ALLOW: tool=%s proof_id=%s", tool_name, auth_response.proof_id)
-        result = handler(request)
+        with tracing.start_span("nuggets.authority.execute", {"gen_ai.tool.name": tool_name}):
+            result = handler(request)
 
         result_content = ""
         if isinstance(result, ToolMessage):
@@ -161,17 +176,19 @@ class NuggetsAuthorityMiddleware:
             )
 
         total_latency = (time.monotonic() - start_time) * 1000
-        proof = build_proof_artifact(
-            authority_response=auth_response,
-            agent_id=self._config.agent_id,
-            controller_id=self._config.controller_id,
-            delegation_id=self._config.delegation_id,
-            tool=tool_name,
-            parameters_hash=hash_parameters(tool_args),
-            result_hash=hash_result(result_content),
-            latency_ms=total_latency,
-        )
-        self._emit_proof(proof)
+        with tracing.start_span("nuggets.authority.proof", {"gen_ai.tool.name": tool_name}) as span:
+            proof = build_proof_artifact(
+                authority_response=auth_response,
+                agent_id=self._config.agent_id,
+                controller_id=self._config.controller_id,
+                delegation_id=self._config.delegation_id,
+                tool=tool_name,
+                parameters_hash=hash_parameters(tool_args),
+                result_hash=hash_result(result_content),
+                latency_ms=total_latency,
+            )
+            tracing.set_attribute(span, "nuggets.proof_id", proof.proof_id)
+            self._emit_proof(proof)
 
         return result
 
@@ -189,11 +206,15 @@ class NuggetsAuthorityMiddleware:
         start_time = time.monotonic()
 
         try:
-            raw_response = await self._client.apost(
-                self._config.authority_endpoint,
-                eval_request.model_dump(),
-            )
-            auth_response = AuthorityEvaluationResponse(**raw_response)
+            with tracing.start_span(
+                "nuggets.authority.evaluate", {"gen_ai.tool.name": tool_name}
+            ) as span:
+                raw_response = await self._client.apost(
+                    self._config.authority_endpoint,
+                    eval_request.model_dump(),
+                )
+                auth_response = AuthorityEvaluationResponse(**raw_response)
+                tracing.set_attribute(span, "nuggets.authority.decision", auth_response.decision)
         except Exception as exc:
             logger.error("Authority evaluation failed: %s", exc)
             return ToolMessage(
@@ -212,7 +233,8 @@ class NuggetsAuthorityMiddleware:
             return self._make_deny_message(tool_call_id, tool_name, auth_response)
 
         logger.info("ALLOW: tool=%s proof_id=%s", tool_name, auth_response.proof_id)
-        result = await handler(request)
+        with tracing.start_span("nuggets.authority.execute", {"gen_ai.tool.name": tool_name}):
+            result = await handler(request)
 
         result_content = ""
         if isinstance(result, ToolMessage):
@@ -221,16 +243,18 @@ class NuggetsAuthorityMiddleware:
             )
 
         total_latency = (time.monotonic() - start_time) * 1000
-        proof = build_proof_artifact(
-            authority_response=auth_response,
-            agent_id=self._config.agent_id,
-            controller_id=self._config.controller_id,
-            delegation_id=self._config.delegation_id,
-            tool=tool_name,
-            parameters_hash=hash_parameters(tool_args),
-            result_hash=hash_result(result_content),
-            latency_ms=total_latency,
-        )
-        self._emit_proof(proof)
+        with tracing.start_span("nuggets.authority.proof", {"gen_ai.tool.name": tool_name}) as span:
+            proof = build_proof_artifact(
+                authority_response=auth_response,
+                agent_id=self._config.agent_id,
+                controller_id=self._config.controller_id,
+                delegation_id=self._config.delegation_id,
+                tool=tool_name,
+                parameters_hash=hash_parameters(tool_args),
+                result_hash=hash_result(result_content),
+                latency_ms=total_latency,
+            )
+            tracing.set_attribute(span, "nuggets.proof_id", proof.proof_id)
+            self._emit_proof(proof)
 
         return result
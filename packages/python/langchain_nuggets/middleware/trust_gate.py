@@ -0,0 +1,257 @@
+"""TrustGate — local trust-score thresholds for agent-to-agent tool calls."""
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence
+
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.trust import TrustGraph, TrustScoreCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AGENT_ARGS: Sequence[str] = ("agentId", "agent_id", "targetAgentId", "target_agent_id")
+# Nuggets KYA tools look agents up rather than interact with them.
+DEFAULT_EXEMPT_TOOLS: Sequence[str] = (
+    "verify_agent_identity",
+    "get_agent_trust_score",
+    "batch_verify_agent_identities",
+    "batch_get_agent_trust_scores",
+    "query_agent_trust",
+)
+
+BELOW_THRESHOLD = "TRUST_SCORE_BELOW_THRESHOLD"
+UNAVAILABLE = "TRUST_SCORE_UNAVAILABLE"
+
+# (tool_name, tool_args) -> the counterparty agent ID, or None if the call is not agent-bound.
+AgentExtractor = Callable[[str, Dict[str, Any]], Optional[str]]
+
+
+@dataclass(frozen=True)
+class TrustDecision:
+    """Outcome of a trust check for one counterparty agent."""
+
+    allowed: bool
+    agent_id: str
+    threshold: float
+    score: Optional[float] = None
+    reason_code: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "allowed": self.allowed,
+            "agentId": self.agent_id,
+            "score": self.score,
+            "threshold": self.threshold,
+            "reason_code": self.reason_code,
+        }
+
+
+def _score_value(score: Any) -> Optional[float]:
+    if not isinstance(score, dict) or score.get("error"):
+        return None
+    value = score.get("score")
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+class TrustGate:
+    """Deterministic trust thresholds before agent-bound tool calls run.
+
+    For each tool call the counterparty agent is taken from ``agent_for``
+    (default: the first of ``agent_args`` present in the call's args).
+    Calls with no counterparty, and tools in ``exempt_tools`` (by default
+    the Nuggets tools that look agents up), pass through untouched. Otherwise the
+    agent's trust score must be at least the tool's threshold from
+    ``thresholds``, or ``min_score``. Calls that fail the check are not
+    executed and get a ``DENIED`` ToolMessage instead, without an LLM turn.
+
+    Scores come from ``trust_graph`` when it holds the agent, and otherwise
+    from ``trust_cache``. The cache serves stale scores while it refreshes
+    them in the background. On a cache miss the score is fetched inline.
+    With ``fetch_on_miss=False`` the call is denied instead
+    (``TRUST_SCORE_UNAVAILABLE``) and the score is fetched in the
+    background for the next attempt. Any lookup failure, including
+    transport errors and timeouts, fails closed.
+
+    Provides wrap_tool_call and awrap_tool_call functions compatible with
+    LangGraph's ToolNode, and :meth:`guard` for hand-offs between graph
+    nodes.
+
+    Usage::
+
+        gate = TrustGate(client, trust_cache=cache, min_score=0.7,
+                         thresholds={"share_customer_data": 0.9})
+        tool_node = ToolNode(tools=tools, wrap_tool_call=gate.wrap_tool_call)
+    """
+
+    def __init__(
+        self,
+        client: NuggetsApiClient,
+        trust_cache: Optional[TrustScoreCache] = None,
+        min_score: float = 0.7,
+        thresholds: Optional[Mapping[str, float]] = None,
+        agent_args: Sequence[str] = DEFAULT_AGENT_ARGS,
+        agent_for: Optional[AgentExtractor] = None,
+        exempt_tools: Sequence[str] = DEFAULT_EXEMPT_TOOLS,
+        trust_graph: Optional[TrustGraph] = None,
+        fetch_on_miss: bool = True,
+    ) -> None:
+        self._client = client
+        self._cache = trust_cache if trust_cache is not None else TrustScoreCache()
+        self.min_score = min_score
+        self._thresholds = dict(thresholds or {})
+        self._agent_args = tuple(agent_args)
+        self._agent_for = agent_for
+        self._exempt = frozenset(exempt_tools)
+        self._graph = trust_graph
+        self._fetch_on_miss = fetch_on_miss
+
+    @property
+    def trust_cache(self) -> TrustScoreCache:
+        return self._cache
+
+    def threshold_for(self, tool_name: Optional[str]) -> float:
+        if tool_name is not None and tool_name in self._thresholds:
+            return self._thresholds[tool_name]
+        return self.min_score
+
+    def agent_for(self, tool_name: str, tool_args: Any) -> Optional[str]:
+        """The counterparty agent of a tool call, or None if it is not gated."""
+        if tool_name in self._exempt:
+            return None
+        if self._agent_for is not None:
+            return self._agent_for(tool_name, tool_args)
+        if isinstance(tool_args, dict):
+            for key in self._agent_args:
+                value = tool_args.get(key)
+                if isinstance(value, str) and value:
+                    return value
+        return None
+
+    # --- Checks ---
+
+    def _decide(self, agent_id: str, threshold: float, score: Any) -> TrustDecision:
+        value = _score_value(score)
+        if value is None:
+            return TrustDecision(False, agent_id, threshold, None, UNAVAILABLE)
+        if value < threshold:
+            return TrustDecision(False, agent_id, threshold, value, BELOW_THRESHOLD)
+        return TrustDecision(True, agent_id, threshold, value)
+
+    def _from_graph(self, agent_id: str, threshold: float) -> Optional[TrustDecision]:
+        if self._graph is None or agent_id not in self._graph:
+            return None
+        return self._decide(agent_id, threshold, {"score": self._graph.score(agent_id)})
+
+    def check(self, agent_id: str, tool_name: Optional[str] = None) -> TrustDecision:
+        """Check ``agent_id`` against the threshold for ``tool_name``."""
+        threshold = self.threshold_for(tool_name)
+        decision = self._from_graph(agent_id, threshold)
+        if decision is not None:
+            return decision
+        score = self._cache.peek(agent_id)
+        try:
+            if score is not None:
+                score = self._cache.get(self._client, agent_id)  # refreshes in background if stale
+            elif self._fetch_on_miss:
+                score = self._cache.refresh(self._client, agent_id)
+            else:
+                self._cache.prefetch(self._client, agent_id)
+        except Exception as exc:  # fail closed on any lookup failure
+            logger.warning("Trust score lookup failed for %s: %s", agent_id, exc)
+            score = None
+        return self._decide(agent_id, threshold, score)
+
+    async def acheck(self, agent_id: str, tool_name: Optional[str] = None) -> TrustDecision:
+        threshold = self.threshold_for(tool_name)
+        decision = self._from_graph(agent_id, threshold)
+        if decision is not None:
+            return decision
+        score = self._cache.peek(agent_id)
+        try:
+            if score is not None:
+                score = await self._cache.aget(self._client, agent_id)
+            elif self._fetch_on_miss:
+                score = await self._cache.arefresh(self._client, agent_id)
+            else:
+                self._cache.aprefetch(self._client, agent_id)
+        except Exception as exc:  # fail closed on any lookup failure
+            logger.warning("Trust score lookup failed for %s: %s", agent_id, exc)
+            score = None
+        return self._decide(agent_id, threshold, score)
+
+    # --- Tool calls ---
+
+    def _make_deny_message(self, tool_call_id: str, tool_name: str, decision: TrustDecision) -> ToolMessage:
+        content = json.dumps(
+            {
+                "status": "DENIED",
+                "tool": tool_name,
+                "reason_code": decision.reason_code,
+                "agentId": decision.agent_id,
+                "score": decision.score,
+                "threshold": decision.threshold,
+                "message": f"Trust gate denied '{tool_name}' for agent '{decision.agent_id}': "
+                f"{decision.reason_code}",
+            }
+        )
+        return ToolMessage(content=content, tool_call_id=tool_call_id)
+
+    def wrap_tool_call(self, request: Any, handler: Any) -> Any:
+        """Synchronous tool call wrapper compatible with LangGraph ToolNode."""
+        tool_call = request.tool_call
+        tool_name = tool_call["name"]
+        agent_id = self.agent_for(tool_name, tool_call["args"])
+        if agent_id is None:
+            return handler(request)
+        decision = self.check(agent_id, tool_name)
+        if not decision.allowed:
+            logger.info("DENY: tool=%s agent=%s reason=%s", tool_name, agent_id, decision.reason_code)
+            return self._make_deny_message(tool_call["id"], tool_name, decision)
+        return handler(request)
+
+    async def awrap_tool_call(self, request: Any, handler: Any) -> Any:
+        """Asynchronous tool call wrapper compatible with LangGraph ToolNode."""
+        tool_call = request.tool_call
+        tool_name = tool_call["name"]
+        agent_id = self.agent_for(tool_name, tool_call["args"])
+        if agent_id is None:
+            return await handler(request)
+        decision = await self.acheck(agent_id, tool_name)
+        if not decision.allowed:
+            logger.info("DENY: tool=%s agent=%s reason=%s", tool_name, agent_id, decision.reason_code)
+            return self._make_deny_message(tool_call["id"], tool_name, decision)
+        return await handler(request)
+
+    # --- Hand-offs ---
+
+    def guard(
+        self,
+        agent_key: str = "agent_id",
+        allow: str = "allow",
+        deny: str = "deny",
+        name: Optional[str] = None,
+    ) -> Runnable[Mapping[str, Any], str]:
+        """A LangGraph router that checks ``state[agent_key]`` before a hand-off.
+
+        ``name`` selects a threshold from ``thresholds`` as a tool name would.
+        Use with ``add_conditional_edges``; a missing agent routes to ``deny``.
+        """
+
+        def route(state: Mapping[str, Any]) -> str:
+            agent_id = state.get(agent_key)
+            if not agent_id:
+                return deny
+            return allow if self.check(agent_id, name).allowed else deny
+
+        async def aroute(state: Mapping[str, Any]) -> str:
+            agent_id = state.get(agent_key)
+            if not agent_id:
+                return deny
+            return allow if (await self.acheck(agent_id, name)).allowed else deny
+
+        return RunnableLambda(route, afunc=aroute, name="nuggets_trust_gate")
@@ -20,6 +20,8 @@ class MiddlewareConfig(BaseModel):
     intent_resolver: Optional[Callable[[str, Dict[str, Any]], Optional[str]]] = None
     ca_cert: Optional[str] = None
     verify_ssl: bool = True
+    # Shared RequestLimiter, e.g. ``NuggetsToolkit.limiter``
+    limiter: Optional[Any] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -0,0 +1,123 @@
+"""In-process polling of KYC sessions and presentations until they finish."""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.sessions import SessionStore, is_terminal, session_path
+
+
+@dataclass(frozen=True)
+class PollPolicy:
+    """Adaptive backoff for session polling.
+
+    The first poll waits ``initial_interval`` seconds and each later one
+    waits ``multiplier`` times longer, capped at ``max_interval``. Each
+    delay is randomised by up to ``jitter`` (a fraction) so many waiters
+    don't poll in lockstep. ``max_timeout`` caps any requested timeout.
+    """
+
+    initial_interval: float = 1.0
+    max_interval: float = 10.0
+    multiplier: float = 1.5
+    jitter: float = 0.1
+    max_timeout: float = 600.0
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial_interval
+        while True:
+            spread = delay * self.jitter
+            yield max(0.0, delay + random.uniform(-spread, spread))
+            delay = min(delay * self.multiplier, self.max_interval)
+
+
+DEFAULT_POLL_POLICY = PollPolicy()
+
+
+def _fetch(
+    client: NuggetsApiClient, store: Optional[SessionStore], kind: str, session_id: str
+) -> Dict[str, Any]:
+    if store is not None:
+        return store.fetch(client, kind, session_id)
+    result: Dict[str, Any] = client.get(session_path(kind, session_id))
+    return result
+
+
+async def _afetch(
+    client: NuggetsApiClient, store: Optional[SessionStore], kind: str, session_id: str
+) -> Dict[str, Any]:
+    if store is not None:
+        return await store.afetch(client, kind, session_id)
+    result: Dict[str, Any] = await client.aget(session_path(kind, session_id))
+    return result
+
+
+def _timed_out(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {**result, "timedOut": True}
+
+
+def wait_for_session(
+    client: NuggetsApiClient,
+    kind: str,
+    session_id: str,
+    timeout: float,
+    store: Optional[SessionStore] = None,
+    policy: PollPolicy = DEFAULT_POLL_POLICY,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Dict[str, Any]:
+    """Poll until the session is terminal or ``timeout`` seconds have passed.
+
+    Returns the last API response; on timeout it carries ``"timedOut": true``.
+    If ``store`` receives pushed updates (see ``NuggetsWebhookReceiver``),
+    the session is read once and then awaited without polling.
+    """
+    deadline = clock() + min(timeout, policy.max_timeout)
+    delays = policy.delays()
+    while True:
+        result = _fetch(client, store, kind, session_id)
+        if is_terminal(kind, result):
+            return result
+        if store is not None and store.push_enabled:
+            pushed = store.wait_sync(kind, session_id, max(0.0, deadline - clock()))
+            if pushed is not None:
+                return pushed
+            # One final read in case a webhook was missed.
+            result = _fetch(client, store, kind, session_id)
+            return result if is_terminal(kind, result) else _timed_out(result)
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return _timed_out(result)
+        sleep(min(next(delays), remaining))
+
+
+async def await_session(
+    client: NuggetsApiClient,
+    kind: str,
+    session_id: str,
+    timeout: float,
+    store: Optional[SessionStore] = None,
+    policy: PollPolicy = DEFAULT_POLL_POLICY,
+    clock: Callable[[], float] = time.monotonic,
+) -> Dict[str, Any]:
+    """Async variant of ``wait_for_session``; sleeps without blocking the loop."""
+    deadline = clock() + min(timeout, policy.max_timeout)
+    delays = policy.delays()
+    while True:
+        result = await _afetch(client, store, kind, session_id)
+        if is_terminal(kind, result):
+            return result
+        if store is not None and store.push_enabled:
+            pushed = await store.wait(kind, session_id, max(0.0, deadline - clock()))
+            if pushed is not None:
+                return pushed
+            result = await _afetch(client, store, kind, session_id)
+            return result if is_terminal(kind, result) else _timed_out(result)
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return _timed_out(result)
+        await asyncio.sleep(min(next(delays), remaining))
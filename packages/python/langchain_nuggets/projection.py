@@ -0,0 +1,75 @@
+"""Compact rendering of tool results for the LLM context."""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Sequence
+
+SUBJECT_KEYS = frozenset({"credentialSubject", "credential_subject"})
+
+
+@dataclass(frozen=True)
+class OutputProjection:
+    """Controls what a Nuggets tool puts in its ``ToolMessage`` content.
+
+    The full API response is always kept as the message ``artifact``; only
+    the text the LLM sees is reduced:
+
+    - ``fields`` maps a tool name to the top-level keys to keep (tools not
+      listed keep every key),
+    - ``drop_keys`` are removed at any depth (by default the verbose
+      cryptographic ``proof`` blocks),
+    - credential subjects whose JSON exceeds ``max_subject_chars`` are
+      replaced by a list of their claim names,
+    - ``None`` values and empty containers are dropped when ``drop_empty``,
+    - ``compact`` renders JSON without spaces after separators.
+
+    Usage::
+
+        projection = OutputProjection(fields={"check_kyc_status": ["status", "credentials"]})
+        toolkit = NuggetsToolkit(..., output_projection=projection)
+    """
+
+    fields: Mapping[str, Sequence[str]] = field(default_factory=dict)
+    drop_keys: FrozenSet[str] = frozenset({"proof"})
+    max_subject_chars: Optional[int] = 512
+    drop_empty: bool = True
+    compact: bool = True
+
+    def project(self, tool_name: str, result: Any) -> Any:
+        """Return the reduced form of ``result`` for ``tool_name``."""
+        allowed = self.fields.get(tool_name)
+        if allowed is not None and isinstance(result, dict) and not result.get("error"):
+            result = {key: value for key, value in result.items() if key in allowed}
+        return self._prune(result)
+
+    def render(self, tool_name: str, result: Any) -> str:
+        projected = self.project(tool_name, result)
+        if self.compact:
+            return json.dumps(projected, separators=(",", ":"))
+        return json.dumps(projected)
+
+    def _prune(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            pruned = {}
+            for key, item in value.items():
+                if key in self.drop_keys:
+                    continue
+                if key in SUBJECT_KEYS and isinstance(item, dict):
+                    item = self._subject(item)
+                else:
+                    item = self._prune(item)
+                if self.drop_empty and (item is None or item == {} or item == []):
+                    continue
+                pruned[key] = item
+            return pruned
+        if isinstance(value, list):
+            return [self._prune(item) for item in value]
+        return value
+
+    def _subject(self, subject: Dict[str, Any]) -> Any:
+        if self.max_subject_chars is None:
+            return self._prune(subject)
+        if len(json.dumps(subject)) <= self.max_subject_chars:
+            return self._prune(subject)
+        return {"truncated": True, "claims": sorted(subject)}
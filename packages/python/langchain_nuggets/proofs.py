@@ -0,0 +1,399 @@
+"""Local verification of VerifiableCredential proofs.
+
+``ProofVerifier`` checks credential signatures in process, so
+high-volume flows do not have to rely only on the ``verified`` flag
+returned by the API. Supported proof formats:
+
+- VC-JWT: a credential given as a compact JWS, or a ``JwtProof2020``
+  proof carrying one. The accepted ``alg`` follows from the issuer key
+  (EdDSA, ES256/ES384, RS256/PS256), never from the token header.
+- Data Integrity proofs with the ``eddsa-jcs-2022`` (Ed25519) and
+  ``ecdsa-jcs-2019`` (P-256) cryptosuites.
+
+Other proof types are reported as ``unsupported``. Issuer keys come from
+``did:key`` identifiers (decoded locally), a static ``keys`` mapping, or
+an optional ``resolver``. Resolved keys are cached. The signing key must
+belong to the credential issuer: its DID (the verification method
+before ``#``) must equal the issuer ID, and an issuer that is not a DID
+is only accepted with a key registered for it in ``keys``. Pass
+``trusted_issuers`` to also require a known issuer; without it a
+credential signed by any ``did:key`` for itself verifies.
+
+Requires ``PyJWT[crypto]``::
+
+    pip install langchain-nuggets[crypto]
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from langchain_nuggets.cache import TTLCache
+from langchain_nuggets.credentials import credential_expiry
+
+try:
+    import jwt
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, rsa
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+    from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+except ImportError:
+    jwt = None  # type: ignore[assignment]
+
+# verificationMethod / kid -> public key (JWK dict or a ``cryptography`` key), or None.
+KeyResolver = Callable[[str], Optional[Any]]
+
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_INDEX = {char: i for i, char in enumerate(_B58_ALPHABET)}
+_ED25519_MULTICODEC = b"\xed\x01"
+_P256_MULTICODEC = b"\x80\x24"
+_JCS_SUITES = {"eddsa-jcs-2022", "ecdsa-jcs-2019"}
+
+
+class ProofVerificationError(Exception):
+    """A credential proof could not be verified."""
+
+
+@dataclass(frozen=True)
+class ProofResult:
+    """Outcome of verifying one credential."""
+
+    index: int
+    verified: bool
+    suite: Optional[str] = None
+    credential_id: Optional[str] = None
+    issuer: Optional[str] = None
+    verification_method: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "verified": self.verified,
+            "suite": self.suite,
+            "credentialId": self.credential_id,
+            "issuer": self.issuer,
+            "verificationMethod": self.verification_method,
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class VerificationReport:
+    """Per-credential results of a batch verification."""
+
+    results: Tuple[ProofResult, ...]
+    elapsed: float
+
+    @property
+    def verified(self) -> bool:
+        """True when every credential verified (and there was at least one)."""
+        return bool(self.results) and all(result.verified for result in self.results)
+
+    @property
+    def failed(self) -> Tuple[ProofResult, ...]:
+        return tuple(result for result in self.results if not result.verified)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "verified": self.verified,
+            "total": len(self.results),
+            "failed": len(self.failed),
+            "elapsedMs": round(self.elapsed * 1000, 3),
+            "results": [result.to_dict() for result in self.results],
+        }
+
+
+def canonicalize(value: Any) -> bytes:
+    """JSON Canonicalization Scheme (RFC 8785) for the JSON found in credentials.
+
+    Keys are sorted and whitespace removed. Non-integral floats use
+    Python's shortest repr, which matches RFC 8785 for ordinary values.
+    """
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    ).encode("utf-8")
+
+
+def b58decode(value: str) -> bytes:
+    number = 0
+    for char in value:
+        try:
+            number = number * 58 + _B58_INDEX[char]
+        except KeyError:
+            raise ProofVerificationError(f"Invalid base58 character {char!r}") from None
+    raw = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    return b"\x00" * (len(value) - len(value.lstrip("1"))) + raw
+
+
+def multibase_decode(value: str) -> bytes:
+    if not value.startswith("z"):
+        raise ProofVerificationError("Only base58btc multibase values are supported")
+    return b58decode(value[1:])
+
+
+def did_key_public_key(did_url: str) -> Any:
+    """Decode the Ed25519 or P-256 public key embedded in a ``did:key`` identifier."""
+    did = did_url.split("#", 1)[0]
+    if not did.startswith("did:key:"):
+        raise ProofVerificationError(f"Not a did:key identifier: {did}")
+    decoded = multibase_decode(did[len("did:key:"):])
+    prefix, key = decoded[:2], decoded[2:]
+    if prefix == _ED25519_MULTICODEC and len(key) == 32:
+        return Ed25519PublicKey.from_public_bytes(key)
+    if prefix == _P256_MULTICODEC:
+        return ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), key)
+    raise ProofVerificationError("Unsupported did:key key type")
+
+
+class ProofVerifier:
+    """Verify credential proofs locally, one at a time or in batches.
+
+    Args:
+        keys: Known issuer keys by verification method ID or JWT ``kid``
+            (JWK dicts or ``cryptography`` public keys). IDs are
+            ``<issuer>#<fragment>``; register keys here for issuers that
+            are not DIDs, e.g. ``https://issuer.example#key-1``.
+        resolver: Called for other key IDs, e.g. to read a did:web
+            document you already hold. Its results are cached for
+            ``key_ttl`` seconds; ``did:key`` needs no resolver.
+        trusted_issuers: If given, only credentials signed by keys of
+            these issuers verify; others fail with "Issuer is not trusted".
+        max_workers: Threads used by :meth:`verify_many`.
+        check_expiry: Fail credentials past ``expirationDate``/``validUntil``.
+
+    Usage::
+
+        verifier = ProofVerifier(
+            keys={"did:web:issuer.example#key-1": jwk},
+            trusted_issuers={"did:web:issuer.example"},
+        )
+        report = verifier.verify_many(result["credentials"])
+        if not report.verified:
+            ...
+    """
+
+    def __init__(
+        self,
+        keys: Optional[Mapping[str, Any]] = None,
+        resolver: Optional[KeyResolver] = None,
+        key_ttl: float = 3600.0,
+        max_keys: int = 1024,
+        trusted_issuers: Optional[Collection[str]] = None,
+        max_workers: int = 8,
+        check_expiry: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if jwt is None:
+            raise ImportError(
+                "PyJWT[crypto] is required for local proof verification. "
+                "Install it with: pip install langchain-nuggets[crypto]"
+            )
+        self._keys = dict(keys or {})
+        self._resolver = resolver
+        self._key_cache: TTLCache[Any] = TTLCache(max_size=max_keys, ttl=key_ttl)
+        self._trusted_issuers = frozenset(trusted_issuers) if trusted_issuers is not None else None
+        self._max_workers = max_workers
+        self._check_expiry = check_expiry
+        self._clock = clock
+
+    # --- Keys ---
+
+    def public_key(self, key_id: str) -> Any:
+        """Return the public key for a verification method, using the key cache."""
+        key = self._key_cache.get(key_id)
+        if key is not None:
+            return key
+        found = self._keys.get(key_id)
+        if found is None and key_id.startswith("did:key:"):
+            found = did_key_public_key(key_id)
+        if found is None and self._resolver is not None:
+            found = self._resolver(key_id)
+        if found is None:
+            raise ProofVerificationError(f"Unknown verification method: {key_id}")
+        if isinstance(found, Mapping):
+            found = jwt.PyJWK(dict(found)).key
+        self._key_cache.set(key_id, found)
+        return found
+
+    # --- Verification ---
+
+    def verify(self, credential: Any, index: int = 0) -> ProofResult:
+        """Verify one credential (a JSON-LD dict or a VC-JWT string)."""
+        suite: Optional[str] = None
+        method: Optional[str] = None
+        try:
+            if isinstance(credential, str):
+                suite = "vc-jwt"
+                credential, method = self._verify_jwt(credential)
+            elif not isinstance(credential, dict):
+                raise ProofVerificationError("Credential must be an object or a VC-JWT")
+            else:
+                proof = credential.get("proof")
+                proofs: List[Any] = proof if isinstance(proof, list) else [proof]
+                if not proofs or not all(isinstance(p, dict) for p in proofs):
+                    raise ProofVerificationError("Credential has no proof")
+                for item in proofs:
+                    suite, method = self._verify_proof(credential, item)
+            self._check_claims(credential, method)
+        except ProofVerificationError as exc:
+            return _result(index, credential, suite, None, str(exc))
+        except Exception as exc:
+            # Credentials are untrusted input: any failure is a failed proof,
+            # never an exception escaping into the calling tool.
+            return _result(index, credential, suite, None, f"{type(exc).__name__}: {exc}".rstrip(": "))
+        return _result(index, credential, suite, method, None)
+
+    def verify_many(
+        self, credentials: Sequence[Any], max_workers: Optional[int] = None
+    ) -> VerificationReport:
+        """Verify credentials on a thread pool and return a report."""
+        started = time.perf_counter()
+        workers = min(max_workers or self._max_workers, len(credentials))
+        if workers <= 1:
+            results = [self.verify(c, i) for i, c in enumerate(credentials)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self.verify, credentials, range(len(credentials))))
+        return VerificationReport(tuple(results), time.perf_counter() - started)
+
+    def check_result(self, result: Any) -> Any:
+        """Return an API result with a ``proofVerification`` report for its credentials.
+
+        Results without credentials are returned unchanged.
+        """
+        if not isinstance(result, dict) or not result.get("credentials"):
+            return result
+        report = self.verify_many(list(result["credentials"]))
+        return {**result, "proofVerification": report.to_dict()}
+
+    async def acheck_result(self, result: Any) -> Any:
+        """Async variant of :meth:`check_result`; verification runs off the event loop."""
+        if not isinstance(result, dict) or not result.get("credentials"):
+            return result
+        return await asyncio.to_thread(self.check_result, result)
+
+    def _verify_jwt(self, token: str) -> Tuple[Dict[str, Any], str]:
+        header = jwt.get_unverified_header(token)
+        claims = jwt.decode(token, options={"verify_signature": False})
+        issuer = claims.get("iss")
+        kid = header.get("kid") or issuer
+        if not kid:
+            raise ProofVerificationError("VC-JWT has neither kid nor iss")
+        if not isinstance(kid, str) or (issuer is not None and not isinstance(issuer, str)):
+            raise ProofVerificationError("VC-JWT kid and iss must be strings")
+        if kid.startswith("#") and issuer:
+            kid = issuer + kid
+        key = self.public_key(kid)
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=_jwt_algorithms(key),
+            options={"verify_aud": False, "verify_exp": self._check_expiry},
+        )
+        credential = claims.get("vc")
+        if not isinstance(credential, dict):
+            raise ProofVerificationError("VC-JWT has no vc claim")
+        credential = dict(credential)
+        if issuer is not None:
+            if "issuer" in credential and _issuer_id(credential) != issuer:
+                raise ProofVerificationError("VC-JWT iss does not match the credential issuer")
+            credential["issuer"] = credential.get("issuer", issuer)
+        if "jti" in claims:
+            credential.setdefault("id", claims["jti"])
+        return credential, kid
+
+    def _verify_proof(self, credential: Dict[str, Any], proof: Dict[str, Any]) -> Tuple[str, str]:
+        if proof.get("type") == "JwtProof2020" and isinstance(proof.get("jwt"), str):
+            signed, kid = self._verify_jwt(proof["jwt"])
+            # Every claim checked later (issuer, expiry, id) must be signed.
+            if {k: v for k, v in credential.items() if k != "proof"} != signed:
+                raise ProofVerificationError("JWT proof does not match the credential")
+            return "JwtProof2020", kid
+        suite = proof.get("cryptosuite") if proof.get("type") == "DataIntegrityProof" else None
+        if not isinstance(suite, str) or suite not in _JCS_SUITES:
+            raise ProofVerificationError(f"unsupported proof type {proof.get('type')!r}")
+        method = proof.get("verificationMethod")
+        value = proof.get("proofValue")
+        if not isinstance(method, str) or not isinstance(value, str):
+            raise ProofVerificationError("Proof is missing verificationMethod or proofValue")
+        config = {k: v for k, v in proof.items() if k != "proofValue"}
+        if "@context" in credential:
+            config["@context"] = credential["@context"]
+        document = {k: v for k, v in credential.items() if k != "proof"}
+        data = (
+            hashlib.sha256(canonicalize(config)).digest()
+            + hashlib.sha256(canonicalize(document)).digest()
+        )
+        key = self.public_key(method)
+        signature = multibase_decode(value)
+        if suite == "eddsa-jcs-2022":
+            if not isinstance(key, Ed25519PublicKey):
+                raise ProofVerificationError("eddsa-jcs-2022 requires an Ed25519 key")
+            key.verify(signature, data)
+        else:
+            if not isinstance(key, ec.EllipticCurvePublicKey) or len(signature) != 64:
+                raise ProofVerificationError("ecdsa-jcs-2019 requires a P-256 key and a 64-byte signature")
+            der = encode_dss_signature(
+                int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:], "big")
+            )
+            key.verify(der, data, ec.ECDSA(hashes.SHA256()))
+        return suite, method
+
+    def _check_claims(self, credential: Dict[str, Any], method: Optional[str]) -> None:
+        issuer = _issuer_id(credential)
+        controller = method.split("#", 1)[0] if method else None
+        if issuer is None or controller != issuer:
+            raise ProofVerificationError("Verification method is not controlled by the issuer")
+        if not issuer.startswith("did:") and method not in self._keys:
+            raise ProofVerificationError("Issuers that are not DIDs need a registered key")
+        if self._trusted_issuers is not None and controller not in self._trusted_issuers:
+            raise ProofVerificationError("Issuer is not trusted")
+        if self._check_expiry:
+            expires = credential_expiry(credential)
+            if expires is not None and expires <= self._clock():
+                raise ProofVerificationError("Credential has expired")
+
+
+def _jwt_algorithms(key: Any) -> List[str]:
+    """JWS algorithms allowed for a key, so the token header cannot pick one."""
+    if isinstance(key, Ed25519PublicKey):
+        return ["EdDSA"]
+    if isinstance(key, ec.EllipticCurvePublicKey):
+        if isinstance(key.curve, ec.SECP256R1):
+            return ["ES256"]
+        if isinstance(key.curve, ec.SECP384R1):
+            return ["ES384"]
+    if isinstance(key, rsa.RSAPublicKey):
+        return ["RS256", "PS256"]
+    raise ProofVerificationError(f"Unsupported key type for VC-JWT: {type(key).__name__}")
+
+
+def _issuer_id(credential: Any) -> Optional[str]:
+    if not isinstance(credential, dict):
+        return None
+    issuer = credential.get("issuer")
+    if isinstance(issuer, dict):
+        issuer = issuer.get("id")
+    return issuer if isinstance(issuer, str) else None
+
+
+def _result(
+    index: int, credential: Any, suite: Optional[str], method: Optional[str], error: Optional[str]
+) -> ProofResult:
+    credential_id = credential.get("id") if isinstance(credential, dict) else None
+    return ProofResult(
+        index=index,
+        verified=error is None,
+        suite=suite,
+        credential_id=credential_id,
+        issuer=_issuer_id(credential),
+        verification_method=method,
+        error=error,
+    )
+
@@ -0,0 +1,73 @@
+"""Precomputed provider schemas for Nuggets tools."""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterator, Mapping, Sequence, Tuple
+
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+_cache: Dict[Hashable, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def tool_schema(tool: BaseTool) -> Dict[str, Any]:
+    """Return the OpenAI-format tool schema for ``tool``, computed once.
+
+    A schema depends only on the tool's class, name, description and
+    argument model, so it is cached process-wide under that key. Callers
+    must treat the returned dict as read-only.
+    """
+    key = (type(tool), tool.name, tool.description, tool.args_schema)
+    schema = _cache.get(key)
+    if schema is None:
+        schema = convert_to_openai_tool(tool)
+        with _lock:
+            schema = _cache.setdefault(key, schema)
+    return schema
+
+
+@dataclass(frozen=True)
+class ToolBundle:
+    """An immutable set of tools together with their precomputed schemas.
+
+    Build it once per process (``NuggetsToolkit.get_tool_bundle()``) and
+    reuse it for every request: ``bind`` hands the cached schema dicts to
+    ``bind_tools``, which accepts provider-format dicts as-is instead of
+    re-deriving them from the pydantic argument models.
+
+    Usage::
+
+        bundle = toolkit.get_tool_bundle()
+        model = ChatOpenAI(model="gpt-4o")
+        agent = create_react_agent(bundle.bind(model), bundle.tools)
+    """
+
+    tools: Tuple[BaseTool, ...]
+    schemas: Tuple[Dict[str, Any], ...]
+    by_name: Mapping[str, BaseTool] = field(repr=False)
+
+    @classmethod
+    def from_tools(cls, tools: Sequence[BaseTool]) -> ToolBundle:
+        tools = tuple(tools)
+        return cls(
+            tools=tools,
+            schemas=tuple(tool_schema(tool) for tool in tools),
+            by_name=MappingProxyType({tool.name: tool for tool in tools}),
+        )
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self.by_name)
+
+    def bind(self, model: Any, **kwargs: Any) -> Any:
+        """Return ``model.bind_tools`` over the cached schemas."""
+        return model.bind_tools(list(self.schemas), **kwargs)
+
+    def __iter__(self) -> Iterator[BaseTool]:
+        return iter(self.tools)
+
+    def __len__(self) -> int:
+        return len(self.tools)
@@ -0,0 +1,427 @@
+"""Local store for finished KYC sessions and credential presentations."""
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, cast
+from urllib.parse import quote
+
+from langchain_nuggets.cache import TTLCache
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+
+KYC = "kyc"
+PRESENTATION = "presentation"
+
+# Mirrors ``KycStatus`` and ``PresentationStatus`` in ``types.py``.
+TERMINAL_STATES: Dict[str, FrozenSet[str]] = {
+    KYC: frozenset({"completed", "failed", "expired"}),
+    PRESENTATION: frozenset({"presented", "rejected", "expired"}),
+}
+
+_PATHS = {
+    KYC: "/kyc/sessions/{}",
+    PRESENTATION: "/credentials/presentations/{}",
+}
+
+
+def session_path(kind: str, session_id: str) -> str:
+    return _PATHS[kind].format(quote(session_id, safe=""))
+
+
+def is_terminal(kind: str, result: Any) -> bool:
+    """Return True if ``result`` is a session in a state that can no longer change."""
+    return isinstance(result, dict) and result.get("status") in TERMINAL_STATES[kind]
+
+
+class SessionStore:
+    """Serves KYC sessions and presentations that reached a terminal state.
+
+    A session that is ``completed``/``failed``/``expired`` (KYC) or
+    ``presented``/``rejected``/``expired`` (presentation) never changes
+    again, so its last API response is kept and returned without a network
+    call. Pending sessions are never stored and always go to the API.
+
+    Results are held in an in-memory LRU of ``max_size`` entries. Pass
+    ``path`` to also persist them in a SQLite file, which survives
+    restarts and backs LRU evictions.
+
+    With ``reuse_window`` (seconds), ``create``/``acreate`` return the
+    session created by an identical earlier request (same path and
+    parameters) instead of starting another one, as long as it is younger
+    than the window and not known to be terminal. Identical concurrent
+    requests share a single API call; a request that waits longer than
+    ``create_timeout`` seconds for it starts its own session instead. The
+    reuse index is in memory only.
+
+    Usage::
+
+        store = SessionStore(path="nuggets-sessions.db", reuse_window=300)
+        toolkit = NuggetsToolkit(..., session_store=store)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        path: Optional[str] = None,
+        reuse_window: Optional[float] = None,
+        create_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self._max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._waiters: Dict[Tuple[str, str], List[Callable[[Dict[str, Any]], None]]] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        # Set by a webhook receiver: terminal states will be pushed to put().
+        self.push_enabled = False
+        self.reuse_window = reuse_window
+        self.create_timeout = create_timeout
+        self._created: Optional[TTLCache[Tuple[str, Dict[str, Any]]]] = None
+        if reuse_window is not None:
+            self._created = TTLCache(max_size=max_size, ttl=reuse_window, clock=clock)
+        self._creating: Dict[str, _Creation] = {}
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "kind TEXT NOT NULL, session_id TEXT NOT NULL, result TEXT NOT NULL, "
+                "PRIMARY KEY (kind, session_id))"
+            )
+            self._db.commit()
+
+    def get(self, kind: str, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored terminal result, or None if the session is unknown."""
+        with self._lock:
+            return self._get_locked((kind, session_id))
+
+    def _get_locked(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            return result
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT result FROM sessions WHERE kind = ? AND session_id = ?", key
+        ).fetchone()
+        if row is None:
+            return None
+        result = _session(json.loads(row[0]))
+        self._remember(key, result)
+        return result
+
+    def put(self, kind: str, session_id: str, result: Dict[str, Any]) -> bool:
+        """Store ``result`` if it is terminal. Returns whether it was stored."""
+        if not is_terminal(kind, result):
+            return False
+        key = (kind, session_id)
+        with self._lock:
+            self._remember(key, result)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sessions (kind, session_id, result) VALUES (?, ?, ?)",
+                    (kind, session_id, json.dumps(result)),
+                )
+                self._db.commit()
+            waiters = self._waiters.pop(key, [])
+        for notify in waiters:
+            notify(result)
+        return True
+
+    def _remember(self, key: Tuple[str, str], result: Dict[str, Any]) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def fetch(self, client: NuggetsApiClient, kind: str, session_id: str) -> Dict[str, Any]:
+        """Return the session, from the store if terminal, else from the API."""
+        result = self.get(kind, session_id)
+        if result is None:
+            result = client.get(session_path(kind, session_id))
+            self.put(kind, session_id, result)
+        return result
+
+    async def afetch(self, client: NuggetsApiClient, kind: str, session_id: str) -> Dict[str, Any]:
+        result = self.get(kind, session_id)
+        if result is None:
+            result = await client.aget(session_path(kind, session_id))
+            self.put(kind, session_id, result)
+        return result
+
+    # --- Session reuse ---
+
+    def _reusable_locked(
+        self, created: TTLCache[Tuple[str, Dict[str, Any]]], key: str
+    ) -> Optional[Dict[str, Any]]:
+        entry = created.get(key)
+        if entry is None:
+            return None
+        kind, result = entry
+        if self._get_locked((kind, result["sessionId"])) is not None:
+            created.invalidate(key)  # finished: the next request starts a new session
+            return None
+        return {**result, "reused": True}
+
+    def _claim(
+        self,
+        created: TTLCache[Tuple[str, Dict[str, Any]]],
+        kind: str,
+        key: str,
+        waiter: Callable[[Any], None],
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Return ``(reusable result, whether the caller must create)``.
+
+        When another identical request is already creating the session,
+        ``waiter`` is registered to receive its ``(result, error)``, or
+        ``_RETRY`` if that request was cancelled.
+        """
+        with self._lock:
+            reused = self._reusable_locked(created, key)
+            if reused is not None:
+                return reused, False
+            creation = self._creating.get(key)
+            if creation is None:
+                self._creating[key] = _Creation(kind)
+                return None, True
+            creation.waiters.append(waiter)
+            return None, False
+
+    def _leave(self, key: str, waiter: Callable[[Any], None]) -> None:
+        with self._lock:
+            creation = self._creating.get(key)
+            if creation is not None and waiter in creation.waiters:
+                creation.waiters.remove(waiter)
+
+    def _finish(
+        self,
+        created: TTLCache[Tuple[str, Dict[str, Any]]],
+        key: str,
+        result: Any,
+        error: Optional[Exception],
+    ) -> None:
+        with self._lock:
+            creation = self._creating.pop(key)
+            if error is None and isinstance(result, dict) and result.get("sessionId"):
+                created.set(key, (creation.kind, result))
+        if error is None and isinstance(result, dict):
+            result = {**result, "reused": True}
+        for waiter in creation.waiters:
+            waiter((result, error))
+
+    def _release(self, key: str) -> None:
+        """Drop a cancelled creation; its waiters claim again."""
+        with self._lock:
+            creation = self._creating.pop(key)
+        for waiter in creation.waiters:
+            waiter(_RETRY)
+
+    def create(
+        self, client: NuggetsApiClient, kind: str, path: str, body: Any, params: Any = None
+    ) -> Dict[str, Any]:
+        """POST ``body`` to ``path`` to start a session, or reuse an identical one.
+
+        ``params`` identifies identical requests and defaults to ``body``.
+        Without a ``reuse_window`` this is a plain ``client.post``. A caller
+        waits at most ``create_timeout`` seconds for an identical request
+        in flight, then starts its own session.
+        """
+        created = self._created
+        if created is None:
+            return _session(client.post(path, body))
+        key = json.dumps([path, body if params is None else params], sort_keys=True)
+        while True:
+            event = threading.Event()
+            shared: List[Any] = []
+
+            def waiter(outcome: Any) -> None:
+                shared.append(outcome)
+                event.set()
+
+            reused, owner = self._claim(created, kind, key, waiter)
+            if reused is not None:
+                return reused
+            if owner:
+                break
+            if not event.wait(self.create_timeout):
+                self._leave(key, waiter)
+                return _session(client.post(path, body))
+            if shared[0] is not _RETRY:
+                return _session(_unwrap(shared[0]))
+        try:
+            result = _session(client.post(path, body))
+        except Exception as exc:
+            self._finish(created, key, None, exc)
+            raise
+        except BaseException:
+            self._release(key)
+            raise
+        self._finish(created, key, result, None)
+        return result
+
+    async def acreate(
+        self, client: NuggetsApiClient, kind: str, path: str, body: Any, params: Any = None
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`create`."""
+        created = self._created
+        if created is None:
+            return _session(await client.apost(path, body))
+        key = json.dumps([path, body if params is None else params], sort_keys=True)
+        loop = asyncio.get_running_loop()
+        while True:
+            future: "asyncio.Future[Any]" = loop.create_future()
+
+            def waiter(outcome: Any, future: "asyncio.Future[Any]" = future) -> None:
+                try:
+                    loop.call_soon_threadsafe(_resolve, future, outcome)
+                except RuntimeError:  # the waiting loop has already closed
+                    pass
+
+            reused, owner = self._claim(created, kind, key, waiter)
+            if reused is not None:
+                return reused
+            if owner:
+                break
+            try:
+                outcome = await asyncio.wait_for(future, self.create_timeout)
+            except asyncio.TimeoutError:
+                self._leave(key, waiter)
+                return _session(await client.apost(path, body))
+            if outcome is not _RETRY:
+                return _session(_unwrap(outcome))
+        try:
+            result = _session(await client.apost(path, body))
+        except Exception as exc:
+            self._finish(created, key, None, exc)
+            raise
+        except BaseException:
+            # Cancelled: let the waiters retry rather than cancelling them too.
+            self._release(key)
+            raise
+        self._finish(created, key, result, None)
+        return result
+
+    # --- Waiting for terminal states ---
+
+    def _subscribe(
+        self, key: Tuple[str, str], notify: Callable[[Dict[str, Any]], None]
+    ) -> Optional[Dict[str, Any]]:
+        """Register ``notify`` unless the session is already terminal."""
+        with self._lock:
+            result = self._get_locked(key)
+            if result is None:
+                self._waiters.setdefault(key, []).append(notify)
+            return result
+
+    def _unsubscribe(self, key: Tuple[str, str], notify: Callable[[Dict[str, Any]], None]) -> None:
+        with self._lock:
+            waiters = self._waiters.get(key)
+            if waiters and notify in waiters:
+                waiters.remove(notify)
+                if not waiters:
+                    del self._waiters[key]
+
+    async def wait(
+        self, kind: str, session_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Wait until the session is stored as terminal; None on timeout.
+
+        Wakes as soon as ``put`` is called for the session from any thread,
+        e.g. by ``NuggetsWebhookReceiver``.
+        """
+        key = (kind, session_id)
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+
+        def notify(result: Dict[str, Any]) -> None:
+            try:
+                loop.call_soon_threadsafe(_resolve, future, result)
+            except RuntimeError:  # the waiting loop has already closed
+                pass
+
+        result = self._subscribe(key, notify)
+        if result is not None:
+            return result
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._unsubscribe(key, notify)
+
+    def wait_sync(
+        self, kind: str, session_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Blocking variant of ``wait`` for synchronous callers."""
+        key = (kind, session_id)
+        event = threading.Event()
+        received: List[Dict[str, Any]] = []
+
+        def notify(result: Dict[str, Any]) -> None:
+            received.append(result)
+            event.set()
+
+        result = self._subscribe(key, notify)
+        if result is not None:
+            return result
+        try:
+            event.wait(timeout)
+            return received[0] if received else None
+        finally:
+            self._unsubscribe(key, notify)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._created is not None:
+                self._created.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM sessions")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class _Creation:
+    """A session creation in flight, shared by identical concurrent requests."""
+
+    __slots__ = ("kind", "waiters")
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.waiters: List[Callable[[Any], None]] = []
+
+
+# Sent to waiters when the request creating their session was cancelled.
+_RETRY = object()
+
+
+def _session(result: Any) -> Dict[str, Any]:
+    """Type an API response or stored row as a session object."""
+    return cast(Dict[str, Any], result)
+
+
+def _unwrap(outcome: Tuple[Any, Optional[Exception]]) -> Any:
+    result, error = outcome
+    if error is not None:
+        raise error
+    return result
+
+
+def _resolve(future: "asyncio.Future[Any]", result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
@@ -0,0 +1,298 @@
+"""Serve several Nuggets partner accounts from one process."""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+from langchain_core.runnables import ensure_config
+from langchain_core.tools import BaseTool
+
+from langchain_nuggets.client.instrumentation import ClientHooks
+from langchain_nuggets.client.limiter import build_limiter
+from langchain_nuggets.client.nuggets_api_client import (
+    DEFAULT_MAX_RESPONSE_BYTES,
+    NuggetsApiClient,
+    NuggetsApiClientError,
+)
+from langchain_nuggets.projection import OutputProjection
+from langchain_nuggets.toolkit import NuggetsToolkit
+
+DEFAULT_TENANT_KEY = "nuggets_tenant_id"
+
+# (include, exclude, groups, compact) arguments of get_tools
+_Selection = Tuple[FrozenSet[str], FrozenSet[str], Optional[FrozenSet[str]], bool]
+
+# tenant_id -> {"partner_id", "partner_secret", optional "api_url"}
+TenantCredentials = Union[
+    Mapping[str, Mapping[str, Any]], Callable[[str], Optional[Mapping[str, Any]]]
+]
+
+
+class TenantClientPool:
+    """LRU of warm per-tenant ``NuggetsApiClient`` instances.
+
+    Every tenant client keeps its own partner token but sends requests
+    through one shared pair of httpx clients, so the number of open
+    connections is bounded by ``limits`` however many tenants are active.
+    At most ``max_tenants`` tenant clients (and their cached tokens) are
+    kept; the least recently used is dropped first.
+    """
+
+    def __init__(
+        self,
+        credentials: TenantCredentials,
+        api_url: Optional[str] = None,
+        max_tenants: int = 256,
+        limits: Optional[httpx.Limits] = None,
+        ca_cert: Optional[str] = None,
+        verify_ssl: bool = True,
+        client_config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._credentials = credentials
+        self.api_url = api_url or ""
+        self._max_tenants = max_tenants
+        self._client_config = dict(client_config or {})
+        verify: Union[bool, str] = False if not verify_ssl else (ca_cert or True)
+        limits = limits or httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        self._http_client = httpx.Client(verify=verify, limits=limits)
+        self._async_http_client = httpx.AsyncClient(verify=verify, limits=limits)
+        self._clients: "OrderedDict[str, NuggetsApiClient]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._closing: Optional["asyncio.Task[None]"] = None
+
+    def client_config(self, api_url: str, partner_id: str, partner_secret: str) -> Dict[str, Any]:
+        """``NuggetsApiClient`` config that sends requests through the shared httpx clients."""
+        return {
+            **self._client_config,
+            "api_url": api_url,
+            "partner_id": partner_id,
+            "partner_secret": partner_secret,
+            "http_client": self._http_client,
+            "async_http_client": self._async_http_client,
+        }
+
+    def _lookup_credentials(self, tenant_id: str) -> Mapping[str, Any]:
+        if callable(self._credentials):
+            found = self._credentials(tenant_id)
+        else:
+            found = self._credentials.get(tenant_id)
+        if not found:
+            raise NuggetsApiClientError(f"Unknown tenant: {tenant_id}", "UNKNOWN_TENANT", 403)
+        return found
+
+    def client_for(self, tenant_id: str) -> NuggetsApiClient:
+        """Return the tenant's client, creating it on first use."""
+        with self._lock:
+            client = self._clients.get(tenant_id)
+            if client is not None:
+                self._clients.move_to_end(tenant_id)
+                return client
+        # Resolve outside the lock: the resolver may call a secrets store.
+        found = self._lookup_credentials(tenant_id)
+        api_url = found.get("api_url") or self.api_url
+        if not api_url:
+            raise ValueError(f"No api_url configured for tenant {tenant_id!r}")
+        created = NuggetsApiClient(
+            self.client_config(api_url, found["partner_id"], found["partner_secret"])
+        )
+        with self._lock:
+            client = self._clients.setdefault(tenant_id, created)
+            self._clients.move_to_end(tenant_id)
+            while len(self._clients) > self._max_tenants:
+                self._clients.popitem(last=False)
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def close(self) -> None:
+        """Close both shared httpx clients.
+
+        Inside a running event loop the async client is closed by a task
+        scheduled on that loop; prefer :meth:`aclose` there.
+        """
+        self._clients.clear()
+        self._http_client.close()
+        if self._async_http_client.is_closed:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._async_http_client.aclose())
+        else:
+            self._closing = loop.create_task(self._async_http_client.aclose())
+
+    async def aclose(self) -> None:
+        """Close both shared httpx clients."""
+        self._clients.clear()
+        self._http_client.close()
+        await self._async_http_client.aclose()
+
+
+class TenantRoutingClient(NuggetsApiClient):
+    """``NuggetsApiClient`` that forwards each call to the current run's tenant.
+
+    The tenant ID is read from ``config["configurable"][tenant_key]`` of the
+    active ``RunnableConfig``, which LangChain propagates into every tool
+    run, so a single set of tool instances can serve all tenants.
+    """
+
+    def __init__(self, pool: TenantClientPool, tenant_key: str = DEFAULT_TENANT_KEY) -> None:
+        # Holds no credentials of its own; requests go to a tenant client.
+        super().__init__(pool.client_config(pool.api_url, "", ""))
+        self.pool = pool
+        self.tenant_key = tenant_key
+
+    def current_client(self) -> NuggetsApiClient:
+        configurable = ensure_config().get("configurable") or {}
+        tenant_id = configurable.get(self.tenant_key)
+        if not tenant_id:
+            raise NuggetsApiClientError(
+                f"No tenant in RunnableConfig configurable[{self.tenant_key!r}]",
+                "TENANT_REQUIRED",
+                400,
+            )
+        return self.pool.client_for(tenant_id)
+
+    def get(self, path: str) -> Any:
+        return self.current_client().get(path)
+
+    def post(self, path: str, body: Any = None) -> Any:
+        return self.current_client().post(path, body)
+
+    async def aget(self, path: str) -> Any:
+        return await self.current_client().aget(path)
+
+    async def apost(self, path: str, body: Any = None) -> Any:
+        return await self.current_client().apost(path, body)
+
+    def warmup(self) -> None:
+        self.current_client().warmup()
+
+    async def awarmup(self) -> None:
+        await self.current_client().awarmup()
+
+    def close(self) -> None:
+        self.pool.close()
+
+    async def aclose(self) -> None:
+        await self.pool.aclose()
+
+
+class MultiTenantNuggetsToolkit(NuggetsToolkit):
+    """Toolkit whose tools serve many partner accounts from one process.
+
+    Tools are built once per ``get_tools`` selection and shared by every
+    tenant; each run selects its partner credentials through
+    ``RunnableConfig``::
+
+        toolkit = MultiTenantNuggetsToolkit(
+            credentials={"acme": {"partner_id": "...", "partner_secret": "..."}},
+            api_url="https://api.nuggets.life",
+        )
+        agent = create_react_agent(model, toolkit.get_tools())
+        agent.invoke(inputs, config={"configurable": {"nuggets_tenant_id": "acme"}})
+
+    ``credentials`` is a mapping or a callable returning a tenant's
+    ``partner_id``, ``partner_secret`` and optionally ``api_url``.
+    Trust-score, agent, session and credential caches are not accepted: a single
+    cache would be shared by every tenant. A ``proof_verifier`` holds only
+    issuer keys and may be shared. ``max_concurrency`` bounds
+    requests across all tenants together.
+    """
+
+    def __init__(
+        self,
+        credentials: TenantCredentials,
+        api_url: Optional[str] = None,
+        tenant_key: str = DEFAULT_TENANT_KEY,
+        max_tenants: int = 256,
+        limits: Optional[httpx.Limits] = None,
+        ca_cert: Optional[str] = None,
+        verify_ssl: bool = True,
+        hooks: Optional[ClientHooks] = None,
+        max_response_bytes: Optional[int] = DEFAULT_MAX_RESPONSE_BYTES,
+        compress_requests: Optional[str] = None,
+        proof_verifier: Optional[Any] = None,
+        output_projection: Optional[OutputProjection] = None,
+        max_concurrency: Optional[int] = None,
+        max_concurrency_per_run: Optional[int] = None,
+    ) -> None:
+        limiter = build_limiter(max_concurrency, max_concurrency_per_run)
+        self._pool = TenantClientPool(
+            credentials,
+            api_url=api_url or os.environ.get("NUGGETS_API_URL", ""),
+            max_tenants=max_tenants,
+            limits=limits,
+            ca_cert=ca_cert,
+            verify_ssl=verify_ssl,
+            client_config={
+                "hooks": hooks,
+                "max_response_bytes": max_response_bytes,
+                "compress_requests": compress_requests,
+                "limiter": limiter,
+            },
+        )
+        self._setup(
+            TenantRoutingClient(self._pool, tenant_key),
+            limiter,
+            proof_verifier=proof_verifier,
+            output_projection=output_projection,
+        )
+        self._tools: Dict[_Selection, List[BaseTool]] = {}
+        self._tools_lock = threading.Lock()
+
+    @property
+    def pool(self) -> TenantClientPool:
+        return self._pool
+
+    def get_tools(
+        self,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        groups: Optional[Iterable[str]] = None,
+        compact: bool = False,
+    ) -> List[BaseTool]:
+        """Return the selected tools, built on the first call for each selection.
+
+        Tools hold no per-tenant state, so the same instances are returned
+        for every tenant and every call with the same arguments.
+        """
+        include = list(include or ())
+        exclude = list(exclude or ())
+        groups = None if groups is None else list(groups)
+        key: _Selection = (
+            frozenset(include),
+            frozenset(exclude),
+            None if groups is None else frozenset(groups),
+            compact,
+        )
+        with self._tools_lock:
+            tools = self._tools.get(key)
+            if tools is None:
+                tools = super().get_tools(include, exclude, groups, compact)
+                self._tools[key] = tools
+        return list(tools)
+
+    def warmup(self, tenant_ids: Iterable[str] = ()) -> None:
+        """Authenticate the given tenants ahead of their first run."""
+        for tenant_id in tenant_ids:
+            self._pool.client_for(tenant_id).warmup()
+
+    async def awarmup(self, tenant_ids: Iterable[str] = ()) -> None:
+        await asyncio.gather(*(self._pool.client_for(t).awarmup() for t in tenant_ids))
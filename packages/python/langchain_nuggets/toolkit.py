@@ -2,18 +2,32 @@
 from __future__ import annotations
 
 import os
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 from langchain_core.tools import BaseTool
 
-from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.client.instrumentation import ClientHooks
+from langchain_nuggets.client.limiter import RequestLimiter, build_limiter
+from langchain_nuggets.client.nuggets_api_client import (
+    DEFAULT_MAX_RESPONSE_BYTES,
+    NuggetsApiClient,
+)
+from langchain_nuggets.credentials import CredentialCache
+from langchain_nuggets.did import AgentResolver
+from langchain_nuggets.projection import OutputProjection
+from langchain_nuggets.schemas import ToolBundle
+from langchain_nuggets.sessions import SessionStore
 from langchain_nuggets.tools.auth import (
     CheckAuthStatus,
     InitiateOAuthFlow,
     RequestCredentialPresentation,
     VerifyPresentation,
+    WaitForPresentation,
 )
+from langchain_nuggets.tools.base import NuggetsBaseTool
 from langchain_nuggets.tools.kya import (
+    BatchGetAgentTrustScores,
+    BatchVerifyAgentIdentities,
     GetAgentTrustScore,
     RegisterAgentIdentity,
     VerifyAgentIdentity,
@@ -23,7 +37,32 @@ from langchain_nuggets.tools.kyc import (
     InitiateKycVerification,
     VerifyAge,
     VerifyCredential,
+    WaitForKycCompletion,
 )
+from langchain_nuggets.trust import TrustScoreCache
+
+# name -> (group, class, extra dependencies: "session", "trust", "credentials", "proofs", "agents").
+# Order here is the order tools are returned in.
+_TOOL_SPECS: Dict[str, Tuple[str, Type[NuggetsBaseTool], Tuple[str, ...]]] = {
+    "initiate_kyc_verification": ("kyc", InitiateKycVerification, ("session",)),
+    "check_kyc_status": ("kyc", CheckKycStatus, ("session", "credentials")),
+    "verify_age": ("kyc", VerifyAge, ("session",)),
+    "verify_credential": ("kyc", VerifyCredential, ("credentials",)),
+    "register_agent_identity": ("kya", RegisterAgentIdentity, ("trust", "agents")),
+    "verify_agent_identity": ("kya", VerifyAgentIdentity, ("agents",)),
+    "get_agent_trust_score": ("kya", GetAgentTrustScore, ("trust",)),
+    "request_credential_presentation": ("auth", RequestCredentialPresentation, ("session", "credentials")),
+    "verify_presentation": ("auth", VerifyPresentation, ("session", "credentials", "proofs")),
+    "initiate_oauth_flow": ("auth", InitiateOAuthFlow, ()),
+    "check_auth_status": ("auth", CheckAuthStatus, ()),
+    "wait_for_kyc_completion": ("wait", WaitForKycCompletion, ("session", "credentials")),
+    "wait_for_presentation": ("wait", WaitForPresentation, ("session", "credentials", "proofs")),
+    "batch_verify_agent_identities": ("batch", BatchVerifyAgentIdentities, ("trust", "agents")),
+    "batch_get_agent_trust_scores": ("batch", BatchGetAgentTrustScores, ("trust",)),
+}
+
+TOOL_GROUPS: Tuple[str, ...] = ("kyc", "kya", "auth", "wait", "batch")
+DEFAULT_TOOL_GROUPS: Tuple[str, ...] = ("kyc", "kya", "auth")
 
 
 class NuggetsToolkit:
@@ -33,6 +72,15 @@ class NuggetsToolkit:
     - NUGGETS_API_URL
     - NUGGETS_PARTNER_ID
     - NUGGETS_PARTNER_SECRET
+
+    Set ``max_concurrency`` (and optionally ``max_concurrency_per_run``) to
+    bound in-flight API requests with a ``RequestLimiter``; share it with
+    ``MiddlewareConfig(limiter=toolkit.limiter)`` so authority checks use
+    the same budget and its priority lane.
+
+    Pass a ``ProofVerifier`` as ``proof_verifier`` to check presented
+    credential proofs locally; presentation results then include a
+    ``proofVerification`` report.
     """
 
     def __init__(
@@ -42,6 +90,17 @@ class NuggetsToolkit:
         partner_secret: Optional[str] = None,
         ca_cert: Optional[str] = None,
         verify_ssl: bool = True,
+        hooks: Optional[ClientHooks] = None,
+        max_response_bytes: Optional[int] = DEFAULT_MAX_RESPONSE_BYTES,
+        compress_requests: Optional[str] = None,
+        trust_score_cache: Optional[TrustScoreCache] = None,
+        agent_resolver: Optional[AgentResolver] = None,
+        session_store: Optional[SessionStore] = None,
+        credential_cache: Optional[CredentialCache] = None,
+        proof_verifier: Optional[Any] = None,
+        output_projection: Optional[OutputProjection] = None,
+        max_concurrency: Optional[int] = None,
+        max_concurrency_per_run: Optional[int] = None,
     ) -> None:
         resolved_api_url = api_url or os.environ.get("NUGGETS_API_URL", "")
         resolved_partner_id = partner_id or os.environ.get("NUGGETS_PARTNER_ID", "")
@@ -54,27 +113,145 @@ class NuggetsToolkit:
                 "NUGGETS_PARTNER_SECRET environment variables."
             )
 
-        self._client = NuggetsApiClient({
+        limiter = build_limiter(max_concurrency, max_concurrency_per_run)
+        client = NuggetsApiClient({
             "api_url": resolved_api_url,
             "partner_id": resolved_partner_id,
             "partner_secret": resolved_partner_secret,
             "ca_cert": ca_cert,
             "verify_ssl": verify_ssl,
+            "hooks": hooks,
+            "max_response_bytes": max_response_bytes,
+            "compress_requests": compress_requests,
+            "limiter": limiter,
         })
+        self._setup(
+            client,
+            limiter,
+            trust_score_cache=trust_score_cache,
+            agent_resolver=agent_resolver,
+            session_store=session_store,
+            credential_cache=credential_cache,
+            proof_verifier=proof_verifier,
+            output_projection=output_projection,
+        )
+
+    def _setup(
+        self,
+        client: NuggetsApiClient,
+        limiter: Optional[RequestLimiter],
+        trust_score_cache: Optional[TrustScoreCache] = None,
+        agent_resolver: Optional[AgentResolver] = None,
+        session_store: Optional[SessionStore] = None,
+        credential_cache: Optional[CredentialCache] = None,
+        proof_verifier: Optional[Any] = None,
+        output_projection: Optional[OutputProjection] = None,
+    ) -> None:
+        """Set the state tools are built from; shared by subclasses that build their own client."""
+        self._client = client
+        self._limiter = limiter
+        self._trust_score_cache = trust_score_cache
+        self._agent_resolver = agent_resolver
+        self._session_store = session_store
+        self._credential_cache = credential_cache
+        self._proof_verifier = proof_verifier
+        self._output_projection = output_projection
+        self._bundle: Optional[ToolBundle] = None
+
+    @property
+    def limiter(self) -> Optional[RequestLimiter]:
+        """The toolkit's request limiter, or None when concurrency is unbounded."""
+        return self._limiter
+
+    def warmup(self) -> None:
+        """Pre-authenticate and open the sync connection pool."""
+        self._client.warmup()
+
+    async def awarmup(self) -> None:
+        """Pre-authenticate and open the async connection pool.
+
+        Call from an ASGI lifespan or LangGraph server startup so the first
+        tool call does not pay for partner authentication and TLS setup.
+        """
+        await self._client.awarmup()
+
+    def _tool_params(self) -> Dict[str, Any]:
+        return {"client": self._client, "output_projection": self._output_projection}
+
+    def _params_for(self, needs: Tuple[str, ...]) -> Dict[str, Any]:
+        params = self._tool_params()
+        if "session" in needs:
+            params["session_store"] = self._session_store
+        if "trust" in needs:
+            params["trust_cache"] = self._trust_score_cache
+        if "agents" in needs:
+            params["agent_resolver"] = self._agent_resolver
+        if "credentials" in needs:
+            params["credential_cache"] = self._credential_cache
+        if "proofs" in needs:
+            params["proof_verifier"] = self._proof_verifier
+        return params
+
+    def get_tools(
+        self,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        groups: Optional[Iterable[str]] = None,
+        compact: bool = False,
+    ) -> List[BaseTool]:
+        """Return Nuggets tools; by default the 11 core identity verification tools.
+
+        Args:
+            include: Tool names to add on top of ``groups``.
+            exclude: Tool names to drop.
+            groups: Tool groups to return: ``"kyc"``, ``"kya"``, ``"auth"``,
+                ``"wait"`` and ``"batch"``. Defaults to ``kyc``, ``kya`` and
+                ``auth``, or to nothing when only ``include`` is given.
+            compact: Use one-line tool descriptions to shrink the prompt.
+
+        Only the selected tools are constructed.
+        """
+        include = list(include or ())
+        exclude = set(exclude or ())
+        if groups is None:
+            groups = () if include else DEFAULT_TOOL_GROUPS
+        groups = set(groups)
+        unknown_groups = groups - set(TOOL_GROUPS)
+        unknown_tools = (set(include) | exclude) - set(_TOOL_SPECS)
+        if unknown_groups or unknown_tools:
+            raise ValueError(
+                f"Unknown tool groups {sorted(unknown_groups)} or tools {sorted(unknown_tools)}"
+            )
+        selected = set(include)
+        tools: List[BaseTool] = []
+        for name, (group, tool_class, needs) in _TOOL_SPECS.items():
+            if (group not in groups and name not in selected) or name in exclude:
+                continue
+            params = self._params_for(needs)
+            if compact and tool_class.compact_description:
+                params["description"] = tool_class.compact_description
+            tools.append(tool_class(**params))
+        return tools
+
+    def get_wait_tools(self) -> List[BaseTool]:
+        """Return tools that block until a KYC session or presentation finishes.
+
+        Each call polls in-process with adaptive backoff, replacing a series
+        of ``check_kyc_status`` / ``verify_presentation`` calls by the agent.
+        """
+        return self.get_tools(groups=["wait"])
+
+    def get_batch_tools(self) -> List[BaseTool]:
+        """Return tools that verify or score many agents in a single call."""
+        return self.get_tools(groups=["batch"])
+
+    def get_tool_bundle(self) -> ToolBundle:
+        """Return the ``get_tools()`` tools with precomputed schemas, built once."""
+        if self._bundle is None:
+            self._bundle = ToolBundle.from_tools(self.get_tools())
+        return self._bundle
+
+    def get_tool_schemas(self) -> List[Dict[str, Any]]:
+        """Return provider-ready (OpenAI format) schemas for ``get_tools()``."""
+        return list(self.get_tool_bundle().schemas)
 
-    def get_tools(self) -> List[BaseTool]:
-        """Return all 11 Nuggets identity verification tools."""
-        params = {"client": self._client}
-        return [
-            InitiateKycVerification(**params),
-            CheckKycStatus(**params),
-            VerifyAge(**params),
-            VerifyCredential(**params),
-            RegisterAgentIdentity(**params),
-            VerifyAgentIdentity(**params),
-            GetAgentTrustScore(**params),
-            RequestCredentialPresentation(**params),
-            VerifyPresentation(**params),
-            InitiateOAuthFlow(**params),
-            CheckAuthStatus(**params),
-        ]
@@ -5,10 +5,12 @@ from langchain_nuggets.tools.auth.request_credential_presentation import (
     RequestCredentialPresentation,
 )
 from langchain_nuggets.tools.auth.verify_presentation import VerifyPresentation
+from langchain_nuggets.tools.auth.wait_for_presentation import WaitForPresentation
 
 __all__ = [
     "RequestCredentialPresentation",
     "VerifyPresentation",
     "InitiateOAuthFlow",
     "CheckAuthStatus",
+    "WaitForPresentation",
 ]
@@ -2,13 +2,12 @@
 from __future__ import annotations
 from urllib.parse import quote
 
-import json
-from typing import Optional, Type
+from typing import ClassVar, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class CheckAuthStatusInput(BaseModel):
@@ -18,12 +17,13 @@ class CheckAuthStatusInput(BaseModel):
 class CheckAuthStatus(NuggetsBaseTool):
     name: str = "check_auth_status"
     description: str = "Check whether a user is currently authenticated with Nuggets and their verification status. Returns whether the user is authenticated, their KYC verification status, and which credentials they have on file. Use this to gate access to sensitive operations that require verified identity."
+    compact_description: ClassVar[str] = "Check a user's Nuggets auth and KYC status."
     args_schema: Type[BaseModel] = CheckAuthStatusInput
 
-    def _run(self, userId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+    def _run(self, userId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
         result = self.client.get(f"/auth/status/{quote(userId, safe="")}")
-        return json.dumps(result)
+        return self._format_result(result)
 
-    async def _arun(self, userId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
+    async def _arun(self, userId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
         result = await self.client.aget(f"/auth/status/{quote(userId, safe="")}")
-        return json.dumps(result)
+        return self._format_result(result)
@@ -1,13 +1,12 @@
 """Initiate OAuth flow tool."""
 from __future__ import annotations
 
-import json
-from typing import List, Optional, Type
+from typing import ClassVar, List, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class InitiateOAuthFlowInput(BaseModel):
@@ -18,12 +17,13 @@ class InitiateOAuthFlowInput(BaseModel):
 class InitiateOAuthFlow(NuggetsBaseTool):
     name: str = "initiate_oauth_flow"
     description: str = "Start an OAuth 2.0 / OpenID Connect authentication flow with Nuggets as the identity provider. Returns an authorization URL that the user should be redirected to. After the user authenticates via Nuggets (QR scan, biometrics, or WebAuthn), they will be redirected back to the redirectUri with an authorization code."
+    compact_description: ClassVar[str] = "Start an OAuth/OIDC login with Nuggets; returns an authorization URL."
     args_schema: Type[BaseModel] = InitiateOAuthFlowInput
 
-    def _run(self, redirectUri: str, scopes: Optional[List[str]] = None, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+    def _run(self, redirectUri: str, scopes: Optional[List[str]] = None, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
         result = self.client.post("/oauth/authorize", {"redirectUri": redirectUri, "scopes": scopes or ["openid"]})
-        return json.dumps(result)
+        return self._format_result(result)
 
-    async def _arun(self, redirectUri: str, scopes: Optional[List[str]] = None, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
+    async def _arun(self, redirectUri: str, scopes: Optional[List[str]] = None, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
         result = await self.client.apost("/oauth/authorize", {"redirectUri": redirectUri, "scopes": scopes or ["openid"]})
-        return json.dumps(result)
+        return self._format_result(result)
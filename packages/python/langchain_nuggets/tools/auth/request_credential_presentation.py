@@ -1,13 +1,14 @@
 """Request credential presentation tool."""
 from __future__ import annotations
 
-import json
-from typing import List, Optional, Type
+from typing import Any, ClassVar, Dict, List, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.credentials import CredentialCache, cached_presentation_result
+from langchain_nuggets.sessions import PRESENTATION, SessionStore
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class RequestCredentialPresentationInput(BaseModel):
@@ -18,12 +19,48 @@ class RequestCredentialPresentationInput(BaseModel):
 class RequestCredentialPresentation(NuggetsBaseTool):
     name: str = "request_credential_presentation"
     description: str = "Ask a user to present one or more verifiable credentials from their Nuggets app. Specify which credential types you need. The user will see a request in their app and can approve or reject sharing each credential. Use verify_presentation with the returned sessionId to check if the user responded."
+    compact_description: ClassVar[str] = "Ask a user to present verifiable credentials; returns a sessionId."
     args_schema: Type[BaseModel] = RequestCredentialPresentationInput
+    session_store: Optional[SessionStore] = None
+    credential_cache: Optional[CredentialCache] = None
 
-    def _run(self, userId: str, credentialTypes: List[str], run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
-        result = self.client.post("/credentials/presentations", {"userId": userId, "credentialTypes": credentialTypes})
-        return json.dumps(result)
+    def _run(self, userId: str, credentialTypes: List[str], run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        cached = self._cached(userId, credentialTypes)
+        if cached is not None:
+            return self._format_result(cached)
+        body = {"userId": userId, "credentialTypes": credentialTypes}
+        if self.session_store is not None:
+            result = self.session_store.create(self.client, PRESENTATION, "/credentials/presentations", body, _reuse_params(body))
+        else:
+            result = self.client.post("/credentials/presentations", body)
+        return self._tracked(result, userId, credentialTypes)
 
-    async def _arun(self, userId: str, credentialTypes: List[str], run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
-        result = await self.client.apost("/credentials/presentations", {"userId": userId, "credentialTypes": credentialTypes})
-        return json.dumps(result)
+    async def _arun(self, userId: str, credentialTypes: List[str], run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        cached = self._cached(userId, credentialTypes)
+        if cached is not None:
+            return self._format_result(cached)
+        body = {"userId": userId, "credentialTypes": credentialTypes}
+        if self.session_store is not None:
+            result = await self.session_store.acreate(self.client, PRESENTATION, "/credentials/presentations", body, _reuse_params(body))
+        else:
+            result = await self.client.apost("/credentials/presentations", body)
+        return self._tracked(result, userId, credentialTypes)
+
+    def _cached(self, userId: str, credentialTypes: List[str]) -> Optional[Dict[str, Any]]:
+        if self.credential_cache is None:
+            return None
+        credentials = self.credential_cache.get_all(userId, credentialTypes)
+        if credentials is None:
+            return None
+        session_ids = self.credential_cache.session_ids(userId, credentialTypes)
+        return cached_presentation_result(credentials, session_ids)
+
+    def _tracked(self, result: Any, userId: str, credentialTypes: List[str]) -> ToolResult:
+        if self.credential_cache is not None:
+            self.credential_cache.track(result, userId, credentialTypes)
+        return self._format_result(result)
+
+
+def _reuse_params(body: Dict[str, Any]) -> Dict[str, Any]:
+    # The same credential types in any order are the same request.
+    return {**body, "credentialTypes": sorted(set(body["credentialTypes"]))}
@@ -1,14 +1,14 @@
 """Verify presentation tool."""
 from __future__ import annotations
-from urllib.parse import quote
 
-import json
-from typing import Optional, Type
+from typing import Any, ClassVar, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.credentials import CredentialCache
+from langchain_nuggets.sessions import PRESENTATION, SessionStore, session_path
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class VerifyPresentationInput(BaseModel):
@@ -18,12 +18,31 @@ class VerifyPresentationInput(BaseModel):
 class VerifyPresentation(NuggetsBaseTool):
     name: str = "verify_presentation"
     description: str = 'Check the status of a credential presentation request and cryptographically verify any presented credentials. Returns status: "pending" (awaiting user), "presented" (user shared credentials), "rejected" (user declined), or "expired". If presented, includes the verified credentials and a verified boolean.'
+    compact_description: ClassVar[str] = "Get a credential presentation's status and verified credentials."
     args_schema: Type[BaseModel] = VerifyPresentationInput
-
-    def _run(self, sessionId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
-        result = self.client.get(f"/credentials/presentations/{quote(sessionId, safe="")}")
-        return json.dumps(result)
-
-    async def _arun(self, sessionId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
-        result = await self.client.aget(f"/credentials/presentations/{quote(sessionId, safe="")}")
-        return json.dumps(result)
+    session_store: Optional[SessionStore] = None
+    credential_cache: Optional[CredentialCache] = None
+    # ProofVerifier; imported lazily by callers since it needs PyJWT[crypto]
+    proof_verifier: Optional[Any] = None
+
+    def _run(self, sessionId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        if self.session_store is not None:
+            result = self.session_store.fetch(self.client, PRESENTATION, sessionId)
+        else:
+            result = self.client.get(session_path(PRESENTATION, sessionId))
+        if self.proof_verifier is not None:
+            result = self.proof_verifier.check_result(result)
+        if self.credential_cache is not None:
+            self.credential_cache.observe(PRESENTATION, sessionId, result)
+        return self._format_result(result)
+
+    async def _arun(self, sessionId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        if self.session_store is not None:
+            result = await self.session_store.afetch(self.client, PRESENTATION, sessionId)
+        else:
+            result = await self.client.aget(session_path(PRESENTATION, sessionId))
+        if self.proof_verifier is not None:
+            result = await self.proof_verifier.acheck_result(result)
+        if self.credential_cache is not None:
+            self.credential_cache.observe(PRESENTATION, sessionId, result)
+        return self._format_result(result)
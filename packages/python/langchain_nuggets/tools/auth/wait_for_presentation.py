@@ -0,0 +1,54 @@
+"""Wait for presentation tool."""
+from __future__ import annotations
+
+from typing import Any, ClassVar, Optional, Type
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from pydantic import BaseModel, Field
+
+from langchain_nuggets.credentials import CredentialCache
+from langchain_nuggets.polling import (
+    DEFAULT_POLL_POLICY,
+    PollPolicy,
+    await_session,
+    wait_for_session,
+)
+from langchain_nuggets.sessions import PRESENTATION, SessionStore
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
+
+
+class WaitForPresentationInput(BaseModel):
+    sessionId: str = Field(description="The presentation session ID returned by request_credential_presentation")
+    timeoutSeconds: float = Field(default=120, description="Maximum time to wait, in seconds")
+
+
+class WaitForPresentation(NuggetsBaseTool):
+    name: str = "wait_for_presentation"
+    description: str = 'Wait until the user responds to a credential presentation request, then return the verified result. Use this instead of calling verify_presentation repeatedly. Returns status "presented" (with credentials and a verified boolean), "rejected" or "expired"; if the user has not responded within timeoutSeconds, returns the current "pending" state with timedOut: true.'
+    compact_description: ClassVar[str] = "Wait until a credential presentation is presented/rejected/expired."
+    args_schema: Type[BaseModel] = WaitForPresentationInput
+    session_store: Optional[SessionStore] = None
+    credential_cache: Optional[CredentialCache] = None
+    # ProofVerifier; imported lazily by callers since it needs PyJWT[crypto]
+    proof_verifier: Optional[Any] = None
+    poll_policy: PollPolicy = DEFAULT_POLL_POLICY
+
+    def _run(self, sessionId: str, timeoutSeconds: float = 120, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        result = wait_for_session(
+            self.client, PRESENTATION, sessionId, timeoutSeconds, self.session_store, self.poll_policy
+        )
+        if self.proof_verifier is not None:
+            result = self.proof_verifier.check_result(result)
+        if self.credential_cache is not None:
+            self.credential_cache.observe(PRESENTATION, sessionId, result)
+        return self._format_result(result)
+
+    async def _arun(self, sessionId: str, timeoutSeconds: float = 120, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        result = await await_session(
+            self.client, PRESENTATION, sessionId, timeoutSeconds, self.session_store, self.poll_policy
+        )
+        if self.proof_verifier is not None:
+            result = await self.proof_verifier.acheck_result(result)
+        if self.credential_cache is not None:
+            self.credential_cache.observe(PRESENTATION, sessionId, result)
+        return self._format_result(result)
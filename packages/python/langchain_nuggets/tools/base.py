@@ -2,28 +2,141 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, ClassVar, Dict, Optional, Tuple, Union
 
+from langchain_core.callbacks import CallbackManager
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableConfig, ensure_config
+from langchain_core.runnables.config import var_child_runnable_config
 from langchain_core.tools import BaseTool
-from pydantic import ConfigDict
+from pydantic import BaseModel, ConfigDict, ValidationError, model_validator
 
+from langchain_nuggets import tracing
+from langchain_nuggets.batch import error_payload
 from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
+from langchain_nuggets.projection import OutputProjection
+
+# A JSON string, or ``(content, artifact)`` when an output projection is set.
+ToolResult = Union[str, Tuple[str, Any]]
 
 
 class NuggetsBaseTool(BaseTool):
     """Base tool that holds a reference to the Nuggets API client.
 
-    Wraps invoke to catch NuggetsApiClientError and return structured
-    JSON error strings instead of crashing the agent loop.
+    Wraps invoke and ainvoke to catch NuggetsApiClientError and return
+    structured JSON errors instead of crashing the agent loop. Each run is
+    traced as an ``execute_tool`` span when OpenTelemetry is installed.
+
+    When no callback handlers are configured (no tracer, no verbose or
+    debug mode, no callbacks in the config), invocations skip LangChain's
+    run-manager bookkeeping and call ``_run``/``_arun`` directly with the
+    validated arguments. Anything else takes the regular ``BaseTool`` path.
+
+    With an ``output_projection`` the tool uses the ``content_and_artifact``
+    response format: the LLM sees the projected JSON and the full API
+    response is attached to the ``ToolMessage`` as its artifact.
     """
 
+    # One-line description used by ``NuggetsToolkit.get_tools(compact=True)``.
+    compact_description: ClassVar[Optional[str]] = None
+
     client: NuggetsApiClient
+    output_projection: Optional[OutputProjection] = None
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def invoke(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+    @model_validator(mode="after")
+    def _use_artifacts_with_projection(self) -> NuggetsBaseTool:
+        if self.output_projection is not None:
+            self.response_format = "content_and_artifact"
+        return self
+
+    def _format_result(self, result: Any) -> ToolResult:
+        if self.output_projection is None:
+            return json.dumps(result)
+        return self.output_projection.render(self.name, result), result
+
+    def _error_result(self, tool_call_id: Optional[str], exc: NuggetsApiClientError) -> Any:
+        content = json.dumps(error_payload(exc))
+        if tool_call_id is None:
+            return content
+        return ToolMessage(content, tool_call_id=tool_call_id, name=self.name, status="error")
+
+    def _fast_args(self, input: Any, config: RunnableConfig) -> Optional[Dict[str, Any]]:
+        """Validated ``_run`` kwargs, or None if the full callback path is needed."""
+        if (
+            not isinstance(input, dict)
+            or self.callbacks is not None
+            or self.verbose
+            or self.handle_tool_error
+            or config.get("callbacks") is not None
+            or not (isinstance(self.args_schema, type) and issubclass(self.args_schema, BaseModel))
+        ):
+            return None
+        # Global tracers, debug mode and registered hooks are resolved here.
+        if CallbackManager.configure(None, None, False).handlers:
+            return None
+        args = input["args"] if input.get("type") == "tool_call" else input
         try:
-            return super().invoke(input, config, **kwargs)
+            validated = self.args_schema.model_validate(args)
+        except ValidationError:
+            return None  # let BaseTool apply handle_validation_error
+        return {name: getattr(validated, name) for name in type(validated).model_fields}
+
+    def _fast_output(self, response: Any, tool_call_id: Optional[str]) -> Any:
+        artifact = None
+        if self.response_format == "content_and_artifact":
+            response, artifact = response
+        if tool_call_id is None:
+            return response
+        return ToolMessage(response, artifact=artifact, tool_call_id=tool_call_id, name=self.name)
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        config = ensure_config(config)
+        tool_call_id = _tool_call_id(input)
+        try:
+            fast_args = None if kwargs else self._fast_args(input, config)
+            if fast_args is None:
+                return super().invoke(input, config, **kwargs)
+            with tracing.tool_span(self.name, tool_call_id):
+                token = var_child_runnable_config.set(config)
+                try:
+                    response = self._run(**fast_args)
+                finally:
+                    var_child_runnable_config.reset(token)
+            return self._fast_output(response, tool_call_id)
+        except NuggetsApiClientError as exc:
+            return self._error_result(tool_call_id, exc)
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        config = ensure_config(config)
+        tool_call_id = _tool_call_id(input)
+        try:
+            fast_args = None if kwargs else self._fast_args(input, config)
+            if fast_args is None:
+                return await super().ainvoke(input, config, **kwargs)
+            with tracing.tool_span(self.name, tool_call_id):
+                token = var_child_runnable_config.set(config)
+                try:
+                    response = await self._arun(**fast_args)
+                finally:
+                    var_child_runnable_config.reset(token)
+            return self._fast_output(response, tool_call_id)
         except NuggetsApiClientError as exc:
-            return json.dumps(
-                {"error": True, "code": exc.code, "message": str(exc), "status_code": exc.status_code}
-            )
+            return self._error_result(tool_call_id, exc)
+
+    def run(self, *args: Any, **kwargs: Any) -> Any:
+        with tracing.tool_span(self.name, kwargs.get("tool_call_id")):
+            return super().run(*args, **kwargs)
+
+    async def arun(self, *args: Any, **kwargs: Any) -> Any:
+        with tracing.tool_span(self.name, kwargs.get("tool_call_id")):
+            return await super().arun(*args, **kwargs)
+
+
+def _tool_call_id(input: Any) -> Optional[str]:
+    if isinstance(input, dict) and input.get("type") == "tool_call":
+        call_id = input.get("id")
+        return call_id if isinstance(call_id, str) else None
+    return None
@@ -1,5 +1,8 @@
 """KYA (Know Your Agent) identity verification tools."""
+from langchain_nuggets.tools.kya.batch_get_agent_trust_scores import BatchGetAgentTrustScores
+from langchain_nuggets.tools.kya.batch_verify_agent_identities import BatchVerifyAgentIdentities
 from langchain_nuggets.tools.kya.get_agent_trust_score import GetAgentTrustScore
+from langchain_nuggets.tools.kya.query_agent_trust import QueryAgentTrust
 from langchain_nuggets.tools.kya.register_agent_identity import RegisterAgentIdentity
 from langchain_nuggets.tools.kya.verify_agent_identity import VerifyAgentIdentity
 
@@ -7,4 +10,7 @@ __all__ = [
     "RegisterAgentIdentity",
     "VerifyAgentIdentity",
     "GetAgentTrustScore",
+    "BatchVerifyAgentIdentities",
+    "BatchGetAgentTrustScores",
+    "QueryAgentTrust",
 ]
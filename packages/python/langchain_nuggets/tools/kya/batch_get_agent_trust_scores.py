@@ -0,0 +1,40 @@
+"""Batch get agent trust scores tool."""
+from __future__ import annotations
+
+from typing import Any, ClassVar, Dict, List, Optional, Type
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from pydantic import BaseModel, Field
+
+from langchain_nuggets.batch import arun_batch, run_batch
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
+from langchain_nuggets.trust import TrustScoreCache, aget_trust_score, get_trust_score
+
+MAX_BATCH_SIZE = 100
+
+
+class BatchGetAgentTrustScoresInput(BaseModel):
+    agentIds: List[str] = Field(
+        description="The agent IDs or DIDs to score", min_length=1, max_length=MAX_BATCH_SIZE
+    )
+
+
+class BatchGetAgentTrustScores(NuggetsBaseTool):
+    name: str = "batch_get_agent_trust_scores"
+    description: str = "Get trust scores (0-1) for many AI agents in one call. Use this instead of calling get_agent_trust_score once per agent. Returns an object keyed by agent ID; each value is that agent's trust score, or an error object if it could not be scored."
+    compact_description: ClassVar[str] = "Get trust scores for many agents at once."
+    args_schema: Type[BaseModel] = BatchGetAgentTrustScoresInput
+    trust_cache: Optional[TrustScoreCache] = None
+    max_concurrency: int = 8
+
+    def _get_score(self, agent_id: str) -> Dict[str, Any]:
+        return get_trust_score(self.client, agent_id, self.trust_cache)
+
+    async def _aget_score(self, agent_id: str) -> Dict[str, Any]:
+        return await aget_trust_score(self.client, agent_id, self.trust_cache)
+
+    def _run(self, agentIds: List[str], run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        return self._format_result(run_batch(agentIds, self._get_score, self.max_concurrency))
+
+    async def _arun(self, agentIds: List[str], run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        return self._format_result(await arun_batch(agentIds, self._aget_score, self.max_concurrency))
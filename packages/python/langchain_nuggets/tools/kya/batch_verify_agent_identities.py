@@ -0,0 +1,93 @@
+"""Batch verify agent identities tool."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from pydantic import BaseModel, Field
+
+from langchain_nuggets.batch import IN_FLIGHT, arun_batch, lookup_key, run_batch, unique
+from langchain_nuggets.did import AgentResolver, agent_path
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
+from langchain_nuggets.tools.kya.batch_get_agent_trust_scores import MAX_BATCH_SIZE
+from langchain_nuggets.trust import TrustScoreCache, aget_trust_score, get_trust_score
+
+# (lookup kind, agent ID): identity and score lookups share one sync batch.
+_Lookup = Tuple[str, str]
+
+
+class BatchVerifyAgentIdentitiesInput(BaseModel):
+    agentIds: List[str] = Field(
+        description="The agent IDs or DIDs to verify", min_length=1, max_length=MAX_BATCH_SIZE
+    )
+    includeTrustScores: bool = Field(default=True, description="Also return each agent's trust score")
+
+
+def _combine(identities: Dict[str, Any], scores: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    combined = {}
+    for agent_id in identities:
+        entry = {"identity": identities[agent_id]}
+        if scores is not None:
+            entry["trustScore"] = scores[agent_id]
+        combined[agent_id] = entry
+    return combined
+
+
+class BatchVerifyAgentIdentities(NuggetsBaseTool):
+    name: str = "batch_verify_agent_identities"
+    description: str = "Verify many AI agents' identities in one call, optionally with their trust scores. Use this to vet several counterparties at once instead of calling verify_agent_identity and get_agent_trust_score per agent. Returns an object keyed by agent ID with identity (DID, provenance signals, registration date) and trustScore; failed lookups are reported per agent as error objects."
+    compact_description: ClassVar[str] = "Verify many agents' identities (and trust scores) at once."
+    args_schema: Type[BaseModel] = BatchVerifyAgentIdentitiesInput
+    trust_cache: Optional[TrustScoreCache] = None
+    agent_resolver: Optional[AgentResolver] = None
+    max_concurrency: int = 8
+
+    def _get_identity(self, agent_id: str) -> Dict[str, Any]:
+        def fetch() -> Dict[str, Any]:
+            if self.agent_resolver is not None:
+                return self.agent_resolver.resolve(self.client, agent_id)
+            identity: Dict[str, Any] = self.client.get(agent_path(agent_id))
+            return identity
+
+        return IN_FLIGHT.run(lookup_key("identity", self.client, agent_id), fetch)
+
+    async def _aget_identity(self, agent_id: str) -> Dict[str, Any]:
+        async def fetch() -> Dict[str, Any]:
+            if self.agent_resolver is not None:
+                return await self.agent_resolver.aresolve(self.client, agent_id)
+            identity: Dict[str, Any] = await self.client.aget(agent_path(agent_id))
+            return identity
+
+        return await IN_FLIGHT.arun(lookup_key("identity", self.client, agent_id), fetch)
+
+    async def _aget_score(self, agent_id: str) -> Dict[str, Any]:
+        return await aget_trust_score(self.client, agent_id, self.trust_cache)
+
+    def _lookup(self, lookup: _Lookup) -> Dict[str, Any]:
+        kind, agent_id = lookup
+        if kind == "identity":
+            return self._get_identity(agent_id)
+        return get_trust_score(self.client, agent_id, self.trust_cache)
+
+    def _run(self, agentIds: List[str], includeTrustScores: bool = True, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        agent_ids = unique(agentIds)
+        kinds = ("identity", "score") if includeTrustScores else ("identity",)
+        lookups = [(kind, agent_id) for kind in kinds for agent_id in agent_ids]
+        results = run_batch(lookups, self._lookup, self.max_concurrency)
+        identities = {agent_id: results[("identity", agent_id)] for agent_id in agent_ids}
+        scores = None
+        if includeTrustScores:
+            scores = {agent_id: results[("score", agent_id)] for agent_id in agent_ids}
+        return self._format_result(_combine(identities, scores))
+
+    async def _arun(self, agentIds: List[str], includeTrustScores: bool = True, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        lookups = [
+            arun_batch(agentIds, self._aget_identity, self.max_concurrency, semaphore)
+        ]
+        if includeTrustScores:
+            lookups.append(arun_batch(agentIds, self._aget_score, self.max_concurrency, semaphore))
+        results = await asyncio.gather(*lookups)
+        scores = results[1] if includeTrustScores else None
+        return self._format_result(_combine(results[0], scores))
@@ -1,14 +1,13 @@
 """Get agent trust score tool."""
 from __future__ import annotations
-from urllib.parse import quote
 
-import json
-from typing import Optional, Type
+from typing import ClassVar, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
+from langchain_nuggets.trust import TrustScoreCache, trust_score_path
 
 
 class GetAgentTrustScoreInput(BaseModel):
@@ -18,12 +17,18 @@ class GetAgentTrustScoreInput(BaseModel):
 class GetAgentTrustScore(NuggetsBaseTool):
     name: str = "get_agent_trust_score"
     description: str = "Get the trust score and provenance signals for an AI agent. Returns a score (0-1) based on verified signals: GitHub account verification, social profile verification, and registration age. Higher scores indicate more trustworthy agents with stronger developer provenance."
+    compact_description: ClassVar[str] = "Get an agent's trust score (0-1)."
     args_schema: Type[BaseModel] = GetAgentTrustScoreInput
-
-    def _run(self, agentId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
-        result = self.client.get(f"/kya/agents/{quote(agentId, safe="")}/trust-score")
-        return json.dumps(result)
-
-    async def _arun(self, agentId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
-        result = await self.client.aget(f"/kya/agents/{quote(agentId, safe="")}/trust-score")
-        return json.dumps(result)
+    trust_cache: Optional[TrustScoreCache] = None
+
+    def _run(self, agentId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        if self.trust_cache is not None:
+            return self._format_result(self.trust_cache.get(self.client, agentId))
+        result = self.client.get(trust_score_path(agentId))
+        return self._format_result(result)
+
+    async def _arun(self, agentId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        if self.trust_cache is not None:
+            return self._format_result(await self.trust_cache.aget(self.client, agentId))
+        result = await self.client.aget(trust_score_path(agentId))
+        return self._format_result(result)
@@ -0,0 +1,45 @@
+"""Query agent trust tool."""
+from __future__ import annotations
+
+from typing import Any, ClassVar, Dict, Optional, Type
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from pydantic import BaseModel, Field
+
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
+from langchain_nuggets.trust import TrustGraph
+
+
+class QueryAgentTrustInput(BaseModel):
+    agentId: str = Field(description="The agent ID to look up in the trust graph")
+    peerId: Optional[str] = Field(default=None, description="Another agent ID; also answer whether the two agents may interact")
+    minScore: Optional[float] = Field(default=None, description="Trust threshold to check instead of the graph's default")
+
+
+class QueryAgentTrust(NuggetsBaseTool):
+    name: str = "query_agent_trust"
+    description: str = "Check, from a precomputed trust graph of known agents, whether an agent is trusted and which agents it may interact with. Answers instantly without contacting Nuggets. Returns the agent's score, trusted (score at or above the threshold), and peers; with peerId, also canTalk (both agents at or above the threshold and allowed to interact). Agents outside the graph are reported with inGraph: false and are not trusted."
+    compact_description: ClassVar[str] = "Check an agent's trust and allowed peers from the trust graph."
+    args_schema: Type[BaseModel] = QueryAgentTrustInput
+    trust_graph: TrustGraph
+
+    def _query(self, agentId: str, peerId: Optional[str], minScore: Optional[float]) -> Dict[str, Any]:
+        graph = self.trust_graph
+        result: Dict[str, Any] = {
+            "agentId": agentId,
+            "inGraph": agentId in graph,
+            "score": graph.score(agentId),
+            "threshold": graph.threshold if minScore is None else minScore,
+            "trusted": graph.is_trusted(agentId, minScore),
+            "peers": sorted(graph.peers(agentId)),
+        }
+        if peerId is not None:
+            result["peerId"] = peerId
+            result["canTalk"] = graph.can_talk(agentId, peerId, minScore)
+        return result
+
+    def _run(self, agentId: str, peerId: Optional[str] = None, minScore: Optional[float] = None, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        return self._format_result(self._query(agentId, peerId, minScore))
+
+    async def _arun(self, agentId: str, peerId: Optional[str] = None, minScore: Optional[float] = None, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        return self._format_result(self._query(agentId, peerId, minScore))
@@ -1,13 +1,14 @@
 """Register agent identity tool."""
 from __future__ import annotations
 
-import json
-from typing import Optional, Type
+from typing import Any, ClassVar, Dict, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.did import AgentResolver
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
+from langchain_nuggets.trust import TrustScoreCache
 
 
 class RegisterAgentIdentityInput(BaseModel):
@@ -19,22 +20,33 @@ class RegisterAgentIdentityInput(BaseModel):
 class RegisterAgentIdentity(NuggetsBaseTool):
     name: str = "register_agent_identity"
     description: str = "Register this AI agent's identity with Nuggets to establish verifiable provenance. Provide developer provenance signals (GitHub, Twitter) so other agents and users can verify who built this agent. Returns a DID and agent identity record."
+    compact_description: ClassVar[str] = "Register this agent's identity and provenance with Nuggets."
     args_schema: Type[BaseModel] = RegisterAgentIdentityInput
+    trust_cache: Optional[TrustScoreCache] = None
+    agent_resolver: Optional[AgentResolver] = None
 
-    def _run(self, agentName: str, githubUrl: Optional[str] = None, twitterHandle: Optional[str] = None, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
-        body: dict = {"agentName": agentName}
+    def _run(self, agentName: str, githubUrl: Optional[str] = None, twitterHandle: Optional[str] = None, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        body: Dict[str, Any] = {"agentName": agentName}
         if githubUrl is not None:
             body["githubUrl"] = githubUrl
         if twitterHandle is not None:
             body["twitterHandle"] = twitterHandle
         result = self.client.post("/kya/agents", body)
-        return json.dumps(result)
-
-    async def _arun(self, agentName: str, githubUrl: Optional[str] = None, twitterHandle: Optional[str] = None, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
-        body: dict = {"agentName": agentName}
+        if self.trust_cache is not None:
+            self.trust_cache.invalidate_identity(result)
+        if self.agent_resolver is not None:
+            self.agent_resolver.invalidate_identity(result)
+        return self._format_result(result)
+
+    async def _arun(self, agentName: str, githubUrl: Optional[str] = None, twitterHandle: Optional[str] = None, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        body: Dict[str, Any] = {"agentName": agentName}
         if githubUrl is not None:
             body["githubUrl"] = githubUrl
         if twitterHandle is not None:
             body["twitterHandle"] = twitterHandle
         result = await self.client.apost("/kya/agents", body)
-        return json.dumps(result)
+        if self.trust_cache is not None:
+            self.trust_cache.invalidate_identity(result)
+        if self.agent_resolver is not None:
+            self.agent_resolver.invalidate_identity(result)
+        return self._format_result(result)
@@ -1,14 +1,13 @@
 """Verify agent identity tool."""
 from __future__ import annotations
-from urllib.parse import quote
 
-import json
-from typing import Optional, Type
+from typing import ClassVar, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.did import AgentResolver, agent_path
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class VerifyAgentIdentityInput(BaseModel):
@@ -18,12 +17,18 @@ class VerifyAgentIdentityInput(BaseModel):
 class VerifyAgentIdentity(NuggetsBaseTool):
     name: str = "verify_agent_identity"
     description: str = "Verify another AI agent's identity through Nuggets. Returns the agent's registered identity including DID, developer provenance signals, and registration date. Use this before trusting data from or sharing data with another agent."
+    compact_description: ClassVar[str] = "Verify another agent's identity and provenance."
     args_schema: Type[BaseModel] = VerifyAgentIdentityInput
-
-    def _run(self, agentId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
-        result = self.client.get(f"/kya/agents/{quote(agentId, safe="")}")
-        return json.dumps(result)
-
-    async def _arun(self, agentId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
-        result = await self.client.aget(f"/kya/agents/{quote(agentId, safe="")}")
-        return json.dumps(result)
+    agent_resolver: Optional[AgentResolver] = None
+
+    def _run(self, agentId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        if self.agent_resolver is not None:
+            return self._format_result(self.agent_resolver.resolve(self.client, agentId))
+        result = self.client.get(agent_path(agentId))
+        return self._format_result(result)
+
+    async def _arun(self, agentId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        if self.agent_resolver is not None:
+            return self._format_result(await self.agent_resolver.aresolve(self.client, agentId))
+        result = await self.client.aget(agent_path(agentId))
+        return self._format_result(result)
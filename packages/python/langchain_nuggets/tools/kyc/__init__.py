@@ -3,10 +3,12 @@ from langchain_nuggets.tools.kyc.check_kyc_status import CheckKycStatus
 from langchain_nuggets.tools.kyc.initiate_kyc_verification import InitiateKycVerification
 from langchain_nuggets.tools.kyc.verify_age import VerifyAge
 from langchain_nuggets.tools.kyc.verify_credential import VerifyCredential
+from langchain_nuggets.tools.kyc.wait_for_kyc_completion import WaitForKycCompletion
 
 __all__ = [
     "InitiateKycVerification",
     "CheckKycStatus",
     "VerifyAge",
     "VerifyCredential",
+    "WaitForKycCompletion",
 ]
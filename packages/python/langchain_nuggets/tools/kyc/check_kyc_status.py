@@ -1,14 +1,14 @@
 """Check KYC status tool."""
 from __future__ import annotations
-from urllib.parse import quote
 
-import json
-from typing import Optional, Type
+from typing import ClassVar, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.credentials import CredentialCache
+from langchain_nuggets.sessions import KYC, SessionStore, session_path
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class CheckKycStatusInput(BaseModel):
@@ -18,12 +18,25 @@ class CheckKycStatusInput(BaseModel):
 class CheckKycStatus(NuggetsBaseTool):
     name: str = "check_kyc_status"
     description: str = 'Check the status of a KYC verification session. Returns status: "pending" (user has not yet completed), "completed" (verified), "failed" (verification failed), or "expired" (session timed out). If completed, includes the verified credentials.'
+    compact_description: ClassVar[str] = "Get a KYC session's status (pending/completed/failed/expired)."
     args_schema: Type[BaseModel] = CheckKycStatusInput
-
-    def _run(self, sessionId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
-        result = self.client.get(f"/kyc/sessions/{quote(sessionId, safe="")}")
-        return json.dumps(result)
-
-    async def _arun(self, sessionId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
-        result = await self.client.aget(f"/kyc/sessions/{quote(sessionId, safe="")}")
-        return json.dumps(result)
+    session_store: Optional[SessionStore] = None
+    credential_cache: Optional[CredentialCache] = None
+
+    def _run(self, sessionId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        if self.session_store is not None:
+            result = self.session_store.fetch(self.client, KYC, sessionId)
+        else:
+            result = self.client.get(session_path(KYC, sessionId))
+        if self.credential_cache is not None:
+            self.credential_cache.observe(KYC, sessionId, result)
+        return self._format_result(result)
+
+    async def _arun(self, sessionId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        if self.session_store is not None:
+            result = await self.session_store.afetch(self.client, KYC, sessionId)
+        else:
+            result = await self.client.aget(session_path(KYC, sessionId))
+        if self.credential_cache is not None:
+            self.credential_cache.observe(KYC, sessionId, result)
+        return self._format_result(result)
@@ -1,13 +1,13 @@
 """Initiate KYC verification tool."""
 from __future__ import annotations
 
-import json
-from typing import Optional, Type
+from typing import ClassVar, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.sessions import KYC, SessionStore
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class InitiateKycVerificationInput(BaseModel):
@@ -17,12 +17,18 @@ class InitiateKycVerificationInput(BaseModel):
 class InitiateKycVerification(NuggetsBaseTool):
     name: str = "initiate_kyc_verification"
     description: str = "Start a KYC (Know Your Customer) identity verification flow for a user. Returns a deeplink and QR code URL that the user must scan with their Nuggets app to complete identity verification. Use check_kyc_status to poll for completion."
+    compact_description: ClassVar[str] = "Start KYC verification for a user; returns a deeplink/QR."
     args_schema: Type[BaseModel] = InitiateKycVerificationInput
+    session_store: Optional[SessionStore] = None
 
-    def _run(self, userId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+    def _run(self, userId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        if self.session_store is not None:
+            return self._format_result(self.session_store.create(self.client, KYC, "/kyc/sessions", {"userId": userId}))
         result = self.client.post("/kyc/sessions", {"userId": userId})
-        return json.dumps(result)
+        return self._format_result(result)
 
-    async def _arun(self, userId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
+    async def _arun(self, userId: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        if self.session_store is not None:
+            return self._format_result(await self.session_store.acreate(self.client, KYC, "/kyc/sessions", {"userId": userId}))
         result = await self.client.apost("/kyc/sessions", {"userId": userId})
-        return json.dumps(result)
+        return self._format_result(result)
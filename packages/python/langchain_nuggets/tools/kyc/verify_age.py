@@ -1,13 +1,13 @@
 """Verify age tool."""
 from __future__ import annotations
 
-import json
-from typing import Optional, Type
+from typing import ClassVar, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.sessions import KYC, SessionStore
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class VerifyAgeInput(BaseModel):
@@ -18,12 +18,18 @@ class VerifyAgeInput(BaseModel):
 class VerifyAge(NuggetsBaseTool):
     name: str = "verify_age"
     description: str = "Request selective disclosure age verification for a user. Proves the user meets a minimum age requirement WITHOUT revealing their actual date of birth. Returns a deeplink/QR code for the user to approve the age proof in their Nuggets app. Use check_kyc_status with the returned sessionId to check if the user approved."
+    compact_description: ClassVar[str] = "Request a selective-disclosure minimum-age proof from a user."
     args_schema: Type[BaseModel] = VerifyAgeInput
+    session_store: Optional[SessionStore] = None
 
-    def _run(self, userId: str, minimumAge: int, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+    def _run(self, userId: str, minimumAge: int, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        if self.session_store is not None:
+            return self._format_result(self.session_store.create(self.client, KYC, "/kyc/verify-age", {"userId": userId, "minimumAge": minimumAge}))
         result = self.client.post("/kyc/verify-age", {"userId": userId, "minimumAge": minimumAge})
-        return json.dumps(result)
+        return self._format_result(result)
 
-    async def _arun(self, userId: str, minimumAge: int, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
+    async def _arun(self, userId: str, minimumAge: int, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        if self.session_store is not None:
+            return self._format_result(await self.session_store.acreate(self.client, KYC, "/kyc/verify-age", {"userId": userId, "minimumAge": minimumAge}))
         result = await self.client.apost("/kyc/verify-age", {"userId": userId, "minimumAge": minimumAge})
-        return json.dumps(result)
+        return self._format_result(result)
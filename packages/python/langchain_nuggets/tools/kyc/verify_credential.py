@@ -1,13 +1,13 @@
 """Verify credential tool."""
 from __future__ import annotations
 
-import json
-from typing import Optional, Type
+from typing import ClassVar, Optional, Type
 
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
-from langchain_nuggets.tools.base import NuggetsBaseTool
+from langchain_nuggets.credentials import CredentialCache, cached_kyc_result
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
 
 
 class VerifyCredentialInput(BaseModel):
@@ -18,12 +18,26 @@ class VerifyCredentialInput(BaseModel):
 class VerifyCredential(NuggetsBaseTool):
     name: str = "verify_credential"
     description: str = "Request selective disclosure verification of a specific credential for a user. The user will be asked to share only the requested credential type from their Nuggets app. Returns a deeplink/QR code for the user to approve. Use check_kyc_status with the returned sessionId to check completion."
+    compact_description: ClassVar[str] = "Request a specific credential (address, email, phone, nationality) from a user."
     args_schema: Type[BaseModel] = VerifyCredentialInput
+    credential_cache: Optional[CredentialCache] = None
 
-    def _run(self, userId: str, credentialType: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+    def _run(self, userId: str, credentialType: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        if self.credential_cache is not None:
+            cached = self.credential_cache.get(userId, credentialType)
+            if cached is not None:
+                return self._format_result(cached_kyc_result(credentialType, cached))
         result = self.client.post("/kyc/verify-credential", {"userId": userId, "credentialType": credentialType})
-        return json.dumps(result)
-
-    async def _arun(self, userId: str, credentialType: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> str:
+        if self.credential_cache is not None:
+            self.credential_cache.track(result, userId, [credentialType])
+        return self._format_result(result)
+
+    async def _arun(self, userId: str, credentialType: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        if self.credential_cache is not None:
+            cached = self.credential_cache.get(userId, credentialType)
+            if cached is not None:
+                return self._format_result(cached_kyc_result(credentialType, cached))
         result = await self.client.apost("/kyc/verify-credential", {"userId": userId, "credentialType": credentialType})
-        return json.dumps(result)
+        if self.credential_cache is not None:
+            self.credential_cache.track(result, userId, [credentialType])
+        return self._format_result(result)
@@ -0,0 +1,48 @@
+"""Wait for KYC completion tool."""
+from __future__ import annotations
+
+from typing import ClassVar, Optional, Type
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from pydantic import BaseModel, Field
+
+from langchain_nuggets.credentials import CredentialCache
+from langchain_nuggets.polling import (
+    DEFAULT_POLL_POLICY,
+    PollPolicy,
+    await_session,
+    wait_for_session,
+)
+from langchain_nuggets.sessions import KYC, SessionStore
+from langchain_nuggets.tools.base import NuggetsBaseTool, ToolResult
+
+
+class WaitForKycCompletionInput(BaseModel):
+    sessionId: str = Field(description="The KYC session ID returned by initiate_kyc_verification")
+    timeoutSeconds: float = Field(default=120, description="Maximum time to wait, in seconds")
+
+
+class WaitForKycCompletion(NuggetsBaseTool):
+    name: str = "wait_for_kyc_completion"
+    description: str = 'Wait until a KYC verification session finishes, then return its final state. Use this instead of calling check_kyc_status repeatedly. Returns status "completed", "failed" or "expired"; if the user has not finished within timeoutSeconds, returns the current "pending" state with timedOut: true.'
+    compact_description: ClassVar[str] = "Wait until a KYC session is completed/failed/expired."
+    args_schema: Type[BaseModel] = WaitForKycCompletionInput
+    session_store: Optional[SessionStore] = None
+    credential_cache: Optional[CredentialCache] = None
+    poll_policy: PollPolicy = DEFAULT_POLL_POLICY
+
+    def _run(self, sessionId: str, timeoutSeconds: float = 120, run_manager: Optional[CallbackManagerForToolRun] = None) -> ToolResult:
+        result = wait_for_session(
+            self.client, KYC, sessionId, timeoutSeconds, self.session_store, self.poll_policy
+        )
+        if self.credential_cache is not None:
+            self.credential_cache.observe(KYC, sessionId, result)
+        return self._format_result(result)
+
+    async def _arun(self, sessionId: str, timeoutSeconds: float = 120, run_manager: Optional[AsyncCallbackManagerForToolRun] = None) -> ToolResult:
+        result = await await_session(
+            self.client, KYC, sessionId, timeoutSeconds, self.session_store, self.poll_policy
+        )
+        if self.credential_cache is not None:
+            self.credential_cache.observe(KYC, sessionId, result)
+        return self._format_result(result)
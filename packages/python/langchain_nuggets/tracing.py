@@ -0,0 +1,90 @@
+"""Optional OpenTelemetry tracing for Nuggets tools, client, middleware and auth.
+
+Spans are only created when ``opentelemetry-api`` is installed::
+
+    pip install langchain-nuggets[otel]
+
+Without it every helper here returns a shared no-op context manager and
+does no other work. With the API installed but no SDK configured, the
+OpenTelemetry no-op tracer is used.
+"""
+from __future__ import annotations
+
+import contextlib
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from langchain_nuggets.client.instrumentation import route_template
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Tracer
+
+_otel_trace: Optional[ModuleType]
+try:
+    from opentelemetry import trace as _otel_trace
+    from opentelemetry.propagate import inject as _inject
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:
+    _otel_trace = None
+
+ENABLED = _otel_trace is not None
+
+_NOOP: ContextManager[Any] = contextlib.nullcontext()
+_tracer: Optional[Tracer] = _otel_trace.get_tracer("langchain_nuggets") if _otel_trace is not None else None
+
+
+def start_span(name: str, attributes: Optional[Mapping[str, Any]] = None) -> ContextManager[Any]:
+    """Start an internal span as the current span, or a no-op without OTel."""
+    if _tracer is None:
+        return _NOOP
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def http_span(method: str, path: str, base_url: str) -> ContextManager[Any]:
+    """Start a CLIENT span for a Nuggets API request (HTTP semantic conventions)."""
+    if _tracer is None:
+        return _NOOP
+    route = route_template(path)
+    parts = urlsplit(base_url)
+    attributes: Dict[str, Any] = {
+        "http.request.method": method,
+        "url.template": route,
+        "server.address": parts.hostname or "",
+    }
+    if parts.port is not None:
+        attributes["server.port"] = parts.port
+    return _tracer.start_as_current_span(
+        f"{method} {route}", kind=SpanKind.CLIENT, attributes=attributes
+    )
+
+
+def tool_span(tool_name: str, tool_call_id: Optional[str] = None) -> ContextManager[Any]:
+    """Start a span for a tool invocation (GenAI semantic conventions)."""
+    if _tracer is None:
+        return _NOOP
+    attributes = {"gen_ai.operation.name": "execute_tool", "gen_ai.tool.name": tool_name}
+    if tool_call_id:
+        attributes["gen_ai.tool.call.id"] = tool_call_id
+    return _tracer.start_as_current_span(f"execute_tool {tool_name}", attributes=attributes)
+
+
+def inject_headers(headers: Dict[str, str]) -> None:
+    """Add W3C trace context headers for the current span to ``headers``."""
+    if ENABLED:
+        _inject(headers)
+
+
+def set_attribute(span: Any, key: str, value: Any) -> None:
+    if span is not None:
+        span.set_attribute(key, value)
+
+
+def record_status_code(span: Any, status_code: int) -> None:
+    """Record the HTTP status on a span and mark it as an error for 4xx/5xx."""
+    if span is None:
+        return
+    span.set_attribute("http.response.status_code", status_code)
+    if status_code >= 400:
+        span.set_attribute("error.type", str(status_code))
+        span.set_status(Status(StatusCode.ERROR))
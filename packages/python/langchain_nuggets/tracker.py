@@ -0,0 +1,256 @@
+"""Track many pending KYC sessions and presentations from a single loop."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.polling import DEFAULT_POLL_POLICY, PollPolicy
+from langchain_nuggets.sessions import SessionStore, is_terminal, session_path
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class SessionUpdate:
+    """A status transition observed by ``SessionTracker``."""
+
+    kind: str
+    session_id: str
+    status: Optional[str]
+    previous_status: Optional[str]
+    result: Dict[str, Any]
+    terminal: bool
+
+
+UpdateCallback = Callable[[SessionUpdate], Union[None, Awaitable[None]]]
+
+
+class _Tracked:
+    __slots__ = ("status", "delays", "seq")
+
+    def __init__(self, delays: Iterator[float]) -> None:
+        self.status: Optional[str] = None
+        self.delays = delays
+        # Sequence number of the session's one live heap entry.
+        self.seq = 0
+
+
+class SessionTracker:
+    """Polls every tracked session from one scheduler instead of one loop each.
+
+    Due polls sit in a single heap ordered by due time. Each session backs
+    off independently according to ``policy`` (with jitter), and the backoff
+    resets whenever its status changes. At most ``max_concurrency`` requests
+    are in flight at once. A session stops being tracked when it reaches a
+    terminal state.
+
+    Status transitions are delivered to callbacks (sync or async) and to
+    every ``updates()`` iterator. A ``SessionStore``, if given, receives the
+    terminal results. When it is fed by webhooks, sessions that are already
+    terminal are answered without a network call.
+
+    Usage::
+
+        async with SessionTracker(client, on_update=notify) as tracker:
+            for session_id in pending_ids:
+                tracker.track("kyc", session_id)
+            async for update in tracker.updates():
+                ...
+    """
+
+    def __init__(
+        self,
+        client: NuggetsApiClient,
+        store: Optional[SessionStore] = None,
+        policy: PollPolicy = DEFAULT_POLL_POLICY,
+        max_concurrency: int = 16,
+        on_update: Optional[UpdateCallback] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._store = store
+        self._policy = policy
+        self._clock = clock
+        self._max_concurrency = max_concurrency
+        # Created in start(): on Python 3.9 asyncio primitives bind to the
+        # loop that is current when they are constructed.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._callbacks: List[UpdateCallback] = [on_update] if on_update else []
+        self._tracked: Dict[SessionKey, _Tracked] = {}
+        self._heap: List[Tuple[float, int, SessionKey]] = []
+        self._seq = 0
+        self._subscribers: Set["asyncio.Queue[Optional[SessionUpdate]]"] = set()
+        self._inflight: Set["asyncio.Task[None]"] = set()
+        self._runner: Optional["asyncio.Task[None]"] = None
+
+    # --- Registration ---
+    def track(self, kind: str, session_id: str) -> None:
+        """Start tracking a session; its first poll is due immediately."""
+        key = (kind, session_id)
+        if key in self._tracked:
+            return
+        self._tracked[key] = _Tracked(self._policy.delays())
+        self._schedule(key, self._clock())
+
+    def untrack(self, kind: str, session_id: str) -> None:
+        self._tracked.pop((kind, session_id), None)
+
+    def add_callback(self, callback: UpdateCallback) -> None:
+        self._callbacks.append(callback)
+
+    @property
+    def pending(self) -> int:
+        """Number of sessions still being tracked."""
+        return len(self._tracked)
+
+    def _schedule(self, key: SessionKey, due: float) -> None:
+        # Heap entries with an older sequence number are skipped, so a
+        # session re-tracked after untrack() is polled once, not twice.
+        self._seq += 1
+        self._tracked[key].seq = self._seq
+        heapq.heappush(self._heap, (due, self._seq, key))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # --- Lifecycle ---
+    async def start(self) -> None:
+        if self._runner is None:
+            self._create_primitives()
+            self._runner = asyncio.ensure_future(self.run())
+
+    def _create_primitives(self) -> Tuple[asyncio.Semaphore, asyncio.Event]:
+        if self._semaphore is None or self._wakeup is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._wakeup = asyncio.Event()
+        return self._semaphore, self._wakeup
+
+    async def stop(self) -> None:
+        """Stop polling, wait for in-flight polls and end all ``updates()`` iterators."""
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            runner.cancel()
+            try:
+                await runner
+            except asyncio.CancelledError:
+                pass
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    async def __aenter__(self) -> SessionTracker:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    async def run(self) -> None:
+        """Scheduler loop. Runs until cancelled; prefer ``start``/``stop``."""
+        semaphore, wakeup = self._create_primitives()
+        while True:
+            wakeup.clear()
+            now = self._clock()
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, key = heapq.heappop(self._heap)
+                tracked = self._tracked.get(key)
+                if tracked is None or tracked.seq != seq:
+                    continue
+                await semaphore.acquire()
+                task = asyncio.ensure_future(self._poll(key, tracked, semaphore))
+                self._inflight.add(task)
+                task.add_done_callback(self._poll_done)
+            timeout = self._heap[0][0] - self._clock() if self._heap else None
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    # --- Polling ---
+    async def _poll(self, key: SessionKey, tracked: _Tracked, semaphore: asyncio.Semaphore) -> None:
+        kind, session_id = key
+        result: Optional[Dict[str, Any]]
+        try:
+            if self._store is not None:
+                result = await self._store.afetch(self._client, kind, session_id)
+            else:
+                result = await self._client.aget(session_path(kind, session_id))
+        except Exception as exc:
+            logger.warning("Polling %s session %s failed: %s", kind, session_id, exc)
+            result = None
+        finally:
+            semaphore.release()
+        if result is not None and not isinstance(result, dict):
+            logger.warning(
+                "Polling %s session %s returned %s, not a session object",
+                kind, session_id, type(result).__name__,
+            )
+            result = None
+
+        if self._tracked.get(key) is not tracked:
+            return  # untracked (and maybe tracked again) while polling
+        if result is None:
+            self._schedule(key, self._clock() + next(tracked.delays))
+            return
+
+        status = result.get("status")
+        terminal = is_terminal(kind, result)
+        if status != tracked.status:
+            update = SessionUpdate(kind, session_id, status, tracked.status, result, terminal)
+            tracked.status = status
+            tracked.delays = self._policy.delays()
+            await self._emit(update)
+        if terminal:
+            self._tracked.pop(key, None)
+        else:
+            self._schedule(key, self._clock() + next(tracked.delays))
+
+    def _poll_done(self, task: "asyncio.Task[None]") -> None:
+        self._inflight.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Session poll failed", exc_info=task.exception())
+
+    async def _emit(self, update: SessionUpdate) -> None:
+        for callback in self._callbacks:
+            try:
+                outcome = callback(update)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception:
+                logger.exception("Session update callback failed")
+        for queue in self._subscribers:
+            queue.put_nowait(update)
+
+    async def updates(self) -> AsyncIterator[SessionUpdate]:
+        """Yield every status transition until the tracker is stopped."""
+        queue: "asyncio.Queue[Optional[SessionUpdate]]" = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            while True:
+                update = await queue.get()
+                if update is None:
+                    return
+                yield update
+        finally:
+            self._subscribers.discard(queue)
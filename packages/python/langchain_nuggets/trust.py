@@ -0,0 +1,574 @@
+"""Agent trust-score caching and the agent trust graph for KYA tools."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+)
+from urllib.parse import quote
+
+from langchain_nuggets.batch import IN_FLIGHT, arun_batch, lookup_key, run_batch, unique
+from langchain_nuggets.cache import TTLCache
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.did import AgentResolver, agent_path
+
+if TYPE_CHECKING:
+    from langchain_nuggets.tools.base import NuggetsBaseTool
+
+logger = logging.getLogger(__name__)
+
+
+def trust_score_path(agent_id: str) -> str:
+    return f"/kya/agents/{quote(agent_id, safe='')}/trust-score"
+
+
+class TrustScoreCache:
+    """Trust-score cache with a TTL, bounded size and stale-while-revalidate.
+
+    Fresh scores are served from memory. Once a score is older than ``ttl``
+    it is still returned immediately for up to ``stale_ttl`` more seconds
+    while a single background refresh runs (a thread for sync callers, a
+    task for async callers). Misses fetch inline.
+
+    Usage::
+
+        cache = TrustScoreCache(ttl=300, stale_ttl=3600)
+        toolkit = NuggetsToolkit(..., trust_score_cache=cache)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        stale_ttl: float = 3600.0,
+        max_size: int = 1024,
+        max_refresh_workers: int = 4,
+    ) -> None:
+        self._cache: TTLCache[Dict[str, Any]] = TTLCache(
+            max_size=max_size, ttl=ttl, stale_ttl=stale_ttl
+        )
+        self._max_refresh_workers = max_refresh_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Set[str] = set()
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        self._lock = threading.Lock()
+        # Bumped on invalidation so in-flight fetches don't re-cache old data.
+        self._epoch = 0
+
+    def peek(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached score (fresh or stale) without any network call."""
+        return self._cache.lookup(agent_id)[0]
+
+    def put(self, agent_id: str, score: Dict[str, Any]) -> None:
+        self._cache.set(agent_id, score)
+
+    def invalidate(self, *agent_ids: Optional[str]) -> None:
+        """Drop cached scores, e.g. after an agent's identity is re-registered."""
+        with self._lock:
+            self._epoch += 1
+        for agent_id in agent_ids:
+            if agent_id:
+                self._cache.invalidate(agent_id)
+
+    def invalidate_identity(self, identity: Dict[str, Any]) -> None:
+        """Invalidate every key an agent identity record can be looked up by."""
+        self.invalidate(
+            identity.get("agentId"), identity.get("agent_id"), identity.get("did")
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+        self._cache.clear()
+
+    def _store(self, agent_id: str, score: Dict[str, Any], epoch: int) -> None:
+        with self._lock:
+            if epoch != self._epoch:
+                return
+        self._cache.set(agent_id, score)
+
+    def _claim_refresh(self, agent_id: str) -> bool:
+        with self._lock:
+            if agent_id in self._refreshing:
+                return False
+            self._refreshing.add(agent_id)
+            return True
+
+    def _release_refresh(self, agent_id: str) -> None:
+        with self._lock:
+            self._refreshing.discard(agent_id)
+
+    # --- Sync ---
+    def get(self, client: NuggetsApiClient, agent_id: str) -> Dict[str, Any]:
+        score, fresh = self._cache.lookup(agent_id)
+        if score is None:
+            return self.refresh(client, agent_id)
+        if not fresh:
+            self.prefetch(client, agent_id)
+        return score
+
+    def refresh(self, client: NuggetsApiClient, agent_id: str) -> Dict[str, Any]:
+        """Fetch the score from the API and store it."""
+        epoch = self._epoch
+        score: Dict[str, Any] = client.get(trust_score_path(agent_id))
+        self._store(agent_id, score, epoch)
+        return score
+
+    def prefetch(self, client: NuggetsApiClient, agent_id: str) -> None:
+        """Start a background fetch of the score unless one is already running."""
+        if self._claim_refresh(agent_id):
+            self._get_executor().submit(self._background_refresh, client, agent_id)
+
+    def _background_refresh(self, client: NuggetsApiClient, agent_id: str) -> None:
+        try:
+            self.refresh(client, agent_id)
+        except Exception as exc:
+            logger.warning("Trust score refresh failed for %s: %s", agent_id, exc)
+        finally:
+            self._release_refresh(agent_id)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_refresh_workers,
+                    thread_name_prefix="nuggets-trust-refresh",
+                )
+            return self._executor
+
+    # --- Async ---
+    async def aget(self, client: NuggetsApiClient, agent_id: str) -> Dict[str, Any]:
+        score, fresh = self._cache.lookup(agent_id)
+        if score is None:
+            return await self.arefresh(client, agent_id)
+        if not fresh:
+            self.aprefetch(client, agent_id)
+        return score
+
+    async def arefresh(self, client: NuggetsApiClient, agent_id: str) -> Dict[str, Any]:
+        epoch = self._epoch
+        score: Dict[str, Any] = await client.aget(trust_score_path(agent_id))
+        self._store(agent_id, score, epoch)
+        return score
+
+    def aprefetch(self, client: NuggetsApiClient, agent_id: str) -> None:
+        """Start a background fetch on the running loop unless one is already running."""
+        if self._claim_refresh(agent_id):
+            task = asyncio.ensure_future(self._abackground_refresh(client, agent_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _abackground_refresh(self, client: NuggetsApiClient, agent_id: str) -> None:
+        try:
+            await self.arefresh(client, agent_id)
+        except Exception as exc:
+            logger.warning("Trust score refresh failed for %s: %s", agent_id, exc)
+        finally:
+            self._release_refresh(agent_id)
+
+    def close(self) -> None:
+        """Stop the background refresh pool (pending refreshes still finish)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# (agent_id, identity, peer_id, peer_identity) -> whether the two agents may interact.
+PeerPolicy = Callable[[str, Dict[str, Any], str, Dict[str, Any]], bool]
+
+
+class _Node:
+    __slots__ = ("identity", "score", "fetched_at")
+
+    def __init__(self, identity: Dict[str, Any], score: Dict[str, Any], fetched_at: float) -> None:
+        self.identity = identity
+        self.score = score
+        self.fetched_at = fetched_at
+
+    @property
+    def value(self) -> Optional[float]:
+        """The numeric score, or None if the identity or score lookup failed."""
+        if self.identity.get("error") or self.score.get("error"):
+            return None
+        value = self.score.get("score")
+        return float(value) if isinstance(value, (int, float)) else None
+
+
+def get_trust_score(
+    client: NuggetsApiClient, agent_id: str, trust_cache: Optional[TrustScoreCache] = None
+) -> Dict[str, Any]:
+    """An agent's trust score, through ``trust_cache`` if given.
+
+    Concurrent lookups of the same agent through the same client share
+    one request.
+    """
+
+    def fetch() -> Dict[str, Any]:
+        if trust_cache is not None:
+            return trust_cache.get(client, agent_id)
+        score: Dict[str, Any] = client.get(trust_score_path(agent_id))
+        return score
+
+    return IN_FLIGHT.run(lookup_key("score", client, agent_id), fetch)
+
+
+async def aget_trust_score(
+    client: NuggetsApiClient, agent_id: str, trust_cache: Optional[TrustScoreCache] = None
+) -> Dict[str, Any]:
+    """Async variant of :func:`get_trust_score`."""
+
+    async def fetch() -> Dict[str, Any]:
+        if trust_cache is not None:
+            return await trust_cache.aget(client, agent_id)
+        score: Dict[str, Any] = await client.aget(trust_score_path(agent_id))
+        return score
+
+    return await IN_FLIGHT.arun(lookup_key("score", client, agent_id), fetch)
+
+
+class TrustGraph:
+    """Trust relationships between a known set of agents, held in memory.
+
+    ``load``/``aload`` resolve identities and trust scores for a set of
+    agents concurrently. Queries are answered from memory in O(1) and
+    never call the API:
+
+    - ``score(x)`` and ``is_trusted(x)`` (score at least ``threshold``),
+    - ``can_talk(x, y)`` and ``peers(x)``, the agents ``x`` may interact
+      with.
+
+    Two agents may interact when both are trusted and ``policy`` (if
+    given) allows the pair. Edges are precomputed and updated only for
+    agents whose trust or identity changed. Agents whose identity or score
+    lookup failed are untrusted, and agents that were never loaded have
+    no score and no peers.
+
+    Entries older than ``ttl`` seconds are refetched by ``refresh``. With
+    ``auto_refresh``, a query that finds stale entries starts one
+    background refresh and is answered from the current data. Scores go
+    through ``trust_cache`` and identities through ``agent_resolver`` when
+    given.
+
+    Usage::
+
+        graph = TrustGraph(client, threshold=0.7, trust_cache=cache)
+        await graph.aload(["agent-a", "agent-b", "agent-c"])
+        graph.peers("agent-a")        # frozenset({"agent-b"})
+        tools = toolkit.get_tools() + [graph.as_tool()]
+        builder.add_conditional_edges("pick_agent", graph.guard("target_agent"))
+    """
+
+    def __init__(
+        self,
+        client: NuggetsApiClient,
+        threshold: float = 0.7,
+        policy: Optional[PeerPolicy] = None,
+        trust_cache: Optional[TrustScoreCache] = None,
+        agent_resolver: Optional[AgentResolver] = None,
+        ttl: float = 300.0,
+        max_concurrency: int = 8,
+        auto_refresh: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.threshold = threshold
+        self._policy = policy
+        self._trust_cache = trust_cache
+        self._agent_resolver = agent_resolver
+        self.ttl = ttl
+        self._max_concurrency = max_concurrency
+        self._auto_refresh = auto_refresh
+        self._clock = clock
+        self._nodes: Dict[str, _Node] = {}
+        self._trusted: Dict[str, bool] = {}
+        self._edges: Dict[str, FrozenSet[str]] = {}
+        self._next_due = float("inf")
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # --- Queries ---
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def agents(self) -> FrozenSet[str]:
+        return frozenset(self._nodes)
+
+    def score(self, agent_id: str) -> Optional[float]:
+        self._maybe_refresh()
+        node = self._nodes.get(agent_id)
+        return node.value if node is not None else None
+
+    def is_trusted(self, agent_id: str, min_score: Optional[float] = None) -> bool:
+        """Whether the agent's score is at least ``min_score`` (default ``threshold``)."""
+        if min_score is None:
+            self._maybe_refresh()
+            return self._trusted.get(agent_id, False)
+        value = self.score(agent_id)
+        return value is not None and value >= min_score
+
+    def can_talk(self, agent_id: str, peer_id: str, min_score: Optional[float] = None) -> bool:
+        """Whether the agents may interact, with both scores at least ``min_score``.
+
+        Without ``min_score`` this reads the precomputed edges. With it,
+        both scores are checked against ``min_score`` and ``policy`` is
+        applied to the pair.
+        """
+        self._maybe_refresh()
+        if min_score is None:
+            return peer_id in self._edges.get(agent_id, ())
+        with self._lock:
+            nodes = (self._nodes.get(agent_id), self._nodes.get(peer_id))
+            if not all(node is not None and node.value is not None and node.value >= min_score for node in nodes):
+                return False
+            return self._policy_allows_locked(agent_id, peer_id)
+
+    def peers(self, agent_id: str) -> FrozenSet[str]:
+        """The agents ``agent_id`` may interact with."""
+        self._maybe_refresh()
+        return self._edges.get(agent_id, frozenset())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """A JSON-serialisable view of the graph, e.g. for graph state."""
+        return {
+            "threshold": self.threshold,
+            "agents": {
+                agent_id: {
+                    "score": node.value,
+                    "trusted": self._trusted.get(agent_id, False),
+                    "peers": sorted(self._edges.get(agent_id, ())),
+                }
+                for agent_id, node in list(self._nodes.items())
+            },
+        }
+
+    # --- Loading ---
+
+    def _get_identity(self, agent_id: str) -> Dict[str, Any]:
+        if self._agent_resolver is not None:
+            return self._agent_resolver.resolve(self.client, agent_id)
+        identity: Dict[str, Any] = self.client.get(agent_path(agent_id))
+        return identity
+
+    async def _aget_identity(self, agent_id: str) -> Dict[str, Any]:
+        if self._agent_resolver is not None:
+            return await self._agent_resolver.aresolve(self.client, agent_id)
+        identity: Dict[str, Any] = await self.client.aget(agent_path(agent_id))
+        return identity
+
+    def _get_score(self, agent_id: str, fresh: bool) -> Dict[str, Any]:
+        if self._trust_cache is None:
+            score: Dict[str, Any] = self.client.get(trust_score_path(agent_id))
+            return score
+        if fresh:
+            return self._trust_cache.refresh(self.client, agent_id)
+        return self._trust_cache.get(self.client, agent_id)
+
+    async def _aget_score(self, agent_id: str, fresh: bool) -> Dict[str, Any]:
+        if self._trust_cache is None:
+            score: Dict[str, Any] = await self.client.aget(trust_score_path(agent_id))
+            return score
+        if fresh:
+            return await self._trust_cache.arefresh(self.client, agent_id)
+        return await self._trust_cache.aget(self.client, agent_id)
+
+    def _identities_to_fetch(self, agent_ids: List[str]) -> List[str]:
+        # Without a resolver, identities are fetched until one succeeds;
+        # with one, its TTL applies.
+        if self._agent_resolver is not None:
+            return agent_ids
+        return [
+            a for a in agent_ids
+            if a not in self._nodes or not self._nodes[a].identity or self._nodes[a].identity.get("error")
+        ]
+
+    def load(self, agent_ids: Iterable[str]) -> None:
+        """Add agents to the graph, fetching identities and scores concurrently."""
+        self._fetch(unique(agent_ids), fresh=False)
+
+    async def aload(self, agent_ids: Iterable[str]) -> None:
+        await self._afetch(unique(agent_ids), fresh=False)
+
+    def refresh(self, stale_only: bool = True) -> None:
+        """Refetch agents older than ``ttl`` (or all agents)."""
+        self._fetch(self._due(stale_only), fresh=True)
+
+    async def arefresh(self, stale_only: bool = True) -> None:
+        await self._afetch(self._due(stale_only), fresh=True)
+
+    def _due(self, stale_only: bool) -> List[str]:
+        cutoff = self._clock() - self.ttl
+        return [
+            agent_id
+            for agent_id, node in list(self._nodes.items())
+            if not stale_only or node.fetched_at <= cutoff
+        ]
+
+    def _fetch(self, agent_ids: List[str], fresh: bool) -> None:
+        if not agent_ids:
+            return
+        identities = run_batch(self._identities_to_fetch(agent_ids), self._get_identity, self._max_concurrency)
+        scores = run_batch(agent_ids, lambda a: self._get_score(a, fresh), self._max_concurrency)
+        self._update(agent_ids, identities, scores)
+
+    async def _afetch(self, agent_ids: List[str], fresh: bool) -> None:
+        if not agent_ids:
+            return
+        semaphore = asyncio.Semaphore(max(1, self._max_concurrency))
+        identities, scores = await asyncio.gather(
+            arun_batch(self._identities_to_fetch(agent_ids), self._aget_identity, self._max_concurrency, semaphore),
+            arun_batch(agent_ids, lambda a: self._aget_score(a, fresh), self._max_concurrency, semaphore),
+        )
+        self._update(agent_ids, identities, scores)
+
+    def remove(self, *agent_ids: str) -> None:
+        with self._lock:
+            for agent_id in agent_ids:
+                if self._nodes.pop(agent_id, None) is not None:
+                    self._trusted.pop(agent_id, None)
+                    self._relink_locked(agent_id)
+            self._schedule_locked()
+
+    # --- Edges (call with the lock held) ---
+
+    def _update(self, agent_ids: List[str], identities: Dict[str, Any], scores: Dict[str, Any]) -> None:
+        now = self._clock()
+        with self._lock:
+            for agent_id in agent_ids:
+                previous = self._nodes.get(agent_id)
+                identity = identities.get(agent_id)
+                if identity is None:
+                    identity = previous.identity if previous is not None else {}
+                node = _Node(identity, scores[agent_id], now)
+                self._nodes[agent_id] = node
+                value = node.value
+                trusted = value is not None and value >= self.threshold
+                changed = (
+                    previous is None
+                    or trusted != self._trusted.get(agent_id)
+                    or (self._policy is not None and identity != previous.identity)
+                )
+                self._trusted[agent_id] = trusted
+                if changed:
+                    self._relink_locked(agent_id)
+            self._schedule_locked()
+
+    def _allowed_locked(self, agent_id: str, peer_id: str) -> bool:
+        if not (self._trusted.get(agent_id) and self._trusted.get(peer_id)):
+            return False
+        return self._policy_allows_locked(agent_id, peer_id)
+
+    def _policy_allows_locked(self, agent_id: str, peer_id: str) -> bool:
+        if agent_id == peer_id:
+            return False
+        if self._policy is None:
+            return True
+        return self._policy(
+            agent_id, self._nodes[agent_id].identity, peer_id, self._nodes[peer_id].identity
+        ) and self._policy(
+            peer_id, self._nodes[peer_id].identity, agent_id, self._nodes[agent_id].identity
+        )
+
+    def _relink_locked(self, agent_id: str) -> None:
+        """Recompute the edges of one agent and its neighbours (O(n))."""
+        if agent_id not in self._nodes:
+            neighbours: FrozenSet[str] = frozenset()
+            old = self._edges.pop(agent_id, frozenset())
+        else:
+            neighbours = frozenset(p for p in self._nodes if self._allowed_locked(agent_id, p))
+            old = self._edges.get(agent_id, frozenset())
+            self._edges[agent_id] = neighbours
+        for peer_id in old - neighbours:
+            self._edges[peer_id] = self._edges.get(peer_id, frozenset()) - {agent_id}
+        for peer_id in neighbours - old:
+            self._edges[peer_id] = self._edges.get(peer_id, frozenset()) | {agent_id}
+
+    def _schedule_locked(self) -> None:
+        oldest = min((node.fetched_at for node in self._nodes.values()), default=None)
+        self._next_due = float("inf") if oldest is None else oldest + self.ttl
+
+    # --- Background refresh ---
+
+    def _maybe_refresh(self) -> None:
+        if not self._auto_refresh or self._clock() < self._next_due:
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nuggets-trust-graph")
+            executor = self._executor
+        executor.submit(contextvars.copy_context().run, self._background_refresh)
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as exc:
+            logger.warning("Trust graph refresh failed: %s", exc)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def close(self) -> None:
+        """Stop the background refresh thread (a running refresh still finishes)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    # --- Integration ---
+
+    def guard(
+        self,
+        agent_key: str = "agent_id",
+        source_key: Optional[str] = None,
+        min_score: Optional[float] = None,
+        allow: str = "allow",
+        deny: str = "deny",
+    ) -> Callable[[Mapping[str, Any]], str]:
+        """A LangGraph router that checks trust before an agent interaction.
+
+        Returns ``allow`` if ``state[agent_key]`` is trusted (or, with
+        ``source_key``, if ``state[source_key]`` may talk to it), else
+        ``deny``. ``min_score`` replaces ``threshold`` for both checks.
+        Use it with ``add_conditional_edges``.
+        """
+
+        def route(state: Mapping[str, Any]) -> str:
+            agent_id = state.get(agent_key)
+            if not agent_id:
+                return deny
+            if source_key is not None:
+                source_id = state.get(source_key)
+                ok = bool(source_id and self.can_talk(source_id, agent_id, min_score))
+            else:
+                ok = self.is_trusted(agent_id, min_score)
+            return allow if ok else deny
+
+        return route
+
+    def as_tool(self, **kwargs: Any) -> "NuggetsBaseTool":
+        """A ``query_agent_trust`` tool answered from this graph."""
+        from langchain_nuggets.tools.kya.query_agent_trust import QueryAgentTrust
+
+        return QueryAgentTrust(client=self.client, trust_graph=self, **kwargs)
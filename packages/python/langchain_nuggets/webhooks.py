@@ -0,0 +1,178 @@
+"""Webhook receiver for Nuggets session-status events.
+
+Embed ``NuggetsWebhookReceiver`` in any ASGI app at the path configured as
+``WebhookConfig.callback_url``. Each request must carry::
+
+    X-Nuggets-Timestamp: <unix seconds>
+    X-Nuggets-Signature: sha256=<hex HMAC-SHA256 of "<timestamp>.<body>" keyed by secret>
+
+and a JSON body such as::
+
+    {"type": "kyc.session.updated", "data": {"sessionId": "...", "status": "completed", ...}}
+
+Event types starting with ``kyc.`` update KYC sessions; those starting
+with ``credentials.presentation.`` or ``presentation.`` update
+presentations. ``data`` has the same shape as the matching GET response.
+"""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, MutableMapping, Optional, Tuple
+
+from langchain_nuggets.cache import TTLCache
+from langchain_nuggets.sessions import KYC, PRESENTATION, SessionStore
+from langchain_nuggets.types import WebhookConfig
+
+SIGNATURE_HEADER = "x-nuggets-signature"
+TIMESTAMP_HEADER = "x-nuggets-timestamp"
+DEFAULT_TOLERANCE = 300
+DEFAULT_MAX_BODY_BYTES = 64 * 1024
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+
+
+class WebhookVerificationError(Exception):
+    """Raised when a webhook request fails signature or replay checks."""
+
+
+def sign_payload(secret: str, timestamp: str, body: bytes) -> str:
+    """Return the ``X-Nuggets-Signature`` value for a payload."""
+    message = timestamp.encode() + b"." + body
+    return "sha256=" + hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def _event_kind(event_type: str) -> Optional[str]:
+    if event_type.startswith("kyc."):
+        return KYC
+    if event_type.startswith(("credentials.presentation.", "presentation.")):
+        return PRESENTATION
+    return None
+
+
+class NuggetsWebhookReceiver:
+    """ASGI app that verifies Nuggets webhooks and feeds a ``SessionStore``.
+
+    Requests are rejected unless the HMAC signature matches
+    ``config.secret`` and the timestamp is within ``tolerance`` seconds.
+    Each signature is accepted once, so a captured request cannot be
+    replayed inside the window. Terminal session states are stored with
+    ``SessionStore.put``, which wakes any ``wait``/``wait_sync`` callers and
+    switches the wait tools from polling to push.
+
+    Usage::
+
+        store = SessionStore()
+        receiver = NuggetsWebhookReceiver(WebhookConfig(callback_url=..., secret=...), store)
+        app.mount("/nuggets/webhook", receiver)  # Starlette / FastAPI
+    """
+
+    def __init__(
+        self,
+        config: WebhookConfig,
+        store: SessionStore,
+        tolerance: float = DEFAULT_TOLERANCE,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._secret = config.secret
+        self._store = store
+        self._tolerance = tolerance
+        self._max_body_bytes = max_body_bytes
+        self._clock = clock
+        self._seen: TTLCache[bool] = TTLCache(max_size=65536, ttl=2 * tolerance)
+        store.push_enabled = True
+
+    def verify(self, headers: Mapping[str, str], body: bytes) -> None:
+        """Check signature, timestamp window and replay. Header names are lowercase."""
+        signature = headers.get(SIGNATURE_HEADER)
+        timestamp = headers.get(TIMESTAMP_HEADER)
+        if not signature or not timestamp:
+            raise WebhookVerificationError("Missing signature headers")
+        try:
+            sent_at = float(timestamp)
+        except ValueError:
+            raise WebhookVerificationError("Invalid timestamp") from None
+        if abs(self._clock() - sent_at) > self._tolerance:
+            raise WebhookVerificationError("Timestamp outside tolerance")
+        expected = sign_payload(self._secret, timestamp, body)
+        if not signature.startswith("sha256="):
+            signature = "sha256=" + signature
+        if not hmac.compare_digest(expected, signature):
+            raise WebhookVerificationError("Invalid signature")
+        if signature in self._seen:
+            raise WebhookVerificationError("Replayed webhook")
+        self._seen.set(signature, True)
+
+    def handle(self, headers: Mapping[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Verify and apply one webhook. Returns ``(status_code, response_body)``."""
+        try:
+            self.verify(headers, body)
+        except WebhookVerificationError as exc:
+            return 401, {"error": str(exc)}
+        try:
+            event = json.loads(body)
+            data = event["data"]
+            session_id = data["sessionId"]
+            event_type = event["type"]
+        except (ValueError, KeyError, TypeError):
+            return 400, {"error": "Malformed event"}
+        kind = _event_kind(event_type)
+        if kind is None:
+            return 202, {"ignored": True}
+        stored = self._store.put(kind, session_id, data)
+        return 200, {"received": True, "stored": stored}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST":
+            await self._respond(send, 405, {"error": "Method not allowed"})
+            return
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if len(body) > self._max_body_bytes:
+                await self._respond(send, 413, {"error": "Payload too large"})
+                return
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        status, payload = self.handle(headers, bytes(body))
+        await self._respond(send, status, payload)
+
+    @staticmethod
+    async def _lifespan(receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _respond(send: Send, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
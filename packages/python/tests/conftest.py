@@ -12,3 +12,23 @@ TEST_CONFIG = {
 @pytest.fixture
 def client():
     return NuggetsApiClient(TEST_CONFIG)
+
+
+class FakeClock:
+    """A manually advanced clock; ``sleep`` moves it forward and records the delay."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
@@ -108,6 +108,33 @@ async def test_authenticate_with_kyc_enrichment(mock_verifier):
         mock_client.aget.assert_called_once_with("/auth/status/user-123")
 
 
+@pytest.mark.asyncio
+async def test_awarmup_preloads_verifier_and_api_client(mock_verifier):
+    mock_verifier.awarmup = AsyncMock()
+    with patch("langchain_nuggets.langgraph.auth.NuggetsApiClient") as mock_client_cls:
+        mock_client = MagicMock()
+        mock_client.awarmup = AsyncMock()
+        mock_client_cls.return_value = mock_client
+
+        nuggets = NuggetsAuth(
+            issuer_url="https://oidc.nuggets.test",
+            api_url="https://api.nuggets.test",
+            partner_id="pid",
+            partner_secret="psecret",
+        )
+        await nuggets.awarmup()
+
+        mock_verifier.awarmup.assert_awaited_once()
+        mock_client.awarmup.assert_awaited_once()
+
+
+def test_warmup_without_api_client(mock_verifier):
+    with patch.dict(os.environ, {}, clear=True):
+        nuggets = NuggetsAuth(issuer_url="https://oidc.nuggets.test")
+        nuggets.warmup()
+        mock_verifier.warmup.assert_called_once()
+
+
 def test_auth_property_returns_auth_object(mock_verifier):
     nuggets = NuggetsAuth(issuer_url="https://oidc.nuggets.test")
     auth = nuggets.auth
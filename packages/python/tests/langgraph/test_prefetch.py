@@ -0,0 +1,169 @@
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClientError
+from langchain_nuggets.langgraph.prefetch import IdentityPrefetch
+from langchain_nuggets.sessions import KYC, SessionStore
+from langchain_nuggets.trust import TrustScoreCache
+
+RESPONSES = {
+    "/auth/status/user-1": {"authenticated": True, "kycVerified": True},
+    "/kyc/sessions/s-1": {"sessionId": "s-1", "status": "completed"},
+    "/credentials/presentations/p-1": {"sessionId": "p-1", "status": "pending"},
+    "/kya/agents/agent-1/trust-score": {"score": 0.7},
+}
+
+
+def make_client(delay=0.0):
+    client = MagicMock()
+
+    def get(path):
+        time.sleep(delay)
+        return RESPONSES[path]
+
+    async def aget(path):
+        await asyncio.sleep(delay)
+        return RESPONSES[path]
+
+    client.get = MagicMock(side_effect=get)
+    client.aget = AsyncMock(side_effect=aget)
+    return client
+
+
+STATE = {
+    "user_id": "user-1",
+    "kyc_session_id": "s-1",
+    "presentation_session_id": "p-1",
+    "agent_ids": ["agent-1", "agent-1"],
+}
+
+
+class TestIdentityPrefetch:
+    def test_invoke_fetches_everything(self):
+        client = make_client()
+        update = IdentityPrefetch(client).invoke(STATE)
+        context = update["nuggets_identity"]
+        assert context["userId"] == "user-1"
+        assert context["authStatus"]["kycVerified"] is True
+        assert context["kycSession"]["status"] == "completed"
+        assert context["presentation"]["status"] == "pending"
+        assert context["trustScores"] == {"agent-1": {"score": 0.7}}
+        assert context["missing"] == []
+        assert client.get.call_count == 4
+
+    async def test_ainvoke_runs_concurrently(self):
+        client = make_client(delay=0.05)
+        started = time.perf_counter()
+        update = await IdentityPrefetch(client).ainvoke(STATE)
+        assert time.perf_counter() - started < 0.15
+        assert update["nuggets_identity"]["missing"] == []
+        assert client.aget.await_count == 4
+
+    async def test_deadline_reports_missing(self):
+        client = make_client(delay=1.0)
+        update = await IdentityPrefetch(client, timeout=0.05).ainvoke({"user_id": "user-1"})
+        assert update["nuggets_identity"]["missing"] == ["authStatus"]
+        assert "authStatus" not in update["nuggets_identity"]
+
+    def test_sync_deadline_reports_missing(self):
+        client = make_client(delay=0.5)
+        update = IdentityPrefetch(client, timeout=0.05).invoke({"user_id": "user-1"})
+        assert update["nuggets_identity"]["missing"] == ["authStatus"]
+
+    def test_honours_caches(self):
+        client = make_client()
+        store = SessionStore()
+        store.put(KYC, "s-1", {"sessionId": "s-1", "status": "failed"})
+        cache = TrustScoreCache()
+        cache.put("agent-1", {"score": 0.1})
+        prefetch = IdentityPrefetch(client, session_store=store, trust_cache=cache)
+        context = prefetch.invoke({"kyc_session_id": "s-1", "agent_ids": ["agent-1"]})["nuggets_identity"]
+        assert context["kycSession"]["status"] == "failed"
+        assert context["trustScores"]["agent-1"] == {"score": 0.1}
+        client.get.assert_not_called()
+
+    def test_auth_status_cached_between_threads(self):
+        client = make_client()
+        prefetch = IdentityPrefetch(client)
+        prefetch.invoke({"user_id": "user-1"})
+        prefetch.invoke({"user_id": "user-1"})
+        assert client.get.call_count == 1
+
+    def test_auth_status_cached_per_tenant_client(self):
+        client = make_client()
+        tenants = {"acme": MagicMock(), "globex": MagicMock()}
+        active = "acme"
+        client.current_client.side_effect = lambda: tenants[active]
+        prefetch = IdentityPrefetch(client)
+        prefetch.invoke({"user_id": "user-1"})
+        active = "globex"
+        prefetch.invoke({"user_id": "user-1"})
+        prefetch.invoke({"user_id": "user-1"})
+        assert client.get.call_count == 2
+
+    def test_user_from_langgraph_auth_config(self):
+        client = make_client()
+        config = {"configurable": {"langgraph_auth_user": {"identity": "user-1"}}}
+        context = IdentityPrefetch(client).invoke({}, config)["nuggets_identity"]
+        assert context["userId"] == "user-1"
+        assert context["authStatus"]["authenticated"] is True
+
+    def test_skips_when_already_prefetched(self):
+        client = make_client()
+        assert IdentityPrefetch(client).invoke({"nuggets_identity": {}, "user_id": "user-1"}) == {}
+        client.get.assert_not_called()
+
+    def test_api_errors_recorded(self):
+        client = MagicMock()
+        client.get.side_effect = NuggetsApiClientError("nope", "API_ERROR", 500)
+        context = IdentityPrefetch(client).invoke({"user_id": "user-1"})["nuggets_identity"]
+        assert context["authStatus"]["error"] is True
+
+    def test_other_errors_recorded(self):
+        client = MagicMock()
+        client.get.side_effect = httpx.ConnectTimeout("timed out")
+        context = IdentityPrefetch(client).invoke({"user_id": "user-1"})["nuggets_identity"]
+        assert context["authStatus"] == {
+            "error": True, "code": "REQUEST_FAILED", "message": "ConnectTimeout: timed out", "status_code": None,
+        }
+
+    async def test_async_other_errors_recorded(self):
+        client = MagicMock()
+        client.aget = AsyncMock(side_effect=httpx.ReadError("reset"))
+        context = (await IdentityPrefetch(client).ainvoke({"user_id": "user-1"}))["nuggets_identity"]
+        assert context["authStatus"]["code"] == "REQUEST_FAILED"
+
+    def test_workers_capped_and_context_copied(self):
+        tenant = contextvars.ContextVar("tenant", default=None)
+        lock = threading.Lock()
+        running, peak, seen = [0], [0], []
+
+        def get(path):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+                seen.append(tenant.get())
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return {"score": 0.5}
+
+        client = MagicMock()
+        client.get = MagicMock(side_effect=get)
+        tenant.set("acme")
+        state = {"agent_ids": [f"agent-{i}" for i in range(6)]}
+        context = IdentityPrefetch(client, max_concurrency=2).invoke(state)["nuggets_identity"]
+        assert len(context["trustScores"]) == 6
+        assert peak[0] <= 2
+        assert seen == ["acme"] * 6
+
+    async def test_as_runnable(self):
+        runnable = IdentityPrefetch(make_client()).as_runnable()
+        update = await runnable.ainvoke({"user_id": "user-1"})
+        assert update["nuggets_identity"]["authStatus"]["authenticated"] is True
+        assert runnable.invoke({"user_id": "user-1"})["nuggets_identity"]["userId"] == "user-1"
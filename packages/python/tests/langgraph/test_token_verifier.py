@@ -213,6 +213,31 @@ async def test_discovery_caches_endpoints():
     assert discovery_route.call_count == 1
 
 
+@respx.mock
+def test_sync_warmup_preloads_keys():
+    _mock_discovery_and_jwks()
+    verifier = NuggetsTokenVerifier(ISSUER)
+
+    verifier.warmup()
+
+    assert verifier._discovery == DISCOVERY_RESPONSE
+    assert verifier._jwks_keys == _jwks_response["keys"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_awarmup_avoids_fetch_on_first_verify():
+    _mock_discovery_and_jwks()
+    verifier = NuggetsTokenVerifier(ISSUER, audience="test-audience")
+
+    await verifier.awarmup()
+    calls_after_warmup = respx.calls.call_count
+    await verifier.verify_token(_make_jwt({}))
+
+    assert calls_after_warmup == 2
+    assert respx.calls.call_count == 2
+
+
 class TestTokenVerifierTls:
     def test_default_verify_is_true(self):
         verifier = NuggetsTokenVerifier(issuer_url="https://oidc.test")
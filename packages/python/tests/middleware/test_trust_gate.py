@@ -0,0 +1,183 @@
+"""Tests for TrustGate."""
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from langchain_core.messages import ToolMessage
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClientError
+from langchain_nuggets.middleware.trust_gate import TrustGate
+from langchain_nuggets.trust import TrustGraph, TrustScoreCache
+
+SCORES = {"good-agent": 0.9, "weak-agent": 0.4, "ok-agent": 0.75}
+
+
+def make_client():
+    client = MagicMock()
+
+    def get(path):
+        agent_id = path.split("/")[3]
+        if agent_id not in SCORES:
+            raise NuggetsApiClientError("Agent not found", "NOT_FOUND", 404)
+        return {"agentId": agent_id, "score": SCORES[agent_id]}
+
+    async def aget(path):
+        return get(path)
+
+    client.get.side_effect = get
+    client.aget = AsyncMock(side_effect=aget)
+    return client
+
+
+def make_request(name="send_message", args=None):
+    request = MagicMock()
+    request.tool_call = {"name": name, "args": args or {}, "id": "call-1"}
+    return request
+
+
+@pytest.fixture
+def handler():
+    return MagicMock(return_value=ToolMessage(content="sent", tool_call_id="call-1"))
+
+
+@pytest.fixture
+def async_handler():
+    return AsyncMock(return_value=ToolMessage(content="sent", tool_call_id="call-1"))
+
+
+class TestWrapToolCall:
+    def test_trusted_agent_runs_tool(self, handler):
+        gate = TrustGate(make_client())
+        request = make_request(args={"agentId": "good-agent"})
+        assert gate.wrap_tool_call(request, handler).content == "sent"
+        handler.assert_called_once_with(request)
+
+    def test_untrusted_agent_is_denied(self, handler):
+        gate = TrustGate(make_client())
+        result = gate.wrap_tool_call(make_request(args={"agentId": "weak-agent"}), handler)
+        handler.assert_not_called()
+        content = json.loads(result.content)
+        assert content["status"] == "DENIED"
+        assert content["reason_code"] == "TRUST_SCORE_BELOW_THRESHOLD"
+        assert (content["agentId"], content["score"], content["threshold"]) == ("weak-agent", 0.4, 0.7)
+        assert result.tool_call_id == "call-1"
+
+    def test_calls_without_agent_and_exempt_tools_pass_through(self, handler):
+        client = make_client()
+        gate = TrustGate(client)
+        gate.wrap_tool_call(make_request(args={"text": "hi"}), handler)
+        gate.wrap_tool_call(make_request("get_agent_trust_score", {"agentId": "weak-agent"}), handler)
+        assert handler.call_count == 2
+        client.get.assert_not_called()
+
+    def test_per_tool_threshold_and_custom_extractor(self, handler):
+        gate = TrustGate(
+            make_client(),
+            thresholds={"share_customer_data": 0.8},
+            agent_for=lambda name, args: args.get("recipient"),
+        )
+        denied = gate.wrap_tool_call(make_request("share_customer_data", {"recipient": "ok-agent"}), handler)
+        assert json.loads(denied.content)["threshold"] == 0.8
+        gate.wrap_tool_call(make_request("send_message", {"recipient": "ok-agent"}), handler)
+        handler.assert_called_once()
+
+    def test_lookup_errors_fail_closed(self, handler):
+        gate = TrustGate(make_client())
+        result = gate.wrap_tool_call(make_request(args={"agentId": "ghost"}), handler)
+        assert json.loads(result.content)["reason_code"] == "TRUST_SCORE_UNAVAILABLE"
+        handler.assert_not_called()
+
+    def test_transport_errors_fail_closed(self, handler):
+        client = MagicMock()
+        client.get.side_effect = httpx.ConnectTimeout("timed out")
+        result = TrustGate(client).wrap_tool_call(make_request(args={"agentId": "good-agent"}), handler)
+        assert json.loads(result.content)["reason_code"] == "TRUST_SCORE_UNAVAILABLE"
+        handler.assert_not_called()
+
+    def test_scores_served_from_cache(self, handler):
+        client = make_client()
+        gate = TrustGate(client, trust_cache=TrustScoreCache(ttl=60))
+        for _ in range(3):
+            gate.wrap_tool_call(make_request(args={"agentId": "good-agent"}), handler)
+        assert client.get.call_count == 1
+        assert handler.call_count == 3
+
+    def test_miss_without_fetch_denies_and_warms_cache(self, handler):
+        client = make_client()
+        cache = TrustScoreCache()
+        fetched = threading.Event()
+        original = cache.refresh
+
+        def refresh(c, agent_id):
+            try:
+                return original(c, agent_id)
+            finally:
+                fetched.set()
+
+        cache.refresh = refresh
+        gate = TrustGate(client, trust_cache=cache, fetch_on_miss=False)
+        request = make_request(args={"agentId": "good-agent"})
+        assert json.loads(gate.wrap_tool_call(request, handler).content)["reason_code"] == "TRUST_SCORE_UNAVAILABLE"
+        assert fetched.wait(2)
+        cache.close()
+        assert gate.wrap_tool_call(request, handler).content == "sent"
+
+    def test_trust_graph_answers_first(self, handler):
+        client = make_client()
+        graph = TrustGraph(client, auto_refresh=False)
+        graph.load(["weak-agent"])
+        graph._get_score = lambda agent_id, fresh: {"score": 0.95}
+        graph.refresh(stale_only=False)
+        calls = client.get.call_count
+        gate = TrustGate(client, trust_graph=graph)
+        assert gate.wrap_tool_call(make_request(args={"agentId": "weak-agent"}), handler).content == "sent"
+        assert client.get.call_count == calls
+
+
+class TestAwrapToolCall:
+    async def test_trusted_and_untrusted(self, async_handler):
+        gate = TrustGate(make_client())
+        ok = await gate.awrap_tool_call(make_request(args={"agent_id": "good-agent"}), async_handler)
+        assert ok.content == "sent"
+        denied = await gate.awrap_tool_call(make_request(args={"agent_id": "weak-agent"}), async_handler)
+        assert json.loads(denied.content)["status"] == "DENIED"
+        async_handler.assert_awaited_once()
+
+    async def test_transport_errors_fail_closed(self, async_handler):
+        client = MagicMock()
+        client.aget = AsyncMock(side_effect=httpx.ReadError("reset"))
+        result = await TrustGate(client).awrap_tool_call(make_request(args={"agentId": "good-agent"}), async_handler)
+        assert json.loads(result.content)["reason_code"] == "TRUST_SCORE_UNAVAILABLE"
+        async_handler.assert_not_awaited()
+
+    async def test_miss_without_fetch_prefetches_on_loop(self, async_handler):
+        client = make_client()
+        cache = TrustScoreCache()
+        gate = TrustGate(client, trust_cache=cache, fetch_on_miss=False)
+        request = make_request(args={"agentId": "good-agent"})
+        denied = await gate.awrap_tool_call(request, async_handler)
+        assert json.loads(denied.content)["reason_code"] == "TRUST_SCORE_UNAVAILABLE"
+        for _ in range(100):
+            if cache.peek("good-agent") is not None:
+                break
+            await asyncio.sleep(0.01)
+        assert (await gate.awrap_tool_call(request, async_handler)).content == "sent"
+
+
+class TestGuard:
+    def test_routes_hand_offs(self):
+        gate = TrustGate(make_client(), thresholds={"handoff": 0.8})
+        route = gate.guard(agent_key="next_agent")
+        assert route.invoke({"next_agent": "good-agent"}) == "allow"
+        assert route.invoke({"next_agent": "weak-agent"}) == "deny"
+        assert route.invoke({}) == "deny"
+        assert gate.guard(agent_key="next_agent", name="handoff").invoke({"next_agent": "ok-agent"}) == "deny"
+
+    async def test_async_route(self):
+        gate = TrustGate(make_client())
+        route = gate.guard(agent_key="next_agent", allow="share", deny="refuse")
+        assert await route.ainvoke({"next_agent": "good-agent"}) == "share"
+        assert await route.ainvoke({"next_agent": "weak-agent"}) == "refuse"
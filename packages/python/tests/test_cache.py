@@ -0,0 +1,33 @@
+from langchain_nuggets.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_fresh_then_stale_then_expired(self, clock):
+        cache = TTLCache(ttl=10, stale_ttl=5, clock=clock)
+        cache.set("a", 1)
+        assert cache.lookup("a") == (1, True)
+        clock.now = 12
+        assert cache.lookup("a") == (1, False)
+        assert cache.get("a") is None
+        clock.now = 16
+        assert cache.lookup("a") == (None, False)
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = TTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.lookup("a")
+        cache.set("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_invalidate_and_clear(self):
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert "a" not in cache
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,189 @@
+import pytest
+import respx
+from httpx import Response
+
+from langchain_nuggets.client.instrumentation import (
+    ClientHooks,
+    ClientMetrics,
+    Histogram,
+    RequestTimer,
+    route_template,
+)
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
+
+AUTH_RESPONSE = {"token": "auth-token", "expiresIn": 3600}
+
+
+def make_client(hooks):
+    return NuggetsApiClient({
+        "api_url": "https://api.nuggets.test",
+        "partner_id": "partner-123",
+        "partner_secret": "secret-456",
+        "hooks": hooks,
+    })
+
+
+class RecordingHooks(ClientHooks):
+    def __init__(self):
+        self.samples = []
+        self.retries = []
+        self.refreshes = []
+
+    def on_request(self, sample):
+        self.samples.append(sample)
+
+    def on_retry(self, method, route, reason):
+        self.retries.append((method, route, reason))
+
+    def on_token_refresh(self, duration, success):
+        self.refreshes.append(success)
+
+
+class TestRouteTemplate:
+    def test_templates_id_segments(self):
+        assert route_template("/kya/agents/agent-1/trust-score") == "/kya/agents/{id}/trust-score"
+        assert route_template("/kyc/sessions/sess%2F1") == "/kyc/sessions/{id}"
+        assert route_template("/auth/status/user-1") == "/auth/status/{id}"
+
+    def test_static_routes_unchanged(self):
+        assert route_template("/kyc/sessions") == "/kyc/sessions"
+        assert route_template("/authority/evaluate") == "/authority/evaluate"
+
+    def test_unknown_route_strips_query(self):
+        assert route_template("/custom/thing?x=1") == "/custom/thing"
+
+
+class TestHistogram:
+    def test_bucketing_is_cumulative(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value)
+        assert histogram.cumulative() == [("0.1", 1), ("1.0", 3), ("+Inf", 4)]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(4.05)
+
+
+class TestRequestTimer:
+    def test_phases_from_trace_events(self):
+        timer = RequestTimer("GET", "/kyc/sessions/{id}")
+        for event in (
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "connection.start_tls.started",
+            "connection.start_tls.complete",
+            "http11.send_request_body.complete",
+            "http11.receive_response_headers.complete",
+        ):
+            timer.trace(event, {})
+        sample = timer.finish(200, 0.001)
+        assert sample.pool_wait is not None
+        assert sample.connect is not None
+        assert sample.tls is not None
+        assert sample.server is not None
+        assert sample.decode == 0.001
+
+
+class TestClientHooks:
+    @respx.mock
+    def test_sample_per_request_with_route_template(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get("https://api.nuggets.test/kya/agents/agent-1").mock(
+            return_value=Response(200, json={"agentId": "agent-1"})
+        )
+        hooks = RecordingHooks()
+        client = make_client(hooks)
+        client.get("/kya/agents/agent-1")
+        client.get("/kya/agents/agent-1")
+        assert [s.route for s in hooks.samples] == ["/kya/agents/{id}"] * 2
+        assert hooks.samples[0].status_code == 200
+        assert hooks.samples[0].decode is not None
+        assert hooks.refreshes == [True]
+
+    @respx.mock
+    def test_rejected_token_refreshes_and_retries_once(self):
+        auth_route = respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get("https://api.nuggets.test/kyc/sessions/s-1").mock(
+            side_effect=[
+                Response(401, json={"code": "TOKEN_REVOKED", "message": "Revoked"}),
+                Response(200, json={"sessionId": "s-1", "status": "pending"}),
+            ]
+        )
+        hooks = RecordingHooks()
+        client = make_client(hooks)
+        assert client.get("/kyc/sessions/s-1")["status"] == "pending"
+        assert auth_route.call_count == 2
+        assert hooks.retries == [("GET", "/kyc/sessions/{id}", "token_rejected")]
+        assert [s.status_code for s in hooks.samples] == [401, 200]
+
+    @respx.mock
+    def test_persistent_401_raises(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get("https://api.nuggets.test/kyc/sessions/s-1").mock(
+            return_value=Response(401, json={"code": "FORBIDDEN", "message": "Nope"})
+        )
+        client = make_client(None)
+        with pytest.raises(NuggetsApiClientError) as exc_info:
+            client.get("/kyc/sessions/s-1")
+        assert exc_info.value.code == "FORBIDDEN"
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_async_second_401_is_not_retried(self):
+        auth_route = respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get("https://api.nuggets.test/kyc/sessions/s-1").mock(
+            return_value=Response(401, json={"code": "FORBIDDEN", "message": "Nope"})
+        )
+        hooks = RecordingHooks()
+        client = make_client(hooks)
+        with pytest.raises(NuggetsApiClientError) as exc_info:
+            await client.aget("/kyc/sessions/s-1")
+        assert exc_info.value.status_code == 401
+        assert (route.call_count, auth_route.call_count) == (2, 2)
+        assert hooks.retries == [("GET", "/kyc/sessions/{id}", "token_rejected")]
+
+    @respx.mock
+    async def test_async_requests_are_recorded(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.post("https://api.nuggets.test/kyc/sessions").mock(
+            return_value=Response(200, json={"sessionId": "s-1"})
+        )
+        hooks = RecordingHooks()
+        client = make_client(hooks)
+        await client.apost("/kyc/sessions", {"userId": "u"})
+        assert [(s.method, s.route) for s in hooks.samples] == [("POST", "/kyc/sessions")]
+
+
+class TestClientMetrics:
+    @respx.mock
+    def test_prometheus_export(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get("https://api.nuggets.test/auth/status/u-1").mock(
+            return_value=Response(200, json={"authenticated": True})
+        )
+        metrics = ClientMetrics()
+        client = make_client(metrics)
+        client.get("/auth/status/u-1")
+        text = metrics.to_prometheus()
+        assert 'nuggets_client_requests_total{method="GET",route="/auth/status/{id}",status="200"} 1' in text
+        assert "nuggets_client_token_refreshes_total 1" in text
+        assert 'phase="total",le="+Inf"} 1' in text
+
+    def test_route_cardinality_is_bounded(self):
+        metrics = ClientMetrics(max_routes=2)
+        for i in range(5):
+            timer = RequestTimer("GET", f"/custom/{i}")
+            metrics.on_request(timer.finish(200))
+        routes = {row["route"] for row in metrics.snapshot()["requests"]}
+        assert routes == {"/custom/0", "/custom/1", "{other}"}
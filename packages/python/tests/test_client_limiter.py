@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import respx
+from httpx import Response
+
+from langchain_nuggets.client.limiter import RequestLimiter, build_limiter, default_run_key
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+
+TEST_CONFIG = {
+    "api_url": "https://api.nuggets.test",
+    "partner_id": "test-partner",
+    "partner_secret": "test-secret",
+}
+
+
+def task_run_key():
+    """Run key = task name up to the first '-', e.g. 'a-1' -> 'a'."""
+    return asyncio.current_task().get_name().split("-")[0]
+
+
+async def record_order(limiter, requests):
+    """Hold the only slot, queue ``requests`` in order, then record grant order."""
+    order = []
+    release = asyncio.Event()
+
+    async def holder():
+        async with limiter.aslot("/kyc/sessions/x"):
+            await release.wait()
+
+    async def request(path):
+        async with limiter.aslot(path):
+            order.append(asyncio.current_task().get_name())
+
+    tasks = [asyncio.create_task(holder(), name="holder")]
+    await asyncio.sleep(0)
+    for name, path in requests:
+        tasks.append(asyncio.create_task(request(path), name=name))
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestRequestLimiter:
+    def test_bounds_threads(self):
+        limiter = RequestLimiter(max_concurrency=2)
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def work():
+            with limiter.slot("/kya/agents/a"):
+                with lock:
+                    in_flight.append(1)
+                    peak.append(len(in_flight))
+                time.sleep(0.01)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(peak) == 2
+        assert limiter.active == 0
+
+    async def test_round_robin_across_runs(self):
+        limiter = RequestLimiter(max_concurrency=1, run_key=task_run_key)
+        order = await record_order(
+            limiter,
+            [("a-1", "/kya/agents/1"), ("a-2", "/kya/agents/2"), ("a-3", "/kya/agents/3"),
+             ("b-1", "/kya/agents/4")],
+        )
+        assert order == ["a-1", "b-1", "a-2", "a-3"]
+
+    async def test_priority_lane_jumps_queue(self):
+        limiter = RequestLimiter(max_concurrency=1, run_key=task_run_key)
+        order = await record_order(
+            limiter,
+            [("a-1", "/kya/agents/1/trust-score"), ("a-2", "/kya/agents/2/trust-score"),
+             ("b-1", "/authority/evaluate"), ("c-1", "/auth/status/u")],
+        )
+        assert order == ["b-1", "c-1", "a-1", "a-2"]
+
+    async def test_per_run_cap(self):
+        limiter = RequestLimiter(max_concurrency=4, per_run=1, run_key=task_run_key)
+        release = asyncio.Event()
+        entered = []
+
+        async def request():
+            async with limiter.aslot("/kya/agents/a"):
+                entered.append(asyncio.current_task().get_name())
+                await release.wait()
+
+        tasks = [asyncio.create_task(request(), name=n) for n in ("a-1", "a-2", "b-1")]
+        await asyncio.sleep(0.01)
+        assert sorted(entered) == ["a-1", "b-1"]
+        assert limiter.waiting == 1
+        release.set()
+        await asyncio.gather(*tasks)
+        assert sorted(entered) == ["a-1", "a-2", "b-1"]
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = RequestLimiter(max_concurrency=1)
+        async with limiter.aslot("/kya/agents/a"):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(_enter(limiter), 0.01)
+            assert limiter.waiting == 0
+        assert limiter.active == 0
+        await _enter(limiter)
+
+    def test_default_run_key_uses_thread_id(self):
+        from langchain_core.runnables.config import var_child_runnable_config
+
+        token = var_child_runnable_config.set({"configurable": {"thread_id": "t-1"}})
+        try:
+            assert default_run_key() == ("thread_id", "t-1")
+        finally:
+            var_child_runnable_config.reset(token)
+        assert default_run_key() == ("thread", threading.get_ident())
+
+    def test_build_limiter(self):
+        assert build_limiter(None, None) is None
+        limiter = build_limiter(None, 2)
+        assert (limiter.max_concurrency, limiter.per_run) == (16, 2)
+        with pytest.raises(ValueError):
+            RequestLimiter(max_concurrency=0)
+
+
+async def _enter(limiter):
+    async with limiter.aslot("/kya/agents/b"):
+        pass
+
+
+class TestClientWithLimiter:
+    @respx.mock
+    def test_sync_request_holds_slot(self):
+        limiter = RequestLimiter(max_concurrency=1)
+        seen = []
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json={"token": "t", "expiresIn": 3600})
+        )
+        respx.get("https://api.nuggets.test/test").mock(
+            side_effect=lambda request: seen.append(limiter.active) or Response(200, json={})
+        )
+        client = NuggetsApiClient({**TEST_CONFIG, "limiter": limiter})
+        client.get("/test")
+        assert seen == [1]
+        assert limiter.active == 0
+
+    @respx.mock
+    async def test_async_request_holds_slot(self):
+        limiter = RequestLimiter(max_concurrency=1)
+        seen = []
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json={"token": "t", "expiresIn": 3600})
+        )
+        respx.get("https://api.nuggets.test/test").mock(
+            side_effect=lambda request: seen.append(limiter.active) or Response(200, json={})
+        )
+        client = NuggetsApiClient({**TEST_CONFIG, "limiter": limiter})
+        await asyncio.gather(client.aget("/test"), client.aget("/test"))
+        assert seen == [1, 1]
+        assert limiter.active == 0
+
+
+def test_run_batch_workers_inherit_run_config():
+    from langchain_core.runnables.config import var_child_runnable_config
+
+    from langchain_nuggets.batch import run_batch
+
+    token = var_child_runnable_config.set({"configurable": {"thread_id": "t-9"}})
+    try:
+        keys = run_batch(["a", "b", "c"], lambda key: default_run_key(), max_concurrency=3)
+    finally:
+        var_child_runnable_config.reset(token)
+    assert set(keys.values()) == {("thread_id", "t-9")}
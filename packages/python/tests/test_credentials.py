@@ -0,0 +1,136 @@
+import pytest
+
+from langchain_nuggets.credentials import CredentialCache, credential_expiry, matches_type
+from langchain_nuggets.sessions import KYC, PRESENTATION
+
+EMAIL = {
+    "id": "vc-email",
+    "type": ["VerifiableCredential", "EmailCredential"],
+    "issuer": "did:web:nuggets.life",
+    "issuanceDate": "2026-01-01T00:00:00Z",
+    "expirationDate": "2027-01-01T00:00:00Z",
+    "credentialSubject": {"email": "user@example.com"},
+}
+PHONE = {
+    "id": "vc-phone",
+    "type": ["VerifiableCredential", "PhoneCredential"],
+    "issuer": "did:web:nuggets.life",
+    "issuanceDate": "2026-01-01T00:00:00Z",
+    "credentialSubject": {"phone": "+44 7700 900000"},
+}
+NOW = 1_790_000_000.0  # 2026-09-21
+
+
+def reuse_all(user_id, credential_type, credential):
+    return True
+
+
+@pytest.fixture
+def clock(clock):
+    clock.now = NOW
+    return clock
+
+
+class TestHelpers:
+    def test_credential_expiry(self):
+        assert credential_expiry(EMAIL) == 1_798_761_600.0
+        assert credential_expiry({"validUntil": "2027-01-01T00:00:00"}) == 1_798_761_600.0
+        assert credential_expiry(PHONE) is None
+        assert credential_expiry({"expirationDate": "soon"}) == 0.0
+
+    @pytest.mark.parametrize("wanted", ["email", "Email", "EmailCredential"])
+    def test_matches_type(self, wanted):
+        assert matches_type(EMAIL, wanted)
+
+    def test_matches_subject_claim(self):
+        assert matches_type({"type": ["VerifiableCredential"], "credentialSubject": {"phone": "1"}}, "phone")
+        assert not matches_type(EMAIL, "phone")
+
+
+class TestCredentialCache:
+    def test_completed_kyc_session_is_cached(self, clock):
+        cache = CredentialCache(clock=clock, policy=reuse_all)
+        cache.track({"sessionId": "s-1"}, "user-1", ["email"])
+        cache.observe(KYC, "s-1", {"sessionId": "s-1", "status": "pending"})
+        assert cache.get("user-1", "email") is None
+        cache.observe(KYC, "s-1", {"sessionId": "s-1", "status": "completed", "credentials": [EMAIL]})
+        assert cache.get("user-1", "email") == EMAIL
+        assert cache.get("user-2", "email") is None
+
+    def test_untracked_session_ignored(self, clock):
+        cache = CredentialCache(clock=clock, policy=reuse_all)
+        cache.observe(KYC, "s-1", {"status": "completed", "credentials": [EMAIL]})
+        assert len(cache) == 0
+
+    def test_presentation_matches_types_and_requires_verification(self, clock):
+        cache = CredentialCache(clock=clock, policy=reuse_all)
+        cache.track({"sessionId": "p-1"}, "user-1", ["email", "phone"])
+        cache.observe(PRESENTATION, "p-1", {"status": "presented", "verified": False, "credentials": [EMAIL, PHONE]})
+        assert len(cache) == 0
+        cache.observe(PRESENTATION, "p-1", {"status": "presented", "verified": True, "credentials": [EMAIL, PHONE]})
+        assert cache.get_all("user-1", ["phone", "email"]) == [PHONE, EMAIL]
+        assert cache.get_all("user-1", ["email", "address"]) is None
+
+    @pytest.mark.parametrize("result", [
+        {"status": "presented", "credentials": [EMAIL]},
+        {"status": "presented", "verified": None, "credentials": [EMAIL]},
+        {"status": "presented", "verified": True, "proofVerification": {}, "credentials": [EMAIL]},
+        {"status": "presented", "verified": True, "proofVerification": {"verified": False}, "credentials": [EMAIL]},
+    ])
+    def test_presentation_without_positive_verification_not_cached(self, result, clock):
+        cache = CredentialCache(clock=clock, policy=reuse_all)
+        cache.track({"sessionId": "p-1"}, "user-1", ["email"])
+        cache.observe(PRESENTATION, "p-1", result)
+        assert len(cache) == 0
+
+    def test_session_ids_of_cached_credentials(self, clock):
+        cache = CredentialCache(clock=clock, policy=reuse_all)
+        cache.track({"sessionId": "p-1"}, "user-1", ["email"])
+        cache.track({"sessionId": "p-2"}, "user-1", ["phone"])
+        cache.observe(PRESENTATION, "p-1", {"status": "presented", "verified": True, "credentials": [EMAIL]})
+        cache.observe(PRESENTATION, "p-2", {
+            "status": "presented", "verified": True, "proofVerification": {"verified": True}, "credentials": [PHONE],
+        })
+        assert cache.session_ids("user-1", ["email", "phone"]) == ["p-1", "p-2"]
+        cache.put("user-1", "email", EMAIL)
+        assert cache.session_ids("user-1", ["email"]) == []
+
+    def test_revocation_check_interval(self, clock):
+        cache = CredentialCache(revocation_check_interval=600, clock=clock, policy=reuse_all)
+        cache.put("user-1", "email", EMAIL)
+        clock.now += 599
+        assert cache.get("user-1", "email") == EMAIL
+        clock.now += 1
+        assert cache.get("user-1", "email") is None
+
+    def test_expired_credential_not_reused(self, clock):
+        clock.now = 1_798_761_600.0 - 1
+        cache = CredentialCache(clock=clock, policy=reuse_all)
+        cache.put("user-1", "email", EMAIL)
+        assert cache.get("user-1", "email") == EMAIL
+        clock.now += 1
+        assert cache.get("user-1", "email") is None
+
+    def test_policy(self, clock):
+        cache = CredentialCache(clock=clock, policy=lambda user, ctype, cred: ctype == "email")
+        cache.put("user-1", "email", EMAIL)
+        cache.put("user-1", "phone", PHONE)
+        assert cache.get("user-1", "email") == EMAIL
+        assert cache.get("user-1", "phone") is None
+
+    def test_no_reuse_without_policy(self, clock):
+        cache = CredentialCache(clock=clock)
+        cache.put("user-1", "email", EMAIL)
+        assert cache.get("user-1", "email") is None
+        assert cache.get_all("user-1", ["email"]) is None
+
+    def test_invalidate(self, clock):
+        cache = CredentialCache(clock=clock, policy=reuse_all)
+        cache.put("user-1", "email", EMAIL)
+        cache.put("user-1", "phone", PHONE)
+        cache.put("user-2", "email", EMAIL)
+        cache.invalidate("user-1", "phone")
+        assert cache.get("user-1", "email") == EMAIL
+        cache.invalidate("user-1")
+        assert cache.get("user-1", "email") is None
+        assert cache.get("user-2", "email") == EMAIL
@@ -0,0 +1,169 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
+from langchain_nuggets.did import AgentResolver
+from langchain_nuggets.tools.kya import (
+    BatchVerifyAgentIdentities,
+    RegisterAgentIdentity,
+    VerifyAgentIdentity,
+)
+
+AGENT = {"agentId": "agent-1", "did": "did:nuggets:agent-1", "agentName": "Helper"}
+NOT_FOUND = NuggetsApiClientError("Agent not found", "NOT_FOUND", 404)
+
+
+def make_client():
+    return NuggetsApiClient({
+        "api_url": "https://api.nuggets.test",
+        "partner_id": "test-partner",
+        "partner_secret": "test-secret",
+    })
+
+
+class TestAgentResolver:
+    def test_record_served_by_id_and_did(self):
+        client = MagicMock()
+        client.get.return_value = AGENT
+        resolver = AgentResolver()
+        assert resolver.resolve(client, "agent-1") == AGENT
+        assert resolver.resolve(client, "did:nuggets:agent-1") == AGENT
+        client.get.assert_called_once_with("/kya/agents/agent-1")
+
+    def test_record_expires_after_ttl(self, clock):
+        client = MagicMock()
+        client.get.return_value = AGENT
+        resolver = AgentResolver(ttl=60, clock=clock)
+        resolver.resolve(client, "agent-1")
+        clock.now += 61
+        assert resolver.peek("agent-1") is None
+        resolver.resolve(client, "agent-1")
+        assert client.get.call_count == 2
+
+    def test_unknown_agent_is_negatively_cached(self, clock):
+        client = MagicMock()
+        client.get.side_effect = NOT_FOUND
+        resolver = AgentResolver(negative_ttl=30, clock=clock)
+        for _ in range(2):
+            with pytest.raises(NuggetsApiClientError) as info:
+                resolver.resolve(client, "ghost")
+            assert (info.value.code, info.value.status_code) == ("NOT_FOUND", 404)
+        assert client.get.call_count == 1
+        clock.now += 31
+        with pytest.raises(NuggetsApiClientError):
+            resolver.resolve(client, "ghost")
+        assert client.get.call_count == 2
+
+    def test_other_errors_are_not_cached(self):
+        client = MagicMock()
+        client.get.side_effect = [NuggetsApiClientError("down", "UNAVAILABLE", 503), AGENT]
+        resolver = AgentResolver()
+        with pytest.raises(NuggetsApiClientError):
+            resolver.resolve(client, "agent-1")
+        assert resolver.resolve(client, "agent-1") == AGENT
+
+    async def test_async_resolve_and_negative_cache(self):
+        client = MagicMock()
+        client.aget = AsyncMock(side_effect=[AGENT, NOT_FOUND])
+        resolver = AgentResolver()
+        assert await resolver.aresolve(client, "agent-1") == AGENT
+        assert await resolver.aresolve(client, "agent-1") == AGENT
+        for _ in range(2):
+            with pytest.raises(NuggetsApiClientError):
+                await resolver.aresolve(client, "ghost")
+        assert client.aget.await_count == 2
+
+    def test_invalidate_identity_drops_all_keys_and_negative_entries(self):
+        client = MagicMock()
+        client.get.side_effect = [NOT_FOUND, AGENT]
+        resolver = AgentResolver()
+        with pytest.raises(NuggetsApiClientError):
+            resolver.resolve(client, "agent-1")
+        resolver.invalidate_identity(AGENT)
+        assert resolver.resolve(client, "agent-1") == AGENT
+        resolver.invalidate_identity(AGENT)
+        assert resolver.peek("agent-1") is None
+        assert resolver.peek("did:nuggets:agent-1") is None
+
+    def test_persists_across_instances(self, tmp_path, clock):
+        path = str(tmp_path / "agents.db")
+        client = MagicMock()
+        client.get.side_effect = [AGENT, NOT_FOUND]
+        first = AgentResolver(ttl=60, path=path, clock=clock)
+        first.resolve(client, "agent-1")
+        with pytest.raises(NuggetsApiClientError):
+            first.resolve(client, "ghost")
+        first.close()
+
+        second = AgentResolver(ttl=60, path=path, clock=clock)
+        assert second.resolve(client, "did:nuggets:agent-1") == AGENT
+        with pytest.raises(NuggetsApiClientError):
+            second.resolve(client, "ghost")
+        assert client.get.call_count == 2
+        clock.now += 61
+        assert second.peek("agent-1") is None  # expiry is kept, not reset by loading
+        second.clear()
+        assert AgentResolver(path=path, clock=clock).peek("agent-1") is None
+
+
+class TestDidDocuments:
+    DOCUMENT = {
+        "id": "did:web:issuer.example",
+        "verificationMethod": [
+            {"id": "#key-1", "type": "JsonWebKey2020", "publicKeyJwk": {"kty": "OKP", "crv": "Ed25519", "x": "abc"}},
+        ],
+    }
+
+    def test_documents_and_failures_are_cached(self):
+        loader = MagicMock(side_effect=lambda did: self.DOCUMENT if did == "did:web:issuer.example" else None)
+        resolver = AgentResolver(did_loader=loader)
+        assert resolver.resolve_did("did:web:issuer.example") == self.DOCUMENT
+        assert resolver.resolve_did("did:web:issuer.example") == self.DOCUMENT
+        assert resolver.resolve_did("did:web:missing.example") is None
+        assert resolver.resolve_did("did:web:missing.example") is None
+        assert loader.call_count == 2
+
+    def test_verification_key(self):
+        resolver = AgentResolver(did_loader=lambda did: self.DOCUMENT)
+        assert resolver.verification_key("did:web:issuer.example#key-1")["crv"] == "Ed25519"
+        assert resolver.verification_key("did:web:issuer.example#key-2") is None
+        assert AgentResolver().verification_key("did:web:issuer.example#key-1") is None
+
+
+class TestTools:
+    def test_verify_agent_identity_uses_resolver(self):
+        client = make_client()
+        client.get = MagicMock(return_value=AGENT)
+        tool = VerifyAgentIdentity(client=client, agent_resolver=AgentResolver())
+        assert json.loads(tool.invoke({"agentId": "agent-1"})) == AGENT
+        assert json.loads(tool.invoke({"agentId": "did:nuggets:agent-1"})) == AGENT
+        client.get.assert_called_once_with("/kya/agents/agent-1")
+
+    async def test_unknown_agent_returns_error_payload(self):
+        client = make_client()
+        client.aget = AsyncMock(side_effect=NOT_FOUND)
+        tool = VerifyAgentIdentity(client=client, agent_resolver=AgentResolver())
+        for _ in range(2):
+            parsed = json.loads(await tool.ainvoke({"agentId": "ghost"}))
+            assert parsed["error"] is True and parsed["status_code"] == 404
+        client.aget.assert_awaited_once()
+
+    def test_batch_identities_use_resolver(self):
+        client = make_client()
+        client.get = MagicMock(return_value=AGENT)
+        resolver = AgentResolver()
+        resolver.put(AGENT)
+        tool = BatchVerifyAgentIdentities(client=client, agent_resolver=resolver)
+        parsed = json.loads(tool.invoke({"agentIds": ["agent-1", "did:nuggets:agent-1"], "includeTrustScores": False}))
+        assert parsed["agent-1"]["identity"] == AGENT
+        client.get.assert_not_called()
+
+    def test_register_invalidates_resolver(self):
+        client = make_client()
+        client.post = MagicMock(return_value=AGENT)
+        resolver = AgentResolver()
+        resolver.put({**AGENT, "agentName": "Old"})
+        RegisterAgentIdentity(client=client, agent_resolver=resolver).invoke({"agentName": "Helper"})
+        assert resolver.peek("agent-1") is None
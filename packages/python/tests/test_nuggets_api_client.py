@@ -86,6 +86,32 @@ class TestNuggetsApiClient:
         assert str(exc_info.value) == "Not found"
 
 
+class TestNuggetsApiClientWarmup:
+    @respx.mock
+    def test_warmup_authenticates_once(self):
+        auth_route = respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get("https://api.nuggets.test/test").mock(
+            return_value=Response(200, json={"data": "test"})
+        )
+        client = NuggetsApiClient(TEST_CONFIG)
+        client.warmup()
+        client.get("/test")
+        assert auth_route.call_count == 1
+
+    @respx.mock
+    async def test_awarmup_opens_async_pool_even_with_cached_token(self):
+        auth_route = respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        client = NuggetsApiClient(TEST_CONFIG)
+        client.warmup()
+        await client.awarmup()
+        assert auth_route.call_count == 2
+        assert client._async_client is not None
+
+
 class TestNuggetsApiClientTls:
     def test_default_verify_is_true(self):
         client = NuggetsApiClient(TEST_CONFIG)
@@ -113,3 +139,125 @@ class TestNuggetsApiClientTls:
             # The path doesn't exist, so httpx will raise when creating the client
             # This verifies the verify param is actually passed through
             client._get_sync_client()
+
+
+class TestNuggetsApiClientResponseDecoding:
+    @respx.mock
+    def test_rejects_declared_oversized_body(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get("https://api.nuggets.test/big").mock(
+            return_value=Response(200, json={"blob": "x" * 2048})
+        )
+        client = NuggetsApiClient({**TEST_CONFIG, "max_response_bytes": 1024})
+        with pytest.raises(NuggetsApiClientError) as exc_info:
+            client.get("/big")
+        assert exc_info.value.code == "RESPONSE_TOO_LARGE"
+
+    @respx.mock
+    def test_rejects_streamed_oversized_body(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        chunks = [b'{"blob": "', b"x" * 600, b"x" * 600, b'"}']
+        respx.get("https://api.nuggets.test/big").mock(
+            return_value=Response(200, content=iter(chunks))
+        )
+        client = NuggetsApiClient({**TEST_CONFIG, "max_response_bytes": 1024})
+        with pytest.raises(NuggetsApiClientError) as exc_info:
+            client.get("/big")
+        assert exc_info.value.code == "RESPONSE_TOO_LARGE"
+
+    @respx.mock
+    def test_limit_can_be_disabled(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get("https://api.nuggets.test/big").mock(
+            return_value=Response(200, json={"blob": "x" * 2048})
+        )
+        client = NuggetsApiClient({**TEST_CONFIG, "max_response_bytes": None})
+        assert len(client.get("/big")["blob"]) == 2048
+
+    @respx.mock
+    async def test_async_stream_limit(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get("https://api.nuggets.test/big").mock(
+            return_value=Response(200, json={"blob": "x" * 2048})
+        )
+        client = NuggetsApiClient({**TEST_CONFIG, "max_response_bytes": 1024})
+        with pytest.raises(NuggetsApiClientError) as exc_info:
+            await client.aget("/big")
+        assert exc_info.value.code == "RESPONSE_TOO_LARGE"
+
+
+class TestNuggetsApiClientCompression:
+    LARGE_BODY = {"credentialTypes": [f"type-{i}" for i in range(200)]}
+
+    def _mock(self):
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        return respx.post("https://api.nuggets.test/credentials/presentations").mock(
+            return_value=Response(200, json={"sessionId": "p-1"})
+        )
+
+    @respx.mock
+    def test_disabled_by_default(self):
+        route = self._mock()
+        NuggetsApiClient(TEST_CONFIG).post("/credentials/presentations", self.LARGE_BODY)
+        request = route.calls.last.request
+        assert "content-encoding" not in request.headers
+        assert json.loads(request.content) == self.LARGE_BODY
+
+    @respx.mock
+    def test_gzip_above_threshold(self):
+        import gzip
+
+        route = self._mock()
+        client = NuggetsApiClient({**TEST_CONFIG, "compress_requests": "gzip"})
+        client.post("/credentials/presentations", self.LARGE_BODY)
+        request = route.calls.last.request
+        assert request.headers["content-encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.content)) == self.LARGE_BODY
+
+    @respx.mock
+    def test_small_bodies_are_not_compressed(self):
+        route = self._mock()
+        client = NuggetsApiClient({**TEST_CONFIG, "compress_requests": "gzip"})
+        client.post("/credentials/presentations", {"userId": "u"})
+        assert "content-encoding" not in route.calls.last.request.headers
+
+    @respx.mock
+    async def test_zstd_async(self):
+        zstandard = pytest.importorskip("zstandard")
+        route = self._mock()
+        client = NuggetsApiClient({**TEST_CONFIG, "compress_requests": "zstd"})
+        await client.apost("/credentials/presentations", self.LARGE_BODY)
+        request = route.calls.last.request
+        assert request.headers["content-encoding"] == "zstd"
+        decompressed = zstandard.ZstdDecompressor().decompress(request.content)
+        assert json.loads(decompressed) == self.LARGE_BODY
+
+    @respx.mock
+    def test_compressed_response_is_decoded(self):
+        import gzip
+
+        respx.post("https://api.nuggets.test/partner/auth").mock(
+            return_value=Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get("https://api.nuggets.test/test").mock(
+            return_value=Response(
+                200,
+                content=gzip.compress(b'{"data": "test"}'),
+                headers={"Content-Encoding": "gzip"},
+            )
+        )
+        assert NuggetsApiClient(TEST_CONFIG).get("/test") == {"data": "test"}
+
+    def test_rejects_unknown_encoding(self):
+        with pytest.raises(ValueError, match="Unsupported"):
+            NuggetsApiClient({**TEST_CONFIG, "compress_requests": "lzma"})
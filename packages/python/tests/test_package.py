@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+import langchain_nuggets
+
+
+class TestLazyImports:
+    def test_all_names_resolve(self):
+        for name in langchain_nuggets.__all__:
+            assert getattr(langchain_nuggets, name) is not None
+
+    def test_dir_lists_lazy_names(self):
+        assert "NuggetsToolkit" in dir(langchain_nuggets)
+
+    def test_unknown_attribute(self):
+        try:
+            langchain_nuggets.DoesNotExist
+        except AttributeError as exc:
+            assert "DoesNotExist" in str(exc)
+        else:
+            raise AssertionError("expected AttributeError")
+
+    def test_client_import_does_not_load_tools(self):
+        code = (
+            "import sys; from langchain_nuggets import NuggetsApiClient; "
+            "loaded = [m for m in sys.modules if m.startswith(('langchain_nuggets.tools', "
+            "'langchain_nuggets.middleware', 'langchain_nuggets.langgraph', 'langchain_core'))]; "
+            "print(','.join(loaded))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
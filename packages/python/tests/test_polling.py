@@ -0,0 +1,70 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from langchain_nuggets.polling import PollPolicy, await_session, wait_for_session
+from langchain_nuggets.sessions import KYC, PRESENTATION, SessionStore
+
+PENDING = {"sessionId": "s-1", "status": "pending"}
+COMPLETED = {"sessionId": "s-1", "status": "completed"}
+
+
+class TestPollPolicy:
+    def test_delays_grow_and_cap(self):
+        policy = PollPolicy(initial_interval=1, max_interval=4, multiplier=2, jitter=0)
+        delays = policy.delays()
+        assert [next(delays) for _ in range(5)] == [1, 2, 4, 4, 4]
+
+
+class TestWaitForSession:
+    def test_returns_on_terminal_state(self, clock):
+        client = MagicMock()
+        client.get.side_effect = [PENDING, PENDING, COMPLETED]
+        policy = PollPolicy(initial_interval=1, multiplier=2, jitter=0)
+        result = wait_for_session(
+            client, KYC, "s-1", 60, policy=policy, clock=clock, sleep=clock.sleep
+        )
+        assert result == COMPLETED
+        assert clock.sleeps == [1, 2]
+        client.get.assert_called_with("/kyc/sessions/s-1")
+
+    def test_times_out_with_last_state(self, clock):
+        client = MagicMock()
+        client.get.return_value = PENDING
+        policy = PollPolicy(initial_interval=2, multiplier=2, jitter=0)
+        result = wait_for_session(
+            client, KYC, "s-1", 5, policy=policy, clock=clock, sleep=clock.sleep
+        )
+        assert result == {**PENDING, "timedOut": True}
+        assert clock.sleeps == [2, 3]
+
+    def test_timeout_is_capped_by_policy(self, clock):
+        client = MagicMock()
+        client.get.return_value = PENDING
+        policy = PollPolicy(initial_interval=1, multiplier=1, jitter=0, max_timeout=3)
+        wait_for_session(client, KYC, "s-1", 3600, policy=policy, clock=clock, sleep=clock.sleep)
+        assert clock.now == 3
+
+    def test_uses_session_store(self):
+        store = SessionStore()
+        store.put(KYC, "s-1", COMPLETED)
+        client = MagicMock()
+        assert wait_for_session(client, KYC, "s-1", 60, store=store) == COMPLETED
+        client.get.assert_not_called()
+
+
+class TestAwaitSession:
+    async def test_polls_until_presented(self):
+        client = MagicMock()
+        client.aget = AsyncMock(
+            side_effect=[{"status": "pending"}, {"status": "presented", "verified": True}]
+        )
+        policy = PollPolicy(initial_interval=0.01, jitter=0)
+        result = await await_session(client, PRESENTATION, "p-1", 5, policy=policy)
+        assert result == {"status": "presented", "verified": True}
+        assert client.aget.await_count == 2
+
+    async def test_times_out(self):
+        client = MagicMock()
+        client.aget = AsyncMock(return_value={"status": "pending"})
+        policy = PollPolicy(initial_interval=0.01, jitter=0)
+        result = await await_session(client, PRESENTATION, "p-1", 0.03, policy=policy)
+        assert result["timedOut"] is True
@@ -0,0 +1,50 @@
+import json
+
+from langchain_nuggets.projection import OutputProjection
+
+PRESENTATION = {
+    "status": "presented",
+    "verified": True,
+    "error": None,
+    "credentials": [
+        {
+            "id": "vc-1",
+            "type": ["VerifiableCredential"],
+            "credentialSubject": {"name": "Ada", "address": "x" * 1000},
+            "proof": {"jws": "eyJ..." * 50},
+        },
+        {"id": "vc-2", "credentialSubject": {"over18": True}, "proof": {"jws": "eyJ"}},
+    ],
+}
+
+
+class TestOutputProjection:
+    def test_default_drops_proofs_nulls_and_truncates_subjects(self):
+        projected = OutputProjection().project("verify_presentation", PRESENTATION)
+        assert "error" not in projected
+        big, small = projected["credentials"]
+        assert "proof" not in big
+        assert big["credentialSubject"] == {"truncated": True, "claims": ["address", "name"]}
+        assert small["credentialSubject"] == {"over18": True}
+
+    def test_field_allowlist_per_tool(self):
+        projection = OutputProjection(fields={"verify_presentation": ["status", "verified"]})
+        assert projection.project("verify_presentation", PRESENTATION) == {
+            "status": "presented",
+            "verified": True,
+        }
+        assert "credentials" in projection.project("other_tool", PRESENTATION)
+
+    def test_allowlist_keeps_error_payloads(self):
+        projection = OutputProjection(fields={"t": ["status"]})
+        error = {"error": True, "code": "API_ERROR", "message": "boom", "status_code": 500}
+        assert projection.project("t", error) == error
+
+    def test_compact_rendering(self):
+        text = OutputProjection().render("t", {"a": 1, "b": [1, 2]})
+        assert text == '{"a":1,"b":[1,2]}'
+        assert OutputProjection(compact=False).render("t", {"a": 1}) == json.dumps({"a": 1})
+
+    def test_truncation_disabled(self):
+        projected = OutputProjection(max_subject_chars=None).project("t", PRESENTATION)
+        assert projected["credentials"][0]["credentialSubject"]["name"] == "Ada"
@@ -0,0 +1,305 @@
+import copy
+import hashlib
+import json
+from unittest.mock import AsyncMock, patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.credentials import CredentialCache
+from langchain_nuggets.proofs import (
+    ProofVerifier,
+    b58decode,
+    canonicalize,
+    did_key_public_key,
+)
+from langchain_nuggets.sessions import PRESENTATION
+from langchain_nuggets.tools.auth import VerifyPresentation
+
+_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+NOW = 1_790_000_000.0  # 2026-09-21
+
+
+def b58encode(data):
+    number = int.from_bytes(data, "big")
+    out = ""
+    while number:
+        number, rem = divmod(number, 58)
+        out = _ALPHABET[rem] + out
+    return "1" * (len(data) - len(data.lstrip(b"\0"))) + out
+
+
+def ed25519_did():
+    key = Ed25519PrivateKey.generate()
+    raw = key.public_key().public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+    multibase = "z" + b58encode(b"\xed\x01" + raw)
+    return key, f"did:key:{multibase}", f"did:key:{multibase}#{multibase}"
+
+
+def credential(issuer, **extra):
+    return {
+        "@context": ["https://www.w3.org/ns/credentials/v2"],
+        "id": "vc-email",
+        "type": ["VerifiableCredential", "EmailCredential"],
+        "issuer": issuer,
+        "validFrom": "2026-01-01T00:00:00Z",
+        "credentialSubject": {"email": "user@example.com"},
+        **extra,
+    }
+
+
+def sign_jcs(document, key, method, cryptosuite="eddsa-jcs-2022"):
+    proof = {
+        "type": "DataIntegrityProof",
+        "cryptosuite": cryptosuite,
+        "verificationMethod": method,
+        "proofPurpose": "assertionMethod",
+        "created": "2026-01-01T00:00:00Z",
+    }
+    config = {**proof, "@context": document["@context"]}
+    data = hashlib.sha256(canonicalize(config)).digest() + hashlib.sha256(canonicalize(document)).digest()
+    if cryptosuite == "eddsa-jcs-2022":
+        signature = key.sign(data)
+    else:
+        r, s = decode_dss_signature(key.sign(data, ec.ECDSA(hashes.SHA256())))
+        signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+    return {**document, "proof": {**proof, "proofValue": "z" + b58encode(signature)}}
+
+
+@pytest.fixture
+def issuer():
+    return ed25519_did()
+
+
+@pytest.fixture
+def verifier():
+    return ProofVerifier(clock=lambda: NOW)
+
+
+class TestEncoding:
+    def test_b58_round_trip(self):
+        for data in (b"", b"\0\0abc", bytes(range(40))):
+            assert b58decode(b58encode(data)) == data
+
+    def test_canonicalize_sorts_keys(self):
+        assert canonicalize({"b": 1, "a": [True, "é"]}) == '{"a":[true,"é"],"b":1}'.encode()
+
+    def test_did_key_decodes_ed25519(self, issuer):
+        key, did, method = issuer
+        public = did_key_public_key(method)
+        assert public.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw) == (
+            key.public_key().public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        )
+
+
+class TestDataIntegrity:
+    def test_eddsa_jcs_2022_verifies(self, issuer, verifier):
+        key, did, method = issuer
+        result = verifier.verify(sign_jcs(credential(did), key, method))
+        assert result.verified, result.error
+        assert (result.suite, result.issuer, result.verification_method) == ("eddsa-jcs-2022", did, method)
+        assert result.credential_id == "vc-email"
+
+    def test_tampered_credential_fails(self, issuer, verifier):
+        key, did, method = issuer
+        signed = sign_jcs(credential(did), key, method)
+        signed["credentialSubject"]["email"] = "attacker@example.com"
+        result = verifier.verify(signed)
+        assert not result.verified
+        assert "InvalidSignature" in result.error
+
+    def test_ecdsa_jcs_2019_with_registered_jwk(self, verifier):
+        key = ec.generate_private_key(ec.SECP256R1())
+        method = "did:web:issuer.example#key-1"
+        jwk = json.loads(jwt.algorithms.ECAlgorithm.to_jwk(key.public_key()))
+        verifier = ProofVerifier(keys={method: jwk}, clock=lambda: NOW)
+        signed = sign_jcs(credential("did:web:issuer.example"), key, method, "ecdsa-jcs-2019")
+        assert verifier.verify(signed).verified
+
+    def test_method_of_other_issuer_fails(self, issuer, verifier):
+        key, _, method = issuer
+        result = verifier.verify(sign_jcs(credential("did:web:nuggets.life"), key, method))
+        assert result.error == "Verification method is not controlled by the issuer"
+
+    def test_did_key_cannot_sign_for_non_did_issuer(self, issuer):
+        key, _, method = issuer
+        verifier = ProofVerifier(trusted_issuers={"https://issuer.example"}, clock=lambda: NOW)
+        result = verifier.verify(sign_jcs(credential("https://issuer.example"), key, method))
+        assert result.error == "Verification method is not controlled by the issuer"
+
+    def test_non_did_issuer_needs_registered_key(self):
+        key = Ed25519PrivateKey.generate()
+        method = "https://issuer.example#key-1"
+        signed = sign_jcs(credential("https://issuer.example"), key, method)
+        registered = ProofVerifier(keys={method: key.public_key()}, clock=lambda: NOW)
+        assert registered.verify(signed).verified
+        resolved = ProofVerifier(resolver=lambda key_id: key.public_key(), clock=lambda: NOW)
+        assert resolved.verify(signed).error == "Issuers that are not DIDs need a registered key"
+
+    def test_expired_credential_fails(self, issuer, verifier):
+        key, did, method = issuer
+        signed = sign_jcs(credential(did, validUntil="2026-06-01T00:00:00Z"), key, method)
+        assert verifier.verify(signed).error == "Credential has expired"
+        assert ProofVerifier(check_expiry=False).verify(signed).verified
+
+    def test_unsupported_and_missing_proofs(self, verifier):
+        ld = credential("did:web:x", proof={"type": "Ed25519Signature2020", "proofValue": "z1"})
+        assert verifier.verify(ld).error == "unsupported proof type 'Ed25519Signature2020'"
+        assert verifier.verify(credential("did:web:x")).error == "Credential has no proof"
+        assert verifier.verify(None).error == "Credential must be an object or a VC-JWT"
+
+
+class TestVcJwt:
+    def make_token(self, key, did, method, vc=None, **claims):
+        vc = vc or {"type": ["VerifiableCredential"], "credentialSubject": {"email": "user@example.com"}}
+        payload = {"iss": did, "jti": "vc-jwt-1", "vc": vc, **claims}
+        return jwt.encode(payload, key, algorithm="EdDSA", headers={"kid": method})
+
+    def test_compact_jwt_verifies(self, issuer, verifier):
+        key, did, method = issuer
+        result = verifier.verify(self.make_token(key, did, method))
+        assert result.verified, result.error
+        assert (result.suite, result.issuer, result.credential_id) == ("vc-jwt", did, "vc-jwt-1")
+
+    def test_wrong_key_fails(self, issuer, verifier):
+        _, did, method = issuer
+        other_key, _, _ = ed25519_did()
+        result = verifier.verify(self.make_token(other_key, did, method))
+        assert not result.verified
+        assert "InvalidSignatureError" in result.error
+
+    def test_expired_jwt_fails(self, issuer, verifier):
+        key, did, method = issuer
+        result = verifier.verify(self.make_token(key, did, method, exp=1))
+        assert "ExpiredSignatureError" in result.error
+
+    def test_non_string_iss_fails(self, issuer, verifier):
+        key, _, _ = ed25519_did()
+        payload = json.dumps({"iss": 123, "vc": {}}).encode()
+        token = jwt.api_jws.PyJWS().encode(payload, key, algorithm="EdDSA")
+        assert verifier.verify(token).error == "VC-JWT kid and iss must be strings"
+
+    def test_algorithm_comes_from_key_not_header(self, issuer, verifier):
+        _, did, method = issuer
+        token = jwt.encode({"iss": did, "vc": {}}, None, algorithm="none", headers={"kid": method})
+        result = verifier.verify(token)
+        assert not result.verified
+        assert "InvalidAlgorithmError" in result.error
+
+    def test_jwt_proof_must_match_credential(self, issuer, verifier):
+        key, did, method = issuer
+        token = self.make_token(key, did, method, vc=credential(did))
+        signed = credential(did, proof={"type": "JwtProof2020", "jwt": token})
+        assert verifier.verify(signed).verified
+        forged = copy.deepcopy(signed)
+        forged["credentialSubject"]["email"] = "attacker@example.com"
+        assert verifier.verify(forged).error == "JWT proof does not match the credential"
+
+    def test_jwt_proof_covers_expiry_and_issuer(self, issuer, verifier):
+        key, did, method = issuer
+        token = self.make_token(key, did, method, vc=credential(did, validUntil="2026-06-01T00:00:00Z"))
+        extended = credential(did, validUntil="2030-01-01T00:00:00Z", proof={"type": "JwtProof2020", "jwt": token})
+        assert verifier.verify(extended).error == "JWT proof does not match the credential"
+        swapped = credential("https://issuer.example", validUntil="2026-06-01T00:00:00Z",
+                             proof={"type": "JwtProof2020", "jwt": token})
+        assert verifier.verify(swapped).error == "JWT proof does not match the credential"
+
+    def test_vc_issuer_must_match_iss(self, issuer, verifier):
+        key, did, method = issuer
+        token = self.make_token(key, did, method, vc=credential("https://issuer.example"))
+        assert verifier.verify(token).error == "VC-JWT iss does not match the credential issuer"
+
+    def test_did_key_cannot_sign_for_foreign_issuer(self, issuer):
+        key, _, method = issuer
+        verifier = ProofVerifier(trusted_issuers={"https://issuer.example"}, clock=lambda: NOW)
+        token = self.make_token(key, "https://issuer.example", method)
+        assert verifier.verify(token).error == "Verification method is not controlled by the issuer"
+
+
+class TestKeysAndBatches:
+    def test_resolver_results_are_cached(self):
+        key = Ed25519PrivateKey.generate()
+        method = "did:web:issuer.example#key-1"
+        calls = []
+
+        def resolver(key_id):
+            calls.append(key_id)
+            return key.public_key()
+
+        verifier = ProofVerifier(resolver=resolver, clock=lambda: NOW)
+        signed = sign_jcs(credential("did:web:issuer.example"), key, method)
+        assert verifier.verify(signed).verified
+        assert verifier.verify(signed).verified
+        assert calls == [method]
+
+    def test_unknown_key_fails(self, verifier):
+        key = Ed25519PrivateKey.generate()
+        signed = sign_jcs(credential("did:web:issuer.example"), key, "did:web:issuer.example#k")
+        assert verifier.verify(signed).error == "Unknown verification method: did:web:issuer.example#k"
+
+    def test_verify_many_reports_in_order(self, issuer, verifier):
+        key, did, method = issuer
+        good = sign_jcs(credential(did), key, method)
+        bad = copy.deepcopy(good)
+        bad["issuer"] = "did:web:other"
+        report = verifier.verify_many([good, bad, good, good], max_workers=4)
+        assert [r.index for r in report.results] == [0, 1, 2, 3]
+        assert [r.verified for r in report.results] == [True, False, True, True]
+        assert not report.verified
+        assert [r.index for r in report.failed] == [1]
+        summary = report.to_dict()
+        assert (summary["total"], summary["failed"], summary["verified"]) == (4, 1, False)
+
+    def test_trusted_issuers(self, issuer):
+        key, did, method = issuer
+        signed = sign_jcs(credential(did), key, method)
+        assert ProofVerifier(trusted_issuers={did}, clock=lambda: NOW).verify(signed).verified
+        result = ProofVerifier(trusted_issuers={"did:web:nuggets.life"}, clock=lambda: NOW).verify(signed)
+        assert result.error == "Issuer is not trusted"
+
+    def test_empty_report_is_not_verified(self, verifier):
+        assert not verifier.verify_many([]).verified
+
+
+class TestToolIntegration:
+    def presented(self, credentials):
+        return {"sessionId": "pres-1", "status": "presented", "verified": True, "credentials": credentials}
+
+    def test_verify_presentation_attaches_report(self, issuer, verifier):
+        key, did, method = issuer
+        client = NuggetsApiClient({"api_url": "https://api.nuggets.test", "partner_id": "p", "partner_secret": "s"})
+        tool = VerifyPresentation(client=client, proof_verifier=verifier)
+        with patch.object(client, "get", return_value=self.presented([sign_jcs(credential(did), key, method)])):
+            parsed = json.loads(tool.invoke({"sessionId": "pres-1"}))
+        assert parsed["proofVerification"]["verified"] is True
+        assert parsed["proofVerification"]["results"][0]["suite"] == "eddsa-jcs-2022"
+
+    async def test_failed_report_is_not_cached(self, issuer, verifier):
+        key, did, method = issuer
+        forged = sign_jcs(credential(did), key, method)
+        forged["credentialSubject"] = {"email": "attacker@example.com"}
+        client = NuggetsApiClient({"api_url": "https://api.nuggets.test", "partner_id": "p", "partner_secret": "s"})
+        cache = CredentialCache(clock=lambda: NOW, policy=lambda user, ctype, cred: True)
+        cache.track({"sessionId": "pres-1"}, "user-1", ["email"])
+        tool = VerifyPresentation(client=client, proof_verifier=verifier, credential_cache=cache)
+        with patch.object(client, "aget", new=AsyncMock(return_value=self.presented([forged]))):
+            parsed = json.loads(await tool.ainvoke({"sessionId": "pres-1"}))
+        assert parsed["proofVerification"]["verified"] is False
+        assert cache.get("user-1", "email") is None
+        cache.observe(PRESENTATION, "pres-1", self.presented([forged]))
+        assert cache.get("user-1", "email") == forged
+
+    def test_toolkit_passes_verifier_to_presentation_tools(self, verifier):
+        from langchain_nuggets.toolkit import NuggetsToolkit
+
+        toolkit = NuggetsToolkit(
+            api_url="https://api.nuggets.test", partner_id="p", partner_secret="s", proof_verifier=verifier
+        )
+        tools = {t.name: t for t in toolkit.get_tools(groups=["auth", "wait"])}
+        assert tools["verify_presentation"].proof_verifier is verifier
+        assert tools["wait_for_presentation"].proof_verifier is verifier
@@ -0,0 +1,58 @@
+import dataclasses
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from langchain_nuggets import NuggetsToolkit
+from langchain_nuggets.schemas import ToolBundle, tool_schema
+
+
+def make_toolkit():
+    return NuggetsToolkit(
+        api_url="https://api.nuggets.test",
+        partner_id="partner-123",
+        partner_secret="secret-456",
+    )
+
+
+class TestToolSchema:
+    def test_matches_langchain_conversion(self):
+        for tool in make_toolkit().get_tools():
+            assert tool_schema(tool) == convert_to_openai_tool(tool)
+
+    def test_cached_across_instances(self):
+        first = make_toolkit().get_tools()[0]
+        second = make_toolkit().get_tools()[0]
+        assert tool_schema(first) is tool_schema(second)
+
+    def test_cached_dict_passes_through_conversion(self):
+        schema = tool_schema(make_toolkit().get_tools()[0])
+        assert convert_to_openai_tool(schema) is schema
+
+
+class TestToolBundle:
+    def test_toolkit_bundle_built_once(self):
+        toolkit = make_toolkit()
+        bundle = toolkit.get_tool_bundle()
+        assert toolkit.get_tool_bundle() is bundle
+        assert len(bundle) == 11
+        assert bundle.names[1] == "check_kyc_status"
+        assert bundle.by_name["check_kyc_status"] is bundle.tools[1]
+        assert toolkit.get_tool_schemas() == list(bundle.schemas)
+
+    def test_bundle_is_frozen(self):
+        bundle = make_toolkit().get_tool_bundle()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            bundle.tools = ()
+        with pytest.raises(TypeError):
+            bundle.by_name["x"] = None
+
+    def test_bind_passes_cached_schemas(self):
+        bundle = ToolBundle.from_tools(make_toolkit().get_tools())
+        model = MagicMock()
+        bundle.bind(model, tool_choice="auto")
+        args, kwargs = model.bind_tools.call_args
+        assert args[0] == list(bundle.schemas)
+        assert args[0][0] is bundle.schemas[0]
+        assert kwargs == {"tool_choice": "auto"}
@@ -0,0 +1,223 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from langchain_nuggets.sessions import KYC, PRESENTATION, SessionStore, is_terminal, session_path
+
+
+class TestIsTerminal:
+    @pytest.mark.parametrize("status", ["completed", "failed", "expired"])
+    def test_kyc_terminal(self, status):
+        assert is_terminal(KYC, {"status": status})
+
+    @pytest.mark.parametrize("status", ["presented", "rejected", "expired"])
+    def test_presentation_terminal(self, status):
+        assert is_terminal(PRESENTATION, {"status": status})
+
+    def test_pending_is_not_terminal(self):
+        assert not is_terminal(KYC, {"status": "pending"})
+        assert not is_terminal(PRESENTATION, {"status": "pending"})
+        assert not is_terminal(KYC, {"status": "presented"})
+
+    def test_session_path_escapes_id(self):
+        assert session_path(KYC, "a/b") == "/kyc/sessions/a%2Fb"
+        assert session_path(PRESENTATION, "p-1") == "/credentials/presentations/p-1"
+
+
+class TestSessionStore:
+    def test_terminal_session_served_locally(self):
+        client = MagicMock()
+        client.get.return_value = {"sessionId": "s-1", "status": "completed"}
+        store = SessionStore()
+        store.fetch(client, KYC, "s-1")
+        assert store.fetch(client, KYC, "s-1")["status"] == "completed"
+        client.get.assert_called_once_with("/kyc/sessions/s-1")
+
+    def test_pending_session_always_fetched(self):
+        client = MagicMock()
+        client.get.side_effect = [
+            {"sessionId": "s-1", "status": "pending"},
+            {"sessionId": "s-1", "status": "completed"},
+        ]
+        store = SessionStore()
+        assert store.fetch(client, KYC, "s-1")["status"] == "pending"
+        assert store.get(KYC, "s-1") is None
+        assert store.fetch(client, KYC, "s-1")["status"] == "completed"
+        assert client.get.call_count == 2
+
+    def test_kinds_do_not_collide(self):
+        store = SessionStore()
+        store.put(KYC, "s-1", {"status": "expired"})
+        assert store.get(PRESENTATION, "s-1") is None
+
+    def test_lru_eviction(self):
+        store = SessionStore(max_size=2)
+        for i in range(3):
+            store.put(KYC, f"s-{i}", {"status": "completed"})
+        assert store.get(KYC, "s-0") is None
+        assert len(store) == 2
+
+    def test_sqlite_persistence(self, tmp_path):
+        path = str(tmp_path / "sessions.db")
+        store = SessionStore(path=path)
+        store.put(PRESENTATION, "p-1", {"status": "presented", "verified": True})
+        store.close()
+
+        reopened = SessionStore(path=path, max_size=1)
+        assert reopened.get(PRESENTATION, "p-1") == {"status": "presented", "verified": True}
+        reopened.put(KYC, "s-1", {"status": "failed"})
+        # Evicted from memory but still on disk.
+        assert reopened.get(PRESENTATION, "p-1")["verified"] is True
+        reopened.close()
+
+    async def test_afetch(self):
+        client = MagicMock()
+        client.aget = AsyncMock(return_value={"sessionId": "p-1", "status": "rejected"})
+        store = SessionStore()
+        await store.afetch(client, PRESENTATION, "p-1")
+        assert (await store.afetch(client, PRESENTATION, "p-1"))["status"] == "rejected"
+        client.aget.assert_awaited_once_with("/credentials/presentations/p-1")
+
+
+def created(session_id):
+    return {"sessionId": session_id, "deeplink": f"nuggets://kyc/{session_id}"}
+
+
+class TestSessionReuse:
+    def test_disabled_by_default(self):
+        client = MagicMock()
+        client.post.side_effect = [created("s-1"), created("s-2")]
+        store = SessionStore()
+        store.create(client, KYC, "/kyc/sessions", {"userId": "u"})
+        assert store.create(client, KYC, "/kyc/sessions", {"userId": "u"})["sessionId"] == "s-2"
+
+    def test_identical_request_reuses_pending_session(self):
+        client = MagicMock()
+        client.post.side_effect = [created("s-1"), created("s-2")]
+        store = SessionStore(reuse_window=300)
+        first = store.create(client, KYC, "/kyc/sessions", {"userId": "u"})
+        second = store.create(client, KYC, "/kyc/sessions", {"userId": "u"})
+        assert first == created("s-1")
+        assert second == {**created("s-1"), "reused": True}
+        client.post.assert_called_once()
+
+    def test_different_parameters_create_new_session(self):
+        client = MagicMock()
+        client.post.side_effect = [created("s-1"), created("s-2"), created("s-3")]
+        store = SessionStore(reuse_window=300)
+        store.create(client, KYC, "/kyc/verify-age", {"userId": "u", "minimumAge": 18})
+        assert store.create(client, KYC, "/kyc/verify-age", {"userId": "u", "minimumAge": 21})["sessionId"] == "s-2"
+        assert store.create(client, KYC, "/kyc/verify-age", {"userId": "v", "minimumAge": 18})["sessionId"] == "s-3"
+
+    def test_window_expiry_creates_new_session(self, clock):
+        client = MagicMock()
+        client.post.side_effect = [created("s-1"), created("s-2")]
+        store = SessionStore(reuse_window=300, clock=clock)
+        store.create(client, KYC, "/kyc/sessions", {"userId": "u"})
+        clock.now = 301
+        assert store.create(client, KYC, "/kyc/sessions", {"userId": "u"})["sessionId"] == "s-2"
+
+    def test_terminal_session_not_reused(self):
+        client = MagicMock()
+        client.post.side_effect = [created("s-1"), created("s-2")]
+        store = SessionStore(reuse_window=300)
+        store.create(client, KYC, "/kyc/sessions", {"userId": "u"})
+        store.put(KYC, "s-1", {"sessionId": "s-1", "status": "failed"})
+        assert store.create(client, KYC, "/kyc/sessions", {"userId": "u"})["sessionId"] == "s-2"
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        import threading
+        import time
+
+        client = MagicMock()
+
+        def slow_post(path, body):
+            time.sleep(0.05)
+            return created("s-1")
+
+        client.post.side_effect = slow_post
+        store = SessionStore(reuse_window=300)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(store.create(client, KYC, "/kyc/sessions", {"userId": "u"}))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.post.assert_called_once()
+        assert {r["sessionId"] for r in results} == {"s-1"}
+        assert sum(1 for r in results if r.get("reused")) == 4
+
+    async def test_async_single_flight_and_error_propagation(self):
+        import asyncio
+
+        from langchain_nuggets.client.nuggets_api_client import NuggetsApiClientError
+
+        client = MagicMock()
+        calls = []
+
+        async def failing_post(path, body):
+            calls.append(path)
+            await asyncio.sleep(0.01)
+            raise NuggetsApiClientError("Rate limited", "RATE_LIMITED", 429)
+
+        client.apost = failing_post
+        store = SessionStore(reuse_window=300)
+        results = await asyncio.gather(
+            *(store.acreate(client, KYC, "/kyc/sessions", {"userId": "u"}) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert len(calls) == 1
+        assert all(isinstance(r, NuggetsApiClientError) for r in results)
+
+        client.apost = AsyncMock(return_value=created("s-9"))
+        assert (await store.acreate(client, KYC, "/kyc/sessions", {"userId": "u"}))["sessionId"] == "s-9"
+
+    async def test_cancelled_creator_does_not_cancel_waiters(self):
+        import asyncio
+
+        client = MagicMock()
+        started = asyncio.Event()
+        calls = []
+
+        async def post(path, body):
+            calls.append(path)
+            if len(calls) == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return created("s-2")
+
+        client.apost = post
+        store = SessionStore(reuse_window=300)
+        owner = asyncio.ensure_future(store.acreate(client, KYC, "/kyc/sessions", {"userId": "u"}))
+        await started.wait()
+        waiter = asyncio.ensure_future(store.acreate(client, KYC, "/kyc/sessions", {"userId": "u"}))
+        await asyncio.sleep(0)
+        owner.cancel()
+        assert (await asyncio.wait_for(waiter, 2))["sessionId"] == "s-2"
+        assert len(calls) == 2
+
+    def test_sync_wait_for_identical_request_is_bounded(self):
+        import threading
+
+        client = MagicMock()
+        release = threading.Event()
+
+        def post(path, body):
+            if not release.is_set():
+                release.set()
+                threading.Event().wait(0.5)
+                return created("s-1")
+            return created("s-2")
+
+        client.post.side_effect = post
+        store = SessionStore(reuse_window=300, create_timeout=0.05)
+        first = threading.Thread(target=store.create, args=(client, KYC, "/kyc/sessions", {"userId": "u"}))
+        first.start()
+        release.wait()
+        assert store.create(client, KYC, "/kyc/sessions", {"userId": "u"})["sessionId"] == "s-2"
+        first.join()
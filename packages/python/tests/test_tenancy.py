@@ -0,0 +1,124 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClientError
+from langchain_nuggets.tenancy import (
+    MultiTenantNuggetsToolkit,
+    TenantClientPool,
+    TenantRoutingClient,
+)
+
+API = "https://api.nuggets.test"
+CREDENTIALS = {
+    "acme": {"partner_id": "acme-id", "partner_secret": "acme-secret"},
+    "globex": {"partner_id": "globex-id", "partner_secret": "globex-secret"},
+}
+
+
+def auth_response(request):
+    partner = json.loads(request.content)["partnerId"]
+    return httpx.Response(200, json={"token": f"token-{partner}", "expiresIn": 3600})
+
+
+def echo_token(request):
+    return httpx.Response(200, json={"auth": request.headers["Authorization"]})
+
+
+def config_for(tenant):
+    return {"configurable": {"nuggets_tenant_id": tenant}}
+
+
+class TestTenantClientPool:
+    def test_clients_share_http_pools(self):
+        pool = TenantClientPool(CREDENTIALS, api_url=API)
+        acme = pool.client_for("acme")
+        globex = pool.client_for("globex")
+        assert acme is not globex
+        assert pool.client_for("acme") is acme
+        assert acme._get_sync_client() is globex._get_sync_client()
+
+    def test_lru_eviction(self):
+        pool = TenantClientPool(CREDENTIALS, api_url=API, max_tenants=1)
+        acme = pool.client_for("acme")
+        pool.client_for("globex")
+        assert len(pool) == 1
+        assert pool.client_for("acme") is not acme
+
+    def test_callable_resolver_and_unknown_tenant(self):
+        pool = TenantClientPool(lambda tenant: CREDENTIALS.get(tenant), api_url=API)
+        assert pool.client_for("acme")._partner_id == "acme-id"
+        with pytest.raises(NuggetsApiClientError) as exc_info:
+            pool.client_for("initech")
+        assert exc_info.value.code == "UNKNOWN_TENANT"
+
+    def test_closing_tenant_client_keeps_shared_pool(self):
+        pool = TenantClientPool(CREDENTIALS, api_url=API)
+        shared = pool.client_for("acme")._get_sync_client()
+        pool.client_for("acme").close()
+        assert not shared.is_closed
+        pool.close()
+        assert shared.is_closed
+        assert pool._async_http_client.is_closed
+
+    async def test_aclose_closes_both_clients(self):
+        pool = TenantClientPool(CREDENTIALS, api_url=API)
+        await pool.aclose()
+        assert pool._http_client.is_closed
+        assert pool._async_http_client.is_closed
+
+
+class TestMultiTenantToolkit:
+    @respx.mock
+    def test_tools_route_by_runnable_config(self):
+        respx.post(f"{API}/partner/auth").mock(side_effect=auth_response)
+        respx.get(f"{API}/auth/status/user-1").mock(side_effect=echo_token)
+        toolkit = MultiTenantNuggetsToolkit(CREDENTIALS, api_url=API)
+        tool = toolkit.get_tools(include=["check_auth_status"])[0]
+        assert isinstance(tool.client, TenantRoutingClient)
+
+        acme = json.loads(tool.invoke({"userId": "user-1"}, config=config_for("acme")))
+        globex = json.loads(tool.invoke({"userId": "user-1"}, config=config_for("globex")))
+        assert acme == {"auth": "Bearer token-acme-id"}
+        assert globex == {"auth": "Bearer token-globex-id"}
+
+        tool.invoke({"userId": "user-1"}, config=config_for("acme"))
+        assert respx.calls.call_count == 5  # two auths, three requests
+
+    @respx.mock
+    async def test_async_tools_route_by_runnable_config(self):
+        respx.post(f"{API}/partner/auth").mock(side_effect=auth_response)
+        respx.get(f"{API}/auth/status/user-1").mock(side_effect=echo_token)
+        toolkit = MultiTenantNuggetsToolkit(CREDENTIALS, api_url=API)
+        tool = toolkit.get_tools(include=["check_auth_status"])[0]
+        result = await tool.ainvoke({"userId": "user-1"}, config=config_for("globex"))
+        assert json.loads(result) == {"auth": "Bearer token-globex-id"}
+
+    def test_tools_built_once_per_selection(self):
+        toolkit = MultiTenantNuggetsToolkit(CREDENTIALS, api_url=API)
+        tools = toolkit.get_tools()
+        assert [id(t) for t in toolkit.get_tools()] == [id(t) for t in tools]
+        assert toolkit.get_tools(include=["check_auth_status"])[0] is toolkit.get_tools(include=["check_auth_status"])[0]
+        assert toolkit.get_tools(compact=True)[0] is not tools[0]
+
+    def test_routing_client_initialised_from_pool(self):
+        toolkit = MultiTenantNuggetsToolkit(CREDENTIALS, api_url=API, max_concurrency=4)
+        client = toolkit.get_tools(include=["check_auth_status"])[0].client
+        assert client._limiter is toolkit.limiter
+        assert client._get_sync_client() is toolkit.pool._http_client
+
+    def test_missing_tenant_returns_error(self):
+        toolkit = MultiTenantNuggetsToolkit(CREDENTIALS, api_url=API)
+        tool = toolkit.get_tools(include=["check_auth_status"])[0]
+        result = json.loads(tool.invoke({"userId": "user-1"}))
+        assert result["code"] == "TENANT_REQUIRED"
+
+    @respx.mock
+    def test_warmup_tenants(self):
+        route = respx.post(f"{API}/partner/auth").mock(side_effect=auth_response)
+        toolkit = MultiTenantNuggetsToolkit(CREDENTIALS, api_url=API)
+        toolkit.warmup(["acme", "globex"])
+        assert route.call_count == 2
+        assert len(toolkit.pool) == 2
@@ -53,6 +53,129 @@ class TestNuggetsToolkit:
         assert "check_auth_status" in names
 
 
+class TestNuggetsToolkitSelection:
+    def _toolkit(self):
+        return NuggetsToolkit(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+        )
+
+    def test_groups(self):
+        names = [tool.name for tool in self._toolkit().get_tools(groups=["kya"])]
+        assert names == ["register_agent_identity", "verify_agent_identity", "get_agent_trust_score"]
+
+    def test_include_only(self):
+        names = [tool.name for tool in self._toolkit().get_tools(include=["check_auth_status"])]
+        assert names == ["check_auth_status"]
+
+    def test_include_adds_to_groups_and_exclude_removes(self):
+        tools = self._toolkit().get_tools(
+            groups=["auth"], include=["wait_for_presentation"], exclude=["initiate_oauth_flow"]
+        )
+        assert [tool.name for tool in tools] == [
+            "request_credential_presentation",
+            "verify_presentation",
+            "check_auth_status",
+            "wait_for_presentation",
+        ]
+
+    def test_unknown_names_raise(self):
+        with pytest.raises(ValueError, match="nope"):
+            self._toolkit().get_tools(include=["nope"])
+        with pytest.raises(ValueError, match="bogus"):
+            self._toolkit().get_tools(groups=["bogus"])
+
+    def test_only_selected_tools_are_constructed(self):
+        from langchain_nuggets.tools.kyc import VerifyAge
+
+        with patch.object(VerifyAge, "__init__", side_effect=AssertionError("constructed")):
+            self._toolkit().get_tools(groups=["kya"])
+
+    def test_compact_descriptions(self):
+        full = self._toolkit().get_tools()
+        compact = self._toolkit().get_tools(compact=True)
+        assert all(c.description == type(c).compact_description for c in compact)
+        assert sum(map(len, (t.description for t in compact))) < sum(
+            map(len, (t.description for t in full))
+        ) / 3
+
+
+class TestNuggetsToolkitWaitTools:
+    def test_get_wait_tools(self):
+        toolkit = NuggetsToolkit(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+        )
+        names = [tool.name for tool in toolkit.get_wait_tools()]
+        assert names == ["wait_for_kyc_completion", "wait_for_presentation"]
+
+    def test_get_batch_tools(self):
+        toolkit = NuggetsToolkit(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+        )
+        names = [tool.name for tool in toolkit.get_batch_tools()]
+        assert names == ["batch_verify_agent_identities", "batch_get_agent_trust_scores"]
+
+
+class TestNuggetsToolkitWarmup:
+    def test_warmup_delegates_to_client(self):
+        toolkit = NuggetsToolkit(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+        )
+        with patch.object(toolkit._client, "warmup") as mock_warmup:
+            toolkit.warmup()
+            mock_warmup.assert_called_once_with()
+
+    async def test_awarmup_delegates_to_client(self):
+        toolkit = NuggetsToolkit(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+        )
+        with patch.object(toolkit._client, "awarmup") as mock_awarmup:
+            await toolkit.awarmup()
+            mock_awarmup.assert_awaited_once_with()
+
+
+class TestNuggetsToolkitConcurrency:
+    def test_unbounded_by_default(self):
+        toolkit = NuggetsToolkit(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+        )
+        assert toolkit.limiter is None
+
+    def test_limiter_shared_with_client_and_middleware(self):
+        from langchain_nuggets.middleware import MiddlewareConfig, NuggetsAuthorityMiddleware
+
+        toolkit = NuggetsToolkit(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+            max_concurrency=8,
+            max_concurrency_per_run=2,
+        )
+        assert (toolkit.limiter.max_concurrency, toolkit.limiter.per_run) == (8, 2)
+        assert toolkit._client._limiter is toolkit.limiter
+        middleware = NuggetsAuthorityMiddleware(MiddlewareConfig(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+            agent_id="agent-1",
+            controller_id="org-1",
+            delegation_id="del-1",
+            limiter=toolkit.limiter,
+        ))
+        assert middleware._client._limiter is toolkit.limiter
+
+
 class TestNuggetsToolkitTls:
     def test_passes_ca_cert_to_client(self):
         toolkit = NuggetsToolkit(
@@ -0,0 +1,137 @@
+"""Tests for the optional OpenTelemetry integration."""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import respx
+from httpx import Response
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+
+from langchain_nuggets import tracing
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
+from langchain_nuggets.middleware import MiddlewareConfig, NuggetsAuthorityMiddleware
+from langchain_nuggets.tools.kya import GetAgentTrustScore
+
+TEST_CONFIG = {
+    "api_url": "https://api.nuggets.test",
+    "partner_id": "partner-123",
+    "partner_secret": "secret-456",
+}
+
+AUTH_RESPONSE = {"token": "auth-token", "expiresIn": 3600}
+
+_exporter = InMemorySpanExporter()
+_provider = TracerProvider()
+_provider.add_span_processor(SimpleSpanProcessor(_exporter))
+trace.set_tracer_provider(_provider)
+
+
+@pytest.fixture
+def spans():
+    _exporter.clear()
+    yield _exporter
+    _exporter.clear()
+
+
+def test_tracing_enabled():
+    assert tracing.ENABLED is True
+
+
+@respx.mock
+def test_client_span_and_traceparent(spans):
+    respx.post("https://api.nuggets.test/partner/auth").mock(
+        return_value=Response(200, json=AUTH_RESPONSE)
+    )
+    route = respx.get("https://api.nuggets.test/kyc/sessions/s-1").mock(
+        return_value=Response(200, json={"sessionId": "s-1", "status": "pending"})
+    )
+    client = NuggetsApiClient(TEST_CONFIG)
+    client.get("/kyc/sessions/s-1")
+
+    (span,) = [s for s in spans.get_finished_spans() if s.name == "GET /kyc/sessions/{id}"]
+    assert span.kind == SpanKind.CLIENT
+    assert span.attributes["http.request.method"] == "GET"
+    assert span.attributes["server.address"] == "api.nuggets.test"
+    assert span.attributes["http.response.status_code"] == 200
+    traceparent = route.calls.last.request.headers["traceparent"]
+    assert format(span.context.trace_id, "032x") in traceparent
+
+
+@respx.mock
+def test_client_span_marks_errors(spans):
+    respx.post("https://api.nuggets.test/partner/auth").mock(
+        return_value=Response(200, json=AUTH_RESPONSE)
+    )
+    respx.get("https://api.nuggets.test/kya/agents/a-1").mock(
+        return_value=Response(404, json={"code": "NOT_FOUND", "message": "Not found"})
+    )
+    client = NuggetsApiClient(TEST_CONFIG)
+    with pytest.raises(NuggetsApiClientError):
+        client.get("/kya/agents/a-1")
+    (span,) = [s for s in spans.get_finished_spans() if s.name == "GET /kya/agents/{id}"]
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.attributes["error.type"] == "404"
+
+
+def test_tool_span(spans):
+    client = NuggetsApiClient(TEST_CONFIG)
+    tool = GetAgentTrustScore(client=client)
+    client.get = MagicMock(return_value={"agentId": "a-1", "score": 0.9})
+    tool.invoke({"agentId": "a-1"})
+    (span,) = spans.get_finished_spans()
+    assert span.name == "execute_tool get_agent_trust_score"
+    assert span.attributes["gen_ai.tool.name"] == "get_agent_trust_score"
+
+
+async def test_async_tool_span(spans):
+    client = NuggetsApiClient(TEST_CONFIG)
+    tool = GetAgentTrustScore(client=client)
+
+    async def aget(path):
+        return {"agentId": "a-1", "score": 0.9}
+
+    client.aget = aget
+    result = await tool.ainvoke({"agentId": "a-1"})
+    assert json.loads(result)["score"] == 0.9
+    assert [s.name for s in spans.get_finished_spans()] == ["execute_tool get_agent_trust_score"]
+
+
+def test_middleware_phase_spans(spans):
+    from langchain_core.messages import ToolMessage
+
+    middleware = NuggetsAuthorityMiddleware(
+        MiddlewareConfig(
+            api_url="https://api.nuggets.test",
+            partner_id="partner-123",
+            partner_secret="secret-456",
+            agent_id="agent-123",
+            controller_id="org-456",
+            delegation_id="del-789",
+        )
+    )
+    middleware._client = MagicMock()
+    middleware._client.post.return_value = {
+        "decision": "ALLOW",
+        "proof_id": "proof-xyz",
+        "signature": "sig-abc",
+    }
+    request = MagicMock()
+    request.tool_call = {"name": "send_email", "args": {}, "id": "call-1"}
+    middleware.wrap_tool_call(
+        request, lambda r: ToolMessage(content="ok", tool_call_id="call-1")
+    )
+    names = [s.name for s in spans.get_finished_spans()]
+    assert names == [
+        "nuggets.authority.evaluate",
+        "nuggets.authority.execute",
+        "nuggets.authority.proof",
+    ]
+    evaluate = spans.get_finished_spans()[0]
+    assert evaluate.attributes["nuggets.authority.decision"] == "ALLOW"
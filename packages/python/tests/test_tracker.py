@@ -0,0 +1,138 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from langchain_nuggets.polling import PollPolicy
+from langchain_nuggets.sessions import KYC, PRESENTATION, SessionStore
+from langchain_nuggets.tracker import SessionTracker
+
+FAST = PollPolicy(initial_interval=0.01, max_interval=0.02, jitter=0)
+
+
+def scripted_client(responses):
+    """Client whose aget returns successive statuses per path."""
+    remaining = {path: list(items) for path, items in responses.items()}
+
+    async def aget(path):
+        items = remaining[path]
+        return items.pop(0) if len(items) > 1 else items[0]
+
+    client = MagicMock()
+    client.aget = AsyncMock(side_effect=aget)
+    return client
+
+
+async def collect(tracker, count):
+    updates = []
+    async for update in tracker.updates():
+        updates.append(update)
+        if len(updates) == count:
+            break
+    return updates
+
+
+class TestSessionTracker:
+    async def test_reports_transitions_and_stops_on_terminal(self):
+        client = scripted_client({
+            "/kyc/sessions/s-1": [{"status": "pending"}, {"status": "pending"}, {"status": "completed"}],
+            "/credentials/presentations/p-1": [{"status": "rejected"}],
+        })
+        callback = MagicMock()
+        async with SessionTracker(client, policy=FAST, on_update=callback) as tracker:
+            tracker.track(KYC, "s-1")
+            tracker.track(PRESENTATION, "p-1")
+            updates = await asyncio.wait_for(collect(tracker, 3), 2)
+        transitions = {(u.session_id, u.previous_status, u.status) for u in updates}
+        assert transitions == {
+            ("s-1", None, "pending"),
+            ("s-1", "pending", "completed"),
+            ("p-1", None, "rejected"),
+        }
+        assert callback.call_count == 3
+        assert tracker.pending == 0
+        assert client.aget.await_count == 4
+
+    async def test_async_callback_and_store(self):
+        client = scripted_client({"/kyc/sessions/s-1": [{"status": "failed"}]})
+        store = SessionStore()
+        seen = asyncio.Event()
+
+        async def on_update(update):
+            assert update.terminal
+            seen.set()
+
+        async with SessionTracker(client, store=store, policy=FAST, on_update=on_update) as tracker:
+            tracker.track(KYC, "s-1")
+            await asyncio.wait_for(seen.wait(), 2)
+        assert store.get(KYC, "s-1") == {"status": "failed"}
+
+    async def test_bounded_concurrency(self):
+        active = 0
+        peak = 0
+
+        async def aget(path):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"status": "completed"}
+
+        client = MagicMock()
+        client.aget = AsyncMock(side_effect=aget)
+        async with SessionTracker(client, policy=FAST, max_concurrency=3) as tracker:
+            for i in range(20):
+                tracker.track(KYC, f"s-{i}")
+            await asyncio.wait_for(collect(tracker, 20), 2)
+        assert peak <= 3
+
+    async def test_errors_are_retried(self):
+        client = MagicMock()
+        client.aget = AsyncMock(side_effect=[RuntimeError("boom"), {"status": "expired"}])
+        async with SessionTracker(client, policy=FAST) as tracker:
+            tracker.track(KYC, "s-1")
+            [update] = await asyncio.wait_for(collect(tracker, 1), 2)
+        assert update.status == "expired"
+
+    async def test_untrack_and_stop_end_iterators(self):
+        client = scripted_client({"/kyc/sessions/s-1": [{"status": "pending"}]})
+        tracker = SessionTracker(client, policy=FAST)
+        await tracker.start()
+        tracker.track(KYC, "s-1")
+        iterator = asyncio.ensure_future(collect(tracker, 10))
+        await asyncio.sleep(0.05)
+        tracker.untrack(KYC, "s-1")
+        await tracker.stop()
+        updates = await asyncio.wait_for(iterator, 1)
+        assert [u.status for u in updates] == ["pending"]
+        assert tracker.pending == 0
+
+    def test_created_outside_event_loop(self):
+        client = scripted_client({"/kyc/sessions/s-1": [{"status": "completed"}]})
+        tracker = SessionTracker(client, policy=FAST)
+        tracker.track(KYC, "s-1")
+
+        async def main():
+            async with tracker:
+                return await asyncio.wait_for(collect(tracker, 1), 2)
+
+        assert [u.status for u in asyncio.run(main())] == ["completed"]
+
+    async def test_unexpected_body_is_retried(self):
+        client = scripted_client({"/kyc/sessions/s-1": ["<html>busy</html>", None, {"status": "completed"}]})
+        async with SessionTracker(client, policy=FAST) as tracker:
+            tracker.track(KYC, "s-1")
+            updates = await asyncio.wait_for(collect(tracker, 1), 2)
+        assert updates[0].status == "completed"
+        assert tracker.pending == 0
+        assert client.aget.await_count == 3
+
+    async def test_retrack_after_untrack_polls_once(self):
+        client = scripted_client({"/kyc/sessions/s-1": [{"status": "pending"}]})
+        tracker = SessionTracker(client, policy=PollPolicy(initial_interval=10, jitter=0))
+        tracker.track(KYC, "s-1")
+        tracker.untrack(KYC, "s-1")
+        tracker.track(KYC, "s-1")
+        async with tracker:
+            await asyncio.wait_for(collect(tracker, 1), 2)
+            await asyncio.sleep(0.05)
+        assert client.aget.await_count == 1
@@ -0,0 +1,222 @@
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
+from langchain_nuggets.trust import TrustGraph, TrustScoreCache
+
+SCORE = {"agentId": "agent-1", "score": 0.8}
+NEW_SCORE = {"agentId": "agent-1", "score": 0.9}
+
+
+def make_stale(cache, agent_id):
+    entry = cache._cache._entries[agent_id]
+    entry.stored_at -= cache._cache.ttl + 1
+
+
+class TestTrustScoreCache:
+    def test_miss_fetches_and_hit_is_served_from_memory(self):
+        client = MagicMock()
+        client.get.return_value = SCORE
+        cache = TrustScoreCache()
+        assert cache.get(client, "agent-1") == SCORE
+        assert cache.get(client, "agent-1") == SCORE
+        client.get.assert_called_once_with("/kya/agents/agent-1/trust-score")
+
+    def test_stale_served_while_refreshing_in_background(self):
+        refreshed = threading.Event()
+        client = MagicMock()
+        client.get.side_effect = [SCORE, NEW_SCORE]
+        cache = TrustScoreCache(ttl=60, stale_ttl=600)
+        cache.get(client, "agent-1")
+        make_stale(cache, "agent-1")
+
+        original_store = cache._store
+
+        def store(agent_id, score, epoch):
+            original_store(agent_id, score, epoch)
+            refreshed.set()
+
+        cache._store = store
+        assert cache.get(client, "agent-1") == SCORE
+        assert refreshed.wait(2)
+        assert cache.peek("agent-1") == NEW_SCORE
+        cache.close()
+
+    def test_failed_refresh_keeps_stale_value(self):
+        client = MagicMock()
+        client.get.side_effect = [SCORE, RuntimeError("boom")]
+        cache = TrustScoreCache(ttl=60, stale_ttl=600)
+        cache.get(client, "agent-1")
+        make_stale(cache, "agent-1")
+        cache.get(client, "agent-1")
+        cache.close()
+        cache._executor = None
+        assert cache.peek("agent-1") == SCORE
+
+    def test_invalidate_identity(self):
+        client = MagicMock()
+        client.get.return_value = SCORE
+        cache = TrustScoreCache()
+        cache.get(client, "agent-1")
+        cache.get(client, "did:nuggets:agent-1")
+        cache.invalidate_identity({"agentId": "agent-1", "did": "did:nuggets:agent-1"})
+        assert cache.peek("agent-1") is None
+        assert cache.peek("did:nuggets:agent-1") is None
+
+    async def test_async_stale_while_revalidate(self):
+        client = MagicMock()
+        client.aget = AsyncMock(side_effect=[SCORE, NEW_SCORE])
+        cache = TrustScoreCache(ttl=60, stale_ttl=600)
+        assert await cache.aget(client, "agent-1") == SCORE
+        make_stale(cache, "agent-1")
+        assert await cache.aget(client, "agent-1") == SCORE
+        await asyncio.gather(*cache._tasks)
+        assert cache.peek("agent-1") == NEW_SCORE
+        assert client.aget.await_count == 2
+
+
+SCORES = {"a": 0.9, "b": 0.8, "c": 0.4, "d": 0.75}
+
+
+def graph_client(scores=None, missing=()):
+    """A mock client whose trust scores come from ``scores`` (mutable)."""
+    scores = SCORES if scores is None else scores
+    client = MagicMock()
+
+    def get(path):
+        agent_id = path.split("/")[3]
+        if agent_id in missing:
+            raise NuggetsApiClientError("Agent not found", "NOT_FOUND", 404)
+        if path.endswith("/trust-score"):
+            return {"agentId": agent_id, "score": scores[agent_id]}
+        return {"agentId": agent_id, "did": f"did:nuggets:{agent_id}", "org": agent_id in "ab" and "acme" or "other"}
+
+    async def aget(path):
+        return get(path)
+
+    client.get.side_effect = get
+    client.aget = AsyncMock(side_effect=aget)
+    return client
+
+
+class TestTrustGraph:
+    def test_queries_answered_from_memory(self):
+        client = graph_client()
+        graph = TrustGraph(client, threshold=0.7)
+        graph.load(["a", "b", "c", "d"])
+        calls = client.get.call_count
+        assert graph.score("a") == 0.9
+        assert graph.is_trusted("b") and not graph.is_trusted("c")
+        assert graph.is_trusted("c", min_score=0.3)
+        assert graph.peers("a") == frozenset({"b", "d"})
+        assert graph.peers("c") == frozenset()
+        assert graph.can_talk("a", "d") and not graph.can_talk("a", "c")
+        assert not graph.is_trusted("unknown") and graph.peers("unknown") == frozenset()
+        assert client.get.call_count == calls == 8
+
+    async def test_aload_and_failed_lookups_are_untrusted(self):
+        client = graph_client(missing={"d"})
+        graph = TrustGraph(client)
+        await graph.aload(["a", "b", "d", "a"])
+        assert len(graph) == 3
+        assert graph.score("d") is None
+        assert graph.peers("a") == frozenset({"b"})
+        assert graph.snapshot()["agents"]["d"] == {"score": None, "trusted": False, "peers": []}
+
+    def test_policy_limits_pairs(self):
+        graph = TrustGraph(graph_client(), policy=lambda a, ai, b, bi: ai["org"] == bi["org"])
+        graph.load(["a", "b", "d"])
+        assert graph.peers("a") == frozenset({"b"})
+        assert graph.peers("d") == frozenset()
+
+    def test_refresh_updates_only_stale_agents_and_edges(self, clock):
+        scores = dict(SCORES)
+        client = graph_client(scores)
+        graph = TrustGraph(client, ttl=60, auto_refresh=False, clock=clock)
+        graph.load(["a", "b", "c"])
+        clock.now += 30
+        graph.load(["d"])
+        clock.now += 31
+        scores["c"] = 0.95
+        scores["d"] = 0.1
+        graph.refresh()
+        assert graph.peers("a") == frozenset({"b", "c", "d"})  # d is not stale yet
+        assert graph.can_talk("c", "b")
+        clock.now += 30
+        graph.refresh()
+        assert graph.peers("a") == frozenset({"b", "c"})
+        graph.remove("b")
+        assert graph.peers("a") == frozenset({"c"}) and "b" not in graph
+
+    def test_query_starts_background_refresh_when_stale(self, clock):
+        scores = dict(SCORES)
+        graph = TrustGraph(graph_client(scores), ttl=60, clock=clock)
+        graph.load(["a", "c"])
+        scores["c"] = 0.9
+        clock.now += 61
+        refreshed = threading.Event()
+        original = graph.refresh
+
+        def refresh():
+            original()
+            refreshed.set()
+
+        graph.refresh = refresh
+        assert not graph.is_trusted("c")  # answered from current data
+        assert refreshed.wait(2)
+        assert graph.is_trusted("c")
+        graph.close()
+
+    def test_uses_trust_cache(self):
+        client = graph_client()
+        cache = TrustScoreCache()
+        cache.put("a", {"agentId": "a", "score": 0.2})
+        graph = TrustGraph(client, trust_cache=cache, auto_refresh=False)
+        graph.load(["a"])
+        assert graph.score("a") == 0.2
+        graph.refresh(stale_only=False)
+        assert graph.score("a") == 0.9
+        assert cache.peek("a")["score"] == 0.9
+
+    def test_guard_routes_on_trust(self):
+        graph = TrustGraph(graph_client())
+        graph.load(["a", "b", "c"])
+        route = graph.guard(agent_key="target")
+        assert route({"target": "a"}) == "allow"
+        assert route({"target": "c"}) == "deny"
+        assert route({}) == "deny"
+        pair = graph.guard(agent_key="target", source_key="me", allow="share", deny="refuse")
+        assert pair({"me": "a", "target": "b"}) == "share"
+        assert pair({"me": "c", "target": "b"}) == "refuse"
+        assert graph.guard("target", min_score=0.85)({"target": "b"}) == "deny"
+        lowered = graph.guard(agent_key="target", source_key="me", min_score=0.3)
+        assert lowered({"me": "a", "target": "c"}) == "allow"
+
+    def test_can_talk_at_lower_min_score(self):
+        graph = TrustGraph(graph_client(), policy=lambda a, ai, b, bi: "d" not in (a, b))
+        graph.load(["a", "b", "c", "d"])
+        assert not graph.can_talk("a", "c")
+        assert graph.can_talk("a", "c", min_score=0.3) and graph.can_talk("c", "a", min_score=0.3)
+        assert not graph.can_talk("a", "d", min_score=0.3)
+        assert not graph.can_talk("a", "b", min_score=0.85)
+        assert not graph.can_talk("a", "unknown", min_score=0.0)
+
+    def test_as_tool(self):
+        graph = TrustGraph(NuggetsApiClient({
+            "api_url": "https://api.nuggets.test", "partner_id": "p", "partner_secret": "s",
+        }))
+        graph._get_identity = lambda agent_id: {"agentId": agent_id}
+        graph._get_score = lambda agent_id, fresh: {"score": SCORES[agent_id]}
+        graph.load(["a", "b", "c"])
+        tool = graph.as_tool()
+        assert tool.name == "query_agent_trust"
+        result = json.loads(tool.invoke({"agentId": "a", "peerId": "c"}))
+        assert result == {
+            "agentId": "a", "inGraph": True, "score": 0.9, "threshold": 0.7, "trusted": True,
+            "peers": ["b"], "peerId": "c", "canTalk": False,
+        }
+        assert json.loads(tool.invoke({"agentId": "x"}))["inGraph"] is False
+        lowered = json.loads(tool.invoke({"agentId": "a", "peerId": "c", "minScore": 0.3}))
+        assert (lowered["threshold"], lowered["trusted"], lowered["canTalk"]) == (0.3, True, True)
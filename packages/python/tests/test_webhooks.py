@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from langchain_nuggets.polling import await_session, wait_for_session
+from langchain_nuggets.sessions import KYC, PRESENTATION, SessionStore
+from langchain_nuggets.types import WebhookConfig
+from langchain_nuggets.webhooks import NuggetsWebhookReceiver, sign_payload
+
+SECRET = "whsec-test"
+NOW = 1_700_000_000.0
+
+
+def make_receiver(store=None):
+    config = WebhookConfig(callback_url="https://agent.test/webhook", secret=SECRET)
+    return NuggetsWebhookReceiver(
+        config, store if store is not None else SessionStore(), clock=lambda: NOW
+    )
+
+
+def signed(event, timestamp=NOW, secret=SECRET):
+    body = json.dumps(event).encode()
+    ts = str(int(timestamp))
+    return {
+        "x-nuggets-timestamp": ts,
+        "x-nuggets-signature": sign_payload(secret, ts, body),
+    }, body
+
+
+COMPLETED = {"type": "kyc.session.updated", "data": {"sessionId": "s-1", "status": "completed"}}
+
+
+class TestWebhookVerification:
+    def test_valid_event_updates_store(self):
+        store = SessionStore()
+        receiver = make_receiver(store)
+        status, payload = receiver.handle(*signed(COMPLETED))
+        assert status == 200
+        assert payload == {"received": True, "stored": True}
+        assert store.get(KYC, "s-1")["status"] == "completed"
+
+    def test_presentation_event(self):
+        store = SessionStore()
+        receiver = make_receiver(store)
+        event = {
+            "type": "credentials.presentation.updated",
+            "data": {"sessionId": "p-1", "status": "presented", "verified": True},
+        }
+        assert receiver.handle(*signed(event))[0] == 200
+        assert store.get(PRESENTATION, "p-1")["verified"] is True
+
+    def test_bad_signature_rejected(self):
+        store = SessionStore()
+        receiver = make_receiver(store)
+        status, _ = receiver.handle(*signed(COMPLETED, secret="wrong"))
+        assert status == 401
+        assert store.get(KYC, "s-1") is None
+
+    def test_stale_timestamp_rejected(self):
+        receiver = make_receiver()
+        status, payload = receiver.handle(*signed(COMPLETED, timestamp=NOW - 301))
+        assert status == 401
+        assert "tolerance" in payload["error"]
+
+    def test_replay_rejected(self):
+        receiver = make_receiver()
+        headers, body = signed(COMPLETED)
+        assert receiver.handle(headers, body)[0] == 200
+        status, payload = receiver.handle(headers, body)
+        assert status == 401
+        assert payload["error"] == "Replayed webhook"
+
+    def test_missing_headers_rejected(self):
+        assert make_receiver().handle({}, b"{}")[0] == 401
+
+    def test_pending_event_not_stored(self):
+        store = SessionStore()
+        receiver = make_receiver(store)
+        event = {"type": "kyc.session.updated", "data": {"sessionId": "s-1", "status": "pending"}}
+        assert receiver.handle(*signed(event))[1]["stored"] is False
+
+    def test_malformed_and_unknown_events(self):
+        receiver = make_receiver()
+        assert receiver.handle(*signed({"type": "kyc.session.updated"}))[0] == 400
+        unknown = {"type": "agent.updated", "data": {"sessionId": "x"}}
+        assert receiver.handle(*signed(unknown))[0] == 202
+
+
+class TestWebhookAsgi:
+    async def test_post_through_asgi(self):
+        store = SessionStore()
+        receiver = make_receiver(store)
+        headers, body = signed(COMPLETED)
+        transport = httpx.ASGITransport(app=receiver)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            response = await http.post("/webhook", content=body, headers=headers)
+            assert response.status_code == 200
+            assert (await http.get("/webhook")).status_code == 405
+        assert store.get(KYC, "s-1") is not None
+
+    async def test_oversized_body_rejected(self):
+        config = WebhookConfig(callback_url="https://agent.test/webhook", secret=SECRET)
+        receiver = NuggetsWebhookReceiver(config, SessionStore(), max_body_bytes=10)
+        transport = httpx.ASGITransport(app=receiver)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            response = await http.post("/webhook", content=b"x" * 100)
+            assert response.status_code == 413
+
+
+class TestPushWaiting:
+    async def test_store_wait_woken_by_webhook(self):
+        store = SessionStore()
+        receiver = make_receiver(store)
+        waiter = asyncio.ensure_future(store.wait(KYC, "s-1", timeout=5))
+        await asyncio.sleep(0)
+        receiver.handle(*signed(COMPLETED))
+        assert (await waiter)["status"] == "completed"
+
+    async def test_store_wait_times_out(self):
+        assert await SessionStore().wait(KYC, "s-1", timeout=0.01) is None
+
+    async def test_await_session_does_not_poll_with_push(self):
+        store = SessionStore()
+        receiver = make_receiver(store)
+        client = MagicMock()
+        client.aget = AsyncMock(return_value={"sessionId": "s-1", "status": "pending"})
+        waiter = asyncio.ensure_future(await_session(client, KYC, "s-1", 5, store=store))
+        await asyncio.sleep(0.01)
+        receiver.handle(*signed(COMPLETED))
+        assert (await waiter)["status"] == "completed"
+        assert client.aget.await_count == 1
+
+    def test_wait_for_session_woken_from_another_thread(self):
+        store = SessionStore()
+        receiver = make_receiver(store)
+        client = MagicMock()
+        client.get.return_value = {"sessionId": "s-1", "status": "pending"}
+        timer = threading.Timer(0.05, lambda: receiver.handle(*signed(COMPLETED)))
+        timer.start()
+        result = wait_for_session(client, KYC, "s-1", 5, store=store)
+        timer.join()
+        assert result["status"] == "completed"
+        assert client.get.call_count == 1
+
+    def test_push_timeout_does_final_read(self):
+        store = SessionStore()
+        make_receiver(store)
+        client = MagicMock()
+        client.get.return_value = {"sessionId": "s-1", "status": "pending"}
+        result = wait_for_session(client, KYC, "s-1", 0.01, store=store)
+        assert result["timedOut"] is True
+        assert client.get.call_count == 2
@@ -1,14 +1,14 @@
 import json
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
 from langchain_nuggets.tools.auth import (
+    CheckAuthStatus,
+    InitiateOAuthFlow,
     RequestCredentialPresentation,
     VerifyPresentation,
-    InitiateOAuthFlow,
-    CheckAuthStatus,
 )
 
 TEST_CONFIG = {
@@ -44,6 +44,38 @@ class TestRequestCredentialPresentation:
             mock_post.assert_called_once_with("/credentials/presentations", {"userId": "user@example.com", "credentialTypes": ["email", "phone", "address"]})
 
 
+class TestRequestCredentialPresentationReuse:
+    def test_same_types_in_any_order_reuse_session(self):
+        from langchain_nuggets.sessions import SessionStore
+
+        client = make_client()
+        tool = RequestCredentialPresentation(client=client, session_store=SessionStore(reuse_window=300))
+        mock_presentation = {"sessionId": "pres-123", "deeplink": "nuggets://present/pres-123"}
+        with patch.object(client, "post", return_value=mock_presentation) as mock_post:
+            tool.invoke({"userId": "user@example.com", "credentialTypes": ["email", "phone"]})
+            result = json.loads(tool.invoke({"userId": "user@example.com", "credentialTypes": ["phone", "email"]}))
+            assert result == {**mock_presentation, "reused": True}
+            mock_post.assert_called_once()
+
+
+class TestPresentationCredentialReuse:
+    async def test_presented_credentials_answered_from_cache(self):
+        from langchain_nuggets.credentials import CredentialCache
+
+        client = make_client()
+        cache = CredentialCache(policy=lambda user, ctype, cred: True)
+        request = RequestCredentialPresentation(client=client, credential_cache=cache)
+        verify = VerifyPresentation(client=client, credential_cache=cache)
+        email = {"id": "vc-email", "type": ["VerifiableCredential", "EmailCredential"], "credentialSubject": {"email": "a@b.c"}}
+        with patch.object(client, "apost", new_callable=AsyncMock, return_value={"sessionId": "pres-1"}) as mock_post, \
+                patch.object(client, "aget", new_callable=AsyncMock, return_value={"sessionId": "pres-1", "status": "presented", "verified": True, "credentials": [email]}):
+            await request.ainvoke({"userId": "u", "credentialTypes": ["email"]})
+            await verify.ainvoke({"sessionId": "pres-1"})
+            result = json.loads(await request.ainvoke({"userId": "u", "credentialTypes": ["email"]}))
+            mock_post.assert_awaited_once()
+        assert result == {"sessionId": "pres-1", "status": "presented", "verified": True, "credentials": [email], "cached": True}
+
+
 class TestVerifyPresentation:
     def test_name_and_description(self):
         tool = VerifyPresentation(client=make_client())
@@ -152,3 +184,29 @@ class TestCheckAuthStatus:
             assert parsed["authenticated"] is True
             assert parsed["kycVerified"] is True
             mock_get.assert_called_once_with("/auth/status/user%40example.com")
+
+
+class TestWaitForPresentation:
+    def test_invoke_times_out_while_pending(self):
+        from langchain_nuggets.polling import PollPolicy
+        from langchain_nuggets.tools.auth import WaitForPresentation
+
+        client = make_client()
+        tool = WaitForPresentation(
+            client=client, poll_policy=PollPolicy(initial_interval=0.01, jitter=0)
+        )
+        with patch.object(client, "get", return_value={"status": "pending"}):
+            result = json.loads(tool.invoke({"sessionId": "pres-789", "timeoutSeconds": 0.02}))
+            assert result == {"status": "pending", "timedOut": True}
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_returns_presented(self):
+        from langchain_nuggets.tools.auth import WaitForPresentation
+
+        client = make_client()
+        tool = WaitForPresentation(client=client)
+        presented = {"status": "presented", "verified": True}
+        with patch.object(client, "aget", new_callable=AsyncMock, return_value=presented) as mock_aget:
+            result = await tool.ainvoke({"sessionId": "pres-789"})
+            assert json.loads(result) == presented
+            mock_aget.assert_called_once_with("/credentials/presentations/pres-789")
@@ -1,10 +1,15 @@
 import json
 from typing import Optional, Type
+from unittest.mock import patch
 
-from langchain_core.callbacks import CallbackManagerForToolRun
-from pydantic import BaseModel, Field
+import pytest
+from langchain_core.callbacks import BaseCallbackHandler, CallbackManagerForToolRun
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import ensure_config
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, Field, ValidationError
 
-from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
 from langchain_nuggets.tools.base import NuggetsBaseTool
 
 TEST_CONFIG = {
@@ -40,3 +45,139 @@ class TestNuggetsBaseTool:
         tool = TestTool(client=client)
         result = tool.invoke({"input_text": "hello"})
         assert result == "processed: hello"
+
+
+class TestOutputProjectionArtifacts:
+    def _make_tool(self, projection):
+        from langchain_nuggets.projection import OutputProjection
+        from langchain_nuggets.tools.kyc import CheckKycStatus
+
+        client = NuggetsApiClient(TEST_CONFIG)
+        return client, CheckKycStatus(client=client, output_projection=projection or OutputProjection())
+
+    def test_tool_call_returns_compact_content_and_full_artifact(self):
+        from unittest.mock import patch
+
+        from langchain_nuggets.projection import OutputProjection
+
+        client, tool = self._make_tool(OutputProjection(fields={"check_kyc_status": ["status"]}))
+        full = {"sessionId": "s-1", "status": "pending", "credentials": None}
+        with patch.object(client, "get", return_value=full):
+            message = tool.invoke(
+                {"name": tool.name, "args": {"sessionId": "s-1"}, "id": "call-1", "type": "tool_call"}
+            )
+        assert message.content == '{"status":"pending"}'
+        assert message.artifact == full
+
+    def test_plain_invoke_returns_content_only(self):
+        from unittest.mock import patch
+
+        client, tool = self._make_tool(None)
+        with patch.object(client, "get", return_value={"status": "pending", "x": None}):
+            assert tool.invoke({"sessionId": "s-1"}) == '{"status":"pending"}'
+
+    def test_without_projection_response_format_unchanged(self):
+        from langchain_nuggets.tools.kyc import CheckKycStatus
+
+        tool = CheckKycStatus(client=NuggetsApiClient(TEST_CONFIG))
+        assert tool.response_format == "content"
+
+
+class FailingInput(BaseModel):
+    sessionId: str = Field(description="Session ID")
+
+
+class FailingTool(NuggetsBaseTool):
+    name: str = "failing_tool"
+    description: str = "Always fails"
+    args_schema: Type[BaseModel] = FailingInput
+
+    def _run(self, sessionId: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+        raise NuggetsApiClientError("Not found", "NOT_FOUND", 404)
+
+    async def _arun(self, sessionId: str, run_manager=None) -> str:
+        raise NuggetsApiClientError("Not found", "NOT_FOUND", 404)
+
+
+class ConfigEchoTool(NuggetsBaseTool):
+    name: str = "config_echo"
+    description: str = "Returns a configurable value from the active RunnableConfig"
+    args_schema: Type[BaseModel] = TestInput
+
+    def _run(self, input_text: str, run_manager=None) -> str:
+        return ensure_config()["configurable"].get(input_text, "")
+
+    async def _arun(self, input_text: str, run_manager=None) -> str:
+        return self._run(input_text)
+
+
+class RecordingHandler(BaseCallbackHandler):
+    def __init__(self):
+        self.started = []
+
+    def on_tool_start(self, serialized, input_str, **kwargs):
+        self.started.append(serialized["name"])
+
+
+TOOL_CALL = {"name": "failing_tool", "args": {"sessionId": "s-1"}, "id": "call-1", "type": "tool_call"}
+
+
+class TestErrorHandling:
+    def test_invoke_returns_error_json(self):
+        tool = FailingTool(client=NuggetsApiClient(TEST_CONFIG))
+        result = json.loads(tool.invoke({"sessionId": "s-1"}))
+        assert result == {"error": True, "code": "NOT_FOUND", "message": "Not found", "status_code": 404}
+
+    async def test_ainvoke_returns_error_json(self):
+        tool = FailingTool(client=NuggetsApiClient(TEST_CONFIG))
+        result = json.loads(await tool.ainvoke({"sessionId": "s-1"}))
+        assert result["code"] == "NOT_FOUND"
+
+    async def test_tool_call_error_is_error_tool_message(self):
+        tool = FailingTool(client=NuggetsApiClient(TEST_CONFIG))
+        for message in (tool.invoke(TOOL_CALL), await tool.ainvoke(TOOL_CALL)):
+            assert isinstance(message, ToolMessage)
+            assert message.status == "error"
+            assert message.tool_call_id == "call-1"
+            assert json.loads(message.content)["code"] == "NOT_FOUND"
+
+    async def test_errors_handled_with_callbacks(self):
+        tool = FailingTool(client=NuggetsApiClient(TEST_CONFIG))
+        handler = RecordingHandler()
+        result = await tool.ainvoke({"sessionId": "s-1"}, config={"callbacks": [handler]})
+        assert json.loads(result)["code"] == "NOT_FOUND"
+        assert handler.started == ["failing_tool"]
+
+
+class TestInvocationFastPath:
+    def test_fast_path_skips_run_manager(self):
+        tool = TestTool(client=NuggetsApiClient(TEST_CONFIG))
+        with patch.object(BaseTool, "run") as slow_run:
+            assert tool.invoke({"input_text": "hi"}) == "processed: hi"
+        slow_run.assert_not_called()
+
+    def test_callbacks_take_full_path(self):
+        tool = TestTool(client=NuggetsApiClient(TEST_CONFIG))
+        handler = RecordingHandler()
+        assert tool.invoke({"input_text": "hi"}, config={"callbacks": [handler]}) == "processed: hi"
+        assert handler.started == ["test_tool"]
+
+    async def test_fast_path_exposes_runnable_config(self):
+        tool = ConfigEchoTool(client=NuggetsApiClient(TEST_CONFIG))
+        config = {"configurable": {"tenant": "acme"}}
+        assert tool.invoke({"input_text": "tenant"}, config=config) == "acme"
+        assert await tool.ainvoke({"input_text": "tenant"}, config=config) == "acme"
+
+    def test_tool_call_returns_tool_message(self):
+        tool = TestTool(client=NuggetsApiClient(TEST_CONFIG))
+        message = tool.invoke(
+            {"name": "test_tool", "args": {"input_text": "hi"}, "id": "call-2", "type": "tool_call"}
+        )
+        assert isinstance(message, ToolMessage)
+        assert message.content == "processed: hi"
+        assert message.tool_call_id == "call-2"
+
+    def test_invalid_input_raises_validation_error(self):
+        tool = TestTool(client=NuggetsApiClient(TEST_CONFIG))
+        with pytest.raises(ValidationError):
+            tool.invoke({})
@@ -1,13 +1,13 @@
 import json
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
+from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient, NuggetsApiClientError
 from langchain_nuggets.tools.kya import (
+    GetAgentTrustScore,
     RegisterAgentIdentity,
     VerifyAgentIdentity,
-    GetAgentTrustScore,
 )
 
 TEST_CONFIG = {
@@ -101,3 +101,197 @@ class TestGetAgentTrustScore:
             assert parsed["score"] == 0.85
             assert parsed["signals"]["githubVerified"] is True
             mock_get.assert_called_once_with("/kya/agents/agent-456/trust-score")
+
+
+class TestTrustScoreCaching:
+    def test_cached_score_skips_network(self):
+        from langchain_nuggets.trust import TrustScoreCache
+
+        client = make_client()
+        cache = TrustScoreCache()
+        tool = GetAgentTrustScore(client=client, trust_cache=cache)
+        mock_score = {"agentId": "agent-456", "score": 0.85}
+        with patch.object(client, "get", return_value=mock_score) as mock_get:
+            tool.invoke({"agentId": "agent-456"})
+            result = tool.invoke({"agentId": "agent-456"})
+            assert json.loads(result) == mock_score
+            mock_get.assert_called_once_with("/kya/agents/agent-456/trust-score")
+
+    def test_register_invalidates_cached_score(self):
+        from langchain_nuggets.trust import TrustScoreCache
+
+        client = make_client()
+        cache = TrustScoreCache()
+        cache.put("agent-456", {"agentId": "agent-456", "score": 0.1})
+        tool = RegisterAgentIdentity(client=client, trust_cache=cache)
+        identity = {"agentId": "agent-456", "did": "did:nuggets:agent-456"}
+        with patch.object(client, "post", return_value=identity):
+            tool.invoke({"agentName": "TestAgent"})
+        assert cache.peek("agent-456") is None
+
+
+class TestBatchVerifyAgentIdentities:
+    def test_name_and_description(self):
+        from langchain_nuggets.tools.kya import BatchVerifyAgentIdentities
+
+        tool = BatchVerifyAgentIdentities(client=make_client())
+        assert tool.name == "batch_verify_agent_identities"
+        assert "verify_agent_identity" in tool.description
+
+    def test_invoke_combines_identity_and_score_per_agent(self):
+        from langchain_nuggets.tools.kya import BatchVerifyAgentIdentities
+
+        client = make_client()
+        tool = BatchVerifyAgentIdentities(client=client)
+
+        def get(path):
+            if path == "/kya/agents/agent-2":
+                raise NuggetsApiClientError("Not found", "API_ERROR", 404)
+            if path.endswith("/trust-score"):
+                return {"score": 0.5}
+            return {"did": "did:nuggets:" + path.rsplit("/", 1)[-1]}
+
+        with patch.object(client, "get", side_effect=get) as mock_get:
+            result = json.loads(tool.invoke({"agentIds": ["agent-1", "agent-2", "agent-1"]}))
+        assert list(result) == ["agent-1", "agent-2"]
+        assert result["agent-1"] == {"identity": {"did": "did:nuggets:agent-1"}, "trustScore": {"score": 0.5}}
+        assert result["agent-2"]["identity"]["code"] == "API_ERROR"
+        assert result["agent-2"]["trustScore"] == {"score": 0.5}
+        assert mock_get.call_count == 4
+
+    def test_invoke_runs_identity_and_score_lookups_together(self):
+        import threading
+        import time
+
+        from langchain_nuggets.tools.kya import BatchVerifyAgentIdentities
+
+        client = make_client()
+        tool = BatchVerifyAgentIdentities(client=client, max_concurrency=4)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def get(path):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return {"score": 0.5} if path.endswith("/trust-score") else {"did": "did:x"}
+
+        with patch.object(client, "get", side_effect=get):
+            result = json.loads(tool.invoke({"agentIds": ["agent-1"]}))
+        assert result == {"agent-1": {"identity": {"did": "did:x"}, "trustScore": {"score": 0.5}}}
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_without_scores(self):
+        from langchain_nuggets.tools.kya import BatchVerifyAgentIdentities
+
+        client = make_client()
+        tool = BatchVerifyAgentIdentities(client=client)
+        with patch.object(client, "aget", new_callable=AsyncMock, return_value={"did": "did:x"}) as mock_aget:
+            result = json.loads(
+                await tool.ainvoke({"agentIds": ["a", "b"], "includeTrustScores": False})
+            )
+        assert result == {"a": {"identity": {"did": "did:x"}}, "b": {"identity": {"did": "did:x"}}}
+        assert mock_aget.await_count == 2
+
+
+class TestBatchGetAgentTrustScores:
+    def test_invoke_uses_trust_cache(self):
+        from langchain_nuggets.tools.kya import BatchGetAgentTrustScores
+        from langchain_nuggets.trust import TrustScoreCache
+
+        client = make_client()
+        cache = TrustScoreCache()
+        cache.put("agent-1", {"score": 0.9})
+        tool = BatchGetAgentTrustScores(client=client, trust_cache=cache)
+        with patch.object(client, "get", return_value={"score": 0.1}) as mock_get:
+            result = json.loads(tool.invoke({"agentIds": ["agent-1", "agent-2"]}))
+        assert result == {"agent-1": {"score": 0.9}, "agent-2": {"score": 0.1}}
+        mock_get.assert_called_once_with("/kya/agents/agent-2/trust-score")
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_bounded_fan_out(self):
+        import asyncio
+
+        from langchain_nuggets.tools.kya import BatchGetAgentTrustScores
+
+        client = make_client()
+        tool = BatchGetAgentTrustScores(client=client, max_concurrency=2)
+        active = peak = 0
+
+        async def aget(path):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"score": 1}
+
+        with patch.object(client, "aget", side_effect=aget):
+            result = json.loads(await tool.ainvoke({"agentIds": [f"a{i}" for i in range(6)]}))
+        assert len(result) == 6
+        assert peak == 2
+
+    def test_concurrent_calls_share_in_flight_lookups(self):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from langchain_nuggets.tools.kya import BatchGetAgentTrustScores, BatchVerifyAgentIdentities
+
+        client = make_client()
+        scores = BatchGetAgentTrustScores(client=client)
+        verify = BatchVerifyAgentIdentities(client=client)
+        calls = []
+        lock = threading.Lock()
+
+        def get(path):
+            with lock:
+                calls.append(path)
+            time.sleep(0.05)
+            return {"score": 0.5} if path.endswith("/trust-score") else {"did": "did:x"}
+
+        with patch.object(client, "get", side_effect=get), ThreadPoolExecutor(3) as pool:
+            runs = [
+                pool.submit(scores.invoke, {"agentIds": ["agent-1"]}),
+                pool.submit(scores.invoke, {"agentIds": ["agent-1"]}),
+                pool.submit(verify.invoke, {"agentIds": ["agent-1"], "includeTrustScores": False}),
+            ]
+            results = [json.loads(run.result()) for run in runs]
+        assert results[0] == results[1] == {"agent-1": {"score": 0.5}}
+        assert results[2]["agent-1"] == {"identity": {"did": "did:x"}}
+        assert sorted(calls) == ["/kya/agents/agent-1", "/kya/agents/agent-1/trust-score"]
+
+    @pytest.mark.asyncio
+    async def test_async_calls_share_in_flight_lookups(self):
+        import asyncio
+
+        from langchain_nuggets.tools.kya import BatchGetAgentTrustScores
+
+        client = make_client()
+        tool = BatchGetAgentTrustScores(client=client)
+
+        async def aget(path):
+            await asyncio.sleep(0.02)
+            if path == "/kya/agents/bad/trust-score":
+                raise NuggetsApiClientError("Not found", "API_ERROR", 404)
+            return {"score": 1}
+
+        with patch.object(client, "aget", side_effect=aget) as mock_aget:
+            results = await asyncio.gather(
+                tool.ainvoke({"agentIds": ["a", "bad"]}),
+                tool.ainvoke({"agentIds": ["bad", "a"]}),
+            )
+        assert mock_aget.call_count == 2
+        assert all(json.loads(r)["bad"]["code"] == "API_ERROR" for r in results)
+
+    def test_rejects_empty_list(self):
+        from langchain_nuggets.tools.kya import BatchGetAgentTrustScores
+
+        tool = BatchGetAgentTrustScores(client=make_client())
+        with pytest.raises(Exception):
+            tool.invoke({"agentIds": []})
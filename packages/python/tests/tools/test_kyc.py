@@ -1,12 +1,12 @@
 import json
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from langchain_nuggets.client.nuggets_api_client import NuggetsApiClient
 from langchain_nuggets.tools.kyc import (
-    InitiateKycVerification,
     CheckKycStatus,
+    InitiateKycVerification,
     VerifyAge,
     VerifyCredential,
 )
@@ -129,3 +129,93 @@ class TestVerifyCredential:
             parsed = json.loads(result)
             assert parsed == mock_session
             mock_post.assert_called_once_with("/kyc/verify-credential", {"userId": "user@example.com", "credentialType": "address"})
+
+
+class TestCheckKycStatusSessionStore:
+    def test_completed_session_not_refetched(self):
+        from langchain_nuggets.sessions import SessionStore
+
+        client = make_client()
+        tool = CheckKycStatus(client=client, session_store=SessionStore())
+        mock_status = {"sessionId": "sess-123", "status": "completed"}
+        with patch.object(client, "get", return_value=mock_status) as mock_get:
+            tool.invoke({"sessionId": "sess-123"})
+            result = tool.invoke({"sessionId": "sess-123"})
+            assert json.loads(result)["status"] == "completed"
+            mock_get.assert_called_once_with("/kyc/sessions/sess-123")
+
+
+class TestSessionReuse:
+    async def test_initiate_kyc_reuses_pending_session(self):
+        from langchain_nuggets.sessions import SessionStore
+
+        client = make_client()
+        tool = InitiateKycVerification(client=client, session_store=SessionStore(reuse_window=300))
+        mock_session = {"sessionId": "sess-123", "deeplink": "nuggets://kyc/sess-123"}
+        with patch.object(client, "apost", new_callable=AsyncMock, return_value=mock_session) as mock_post:
+            await tool.ainvoke({"userId": "user@example.com"})
+            result = json.loads(await tool.ainvoke({"userId": "user@example.com"}))
+            assert result["reused"] is True
+            mock_post.assert_awaited_once_with("/kyc/sessions", {"userId": "user@example.com"})
+
+    def test_verify_age_reuse_keyed_by_minimum_age(self):
+        from langchain_nuggets.sessions import SessionStore
+
+        client = make_client()
+        tool = VerifyAge(client=client, session_store=SessionStore(reuse_window=300))
+        with patch.object(client, "post", side_effect=[{"sessionId": "a"}, {"sessionId": "b"}]) as mock_post:
+            tool.invoke({"userId": "u", "minimumAge": 18})
+            tool.invoke({"userId": "u", "minimumAge": 18})
+            assert json.loads(tool.invoke({"userId": "u", "minimumAge": 21}))["sessionId"] == "b"
+            assert mock_post.call_count == 2
+
+
+class TestCredentialReuse:
+    def test_verified_credential_answered_from_cache(self):
+        from langchain_nuggets.credentials import CredentialCache
+
+        client = make_client()
+        cache = CredentialCache(policy=lambda user, ctype, cred: True)
+        verify = VerifyCredential(client=client, credential_cache=cache)
+        check = CheckKycStatus(client=client, credential_cache=cache)
+        credential = {"id": "vc-1", "type": ["VerifiableCredential", "AddressCredential"], "credentialSubject": {"address": "1 Main St"}}
+        with patch.object(client, "post", return_value={"sessionId": "sess-1", "deeplink": "nuggets://x"}) as mock_post, \
+                patch.object(client, "get", return_value={"sessionId": "sess-1", "status": "completed", "credentials": [credential]}):
+            verify.invoke({"userId": "user@example.com", "credentialType": "address"})
+            check.invoke({"sessionId": "sess-1"})
+            result = json.loads(verify.invoke({"userId": "user@example.com", "credentialType": "address"}))
+            mock_post.assert_called_once()
+        assert result == {"status": "completed", "credentialType": "address", "credentials": [credential], "cached": True}
+
+
+class TestWaitForKycCompletion:
+    def test_name_and_description(self):
+        from langchain_nuggets.tools.kyc import WaitForKycCompletion
+
+        tool = WaitForKycCompletion(client=make_client())
+        assert tool.name == "wait_for_kyc_completion"
+        assert "check_kyc_status" in tool.description
+
+    def test_invoke_waits_for_completion(self):
+        from langchain_nuggets.polling import PollPolicy
+        from langchain_nuggets.tools.kyc import WaitForKycCompletion
+
+        client = make_client()
+        tool = WaitForKycCompletion(client=client, poll_policy=PollPolicy(initial_interval=0, jitter=0))
+        responses = [{"status": "pending"}, {"status": "completed", "sessionId": "sess-123"}]
+        with patch.object(client, "get", side_effect=responses) as mock_get:
+            result = tool.invoke({"sessionId": "sess-123", "timeoutSeconds": 5})
+            assert json.loads(result)["status"] == "completed"
+            assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_waits_for_completion(self):
+        from langchain_nuggets.polling import PollPolicy
+        from langchain_nuggets.tools.kyc import WaitForKycCompletion
+
+        client = make_client()
+        tool = WaitForKycCompletion(client=client, poll_policy=PollPolicy(initial_interval=0, jitter=0))
+        responses = [{"status": "pending"}, {"status": "failed"}]
+        with patch.object(client, "aget", new_callable=AsyncMock, side_effect=responses):
+            result = await tool.ainvoke({"sessionId": "sess-123"})
+            assert json.loads(result)["status"] == "failed"